@@ -0,0 +1,262 @@
+# analytics.py
+"""
+Offline kill/death statistics over finished Game.log files, no GUI and no
+uploads.
+
+    python analytics.py [--out DIR] [--format csv|parquet] LOG_OR_DIR [...]
+
+A directory stands for its Game.log plus everything in its logbackups
+folder, .gz and .zst archives included. Each log file is one session.
+The kill rows are the player's own kills, deaths and suicides, decided by
+the same rules as the live tracker; the player's zone and game-mode
+changes are rows of their own.
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+
+import numpy as np
+
+from headless import make_parser
+from log_archive import log_paths, open_log
+
+KIND_NAMES = ("kill", "death", "suicide", "zone", "mode")
+KIND_CODES = {"killer": 0, "killed": 1, "suicide": 2}
+# kinds below this are kill rows; the rest record the player's zone and game mode
+ZONE, MODE = 3, 4
+# the handlers after which the player's zone or game mode may have changed
+WATCHED_HANDLERS = ("on_context_established", "on_entity_enter_zone", "on_jump_drive")
+# string columns; each is stored as int32 codes into its own table of values
+STRING_COLUMNS = ("player", "opponent", "weapon", "ship", "game_mode", "zone")
+# entity id a weapon name ends with, e.g. KLWE_LaserRepeater_S3_3003
+WEAPON_ID_RX = re.compile(r"_\d+$")
+
+
+def line_time(line: str) -> str:
+    """The <...Z> timestamp a Game.log line starts with, NaT if it has none."""
+    if not line.startswith("<"):
+        return "NaT"
+    return line[1 : line.find(">")].rstrip("Z")
+
+
+class EventCollector:
+    """
+    Takes the place of the API client: everything the parser would upload
+    lands in growing per-column lists, with strings turned into codes. Once
+    watching a parser, its zone and game-mode changes are added as rows too.
+    """
+
+    def __init__(self):
+        self.api_key = {"value": "offline"}
+        # the parser feeding this collector, for state an event does not carry
+        self.parser = None
+        self.session = 0
+        self.sessions = []
+        self.columns = {name: [] for name in ("session", "kind", "time") + STRING_COLUMNS}
+        self.tables = {name: {} for name in STRING_COLUMNS}
+
+    def code(self, column: str, value) -> int:
+        table = self.tables[column]
+        return table.setdefault(value if value is not None else "N/A", len(table))
+
+    def add(self, kind: int, time: str, *values) -> None:
+        """One row; `values` in STRING_COLUMNS order."""
+        c = self.columns
+        c["session"].append(self.session)
+        c["kind"].append(kind)
+        c["time"].append(time)
+        for column, value in zip(STRING_COLUMNS, values):
+            c[column].append(self.code(column, value))
+
+    def post_kill_event(self, event):
+        kind = KIND_CODES[event.result]
+        if kind == 0:
+            player, opponent, ship = event.player, event.victim, event.killers_ship
+        elif kind == 1:
+            player, opponent, ship = event.victim, event.killer, event.victim_ship
+        else:
+            player, opponent, ship = event.player, event.player, "N/A"
+        weapon = WEAPON_ID_RX.sub("", event.weapon) if kind != 2 else "N/A"
+        game_mode = getattr(event, "game_mode", None) or self.parser.game_mode
+        self.add(kind, event.time.rstrip("Z"), player, opponent, weapon, ship, game_mode, event.zone)
+
+    post_death_event = post_kill_event
+
+    def watch(self, parser) -> None:
+        """
+        Feed on `parser`, wrapping the handlers that move the player between
+        zones or game modes so each change also becomes a row.
+        """
+        self.parser = parser
+        for slot, (markers, handler) in enumerate(parser.line_handlers):
+            if handler.__name__ in WATCHED_HANDLERS:
+                parser.line_handlers[slot] = (markers, self.noting_changes(handler))
+
+    def noting_changes(self, handler):
+        parser = self.parser
+
+        def handle(line: str, upload_kills: bool) -> None:
+            game_mode, ship_id = parser.game_mode, parser.active_ship_id
+            handler(line, upload_kills)
+            player = parser.rsi_handle["current"]
+            ship = parser.active_ship["current"]
+            if parser.game_mode != game_mode:
+                self.add(MODE, line_time(line), player, "N/A", "N/A", ship, parser.game_mode, "N/A")
+            if parser.active_ship_id not in (ship_id, "N/A"):
+                zone = f"{ship}_{parser.active_ship_id}"
+                self.add(ZONE, line_time(line), player, "N/A", "N/A", ship, parser.game_mode, zone)
+
+        return handle
+
+
+class KillTable:
+    """
+    Columnar kill/death, zone and game-mode rows: NumPy arrays plus a value
+    table per string column.
+    """
+
+    def __init__(self, collector: EventCollector):
+        c = collector.columns
+        self.sessions = np.array(collector.sessions, dtype=object)
+        self.session = np.array(c["session"], dtype=np.int32)
+        self.kind = np.array(c["kind"], dtype=np.int8)
+        self.time = np.array(c["time"], dtype="datetime64[ms]")
+        self.values = {}
+        self.codes = {}
+        for column in STRING_COLUMNS:
+            table = collector.tables[column]
+            self.values[column] = np.array(list(table), dtype=object)
+            self.codes[column] = np.array(c[column], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def column(self, name):
+        """Decoded values of a string column."""
+        return self.values[name][self.codes[name]]
+
+    def counts_by(self, keys, labels) -> list:
+        """
+        Rows of (*label, kills, deaths, suicides) for every distinct key of
+        the kill rows, counted with one bincount per kind.
+        """
+        kills = self.kind < ZONE
+        kind = self.kind[kills]
+        uniq, inverse = np.unique(keys[kills], return_inverse=True)
+        counts = [
+            np.bincount(inverse[kind == k], minlength=len(uniq)) for k in range(ZONE)
+        ]
+        return [
+            (*labels(key), int(counts[0][i]), int(counts[1][i]), int(counts[2][i]))
+            for i, key in enumerate(uniq)
+        ]
+
+    def by(self, column: str) -> list:
+        values = self.values[column]
+        return self.counts_by(self.codes[column], lambda code: (values[code],))
+
+    def by_day(self) -> list:
+        days = self.time.astype("datetime64[D]")
+        return self.counts_by(days, lambda day: (str(day),))
+
+    def by_session(self) -> list:
+        rows = []
+        for session, kills, deaths, suicides in self.counts_by(self.session, lambda s: (s,)):
+            times = self.time[(self.session == session) & (self.kind < ZONE)]
+            rows.append(
+                (self.sessions[session], str(times.min()), str(times.max()), kills, deaths, suicides)
+            )
+        return rows
+
+    def aggregates(self) -> dict:
+        """Every report: name -> (header, rows)."""
+        counts = ("kills", "deaths", "suicides")
+        return {
+            "sessions": (("log", "first", "last") + counts, self.by_session()),
+            "by_weapon": (("weapon",) + counts, self.by("weapon")),
+            "by_ship": (("ship",) + counts, self.by("ship")),
+            "by_game_mode": (("game_mode",) + counts, self.by("game_mode")),
+            "by_day": (("day",) + counts, self.by_day()),
+        }
+
+    def events(self):
+        """The raw table: (header, rows)."""
+        header = ("log", "time", "kind") + STRING_COLUMNS
+        columns = [
+            self.sessions[self.session],
+            self.time.astype(str),
+            np.array(KIND_NAMES, dtype=object)[self.kind],
+        ] + [self.column(name) for name in STRING_COLUMNS]
+        return header, list(zip(*columns))
+
+
+def extract(paths) -> KillTable:
+    """
+    Run every log through the parser's block scanner with kills enabled, so
+    the same rules as the live tracker decide what counts and how its
+    fields read. One fresh parser per log: each file is its own session.
+    """
+    collector = EventCollector()
+    for path in paths:
+        collector.session = len(collector.sessions)
+        collector.sessions.append(os.path.basename(str(path)))
+        collector.watch(make_parser(collector))
+        with open_log(path) as raw:
+            collector.parser.backfill_stream(raw, upload_kills=True)
+    return KillTable(collector)
+
+
+def write_csv(path, header, rows) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def write_parquet(path, header, rows) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet export needs pyarrow: pip install pyarrow")
+    columns = list(zip(*rows)) if rows else [[] for _ in header]
+    pq.write_table(pa.table({name: list(col) for name, col in zip(header, columns)}), path)
+
+
+def export(table: KillTable, out_dir, fmt="csv") -> list:
+    """Write the raw events and every aggregate to out_dir; returns the files written."""
+    os.makedirs(out_dir, exist_ok=True)
+    write = write_parquet if fmt == "parquet" else write_csv
+    reports = {"events": table.events(), **table.aggregates()}
+    written = []
+    for name, (header, rows) in reports.items():
+        path = os.path.join(out_dir, f"{name}.{fmt}")
+        write(path, header, rows)
+        written.append(path)
+    return written
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("logs", nargs="+", help="Game.log files, or folders holding Game.log and logbackups")
+    ap.add_argument("--out", default="killtracker_stats", help="folder for the exported tables")
+    ap.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    args = ap.parse_args(argv)
+
+    paths = log_paths(args.logs)
+    if not paths:
+        raise SystemExit("No log files found.")
+    table = extract(paths)
+    kinds = np.bincount(table.kind, minlength=len(KIND_NAMES))
+    print(
+        f"{len(paths)} logs: {kinds[0]} kills, {kinds[1]} deaths, {kinds[2]} suicides, "
+        f"{kinds[ZONE]} zone and {kinds[MODE]} game-mode changes"
+    )
+    for path in export(table, args.out, args.format):
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
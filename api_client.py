@@ -1,16 +1,199 @@
-import requests
+import hashlib
+import json
+from threading import Event, Thread
+from time import monotonic, sleep
+
 from config import REPORT_KILL_URL, REPORT_DEATH_URL
+from events import to_json
+from metrics import age_ms, metrics as shared_metrics
+from outbox import OUTBOX_PATH, Outbox
+
+# Backoff between replay attempts while the backend is unreachable.
+RETRY_MIN = 1.0
+RETRY_MAX = 60.0
+# Journaled events sent per replay batch.
+REPLAY_BATCH = 100
+# Seconds between checks for a new key while events wait on a rejected one.
+KEY_POLL = 1.0
+
+
+def event_key(kind: str, payload: str) -> str:
+    """
+    Idempotency key derived from the event itself, so the same kill sent
+    live and again by a logbackups import is stored once by the backend.
+    """
+    return hashlib.blake2b(f"{kind}\n{payload}".encode("utf-8"), digest_size=16).hexdigest()
 
 
 class APIClient:
-    def __init__(self, key_store):
+    """
+    Hands kill/death events to a background sender so the log tail never
+    waits on the network. Every event is journaled in the outbox first and
+    only dropped from it once the backend acknowledges it; anything left
+    over is replayed at startup or as soon as the backend is reachable again.
+    An event refused for its key (401/403) stays journaled and is resent with
+    the key active now, or the next one the user activates; other 4xx
+    refusals are dropped. The sender reuses one keep-alive connection pool.
+    """
+
+    def __init__(
+        self,
+        key_store,
+        logger=None,
+        kill_url=REPORT_KILL_URL,
+        death_url=REPORT_DEATH_URL,
+        outbox_path=OUTBOX_PATH,
+        metrics=None,
+    ):
         self.api_key = key_store
+        self.metrics = shared_metrics if metrics is None else metrics
+        self.log = logger
+        self.urls = {"kill": kill_url, "death": death_url}
+        # opened by the sender thread, so `requests` is imported off the startup path
+        self.session = None
+        self.outbox = Outbox(outbox_path)
+        self.wakeup = Event()
+        self.closing = False
+        # the key the backend last refused; nothing is sent until another is active
+        self.rejected_key = None
+        # replay whatever a previous run left behind
+        self.wakeup.set()
+        self.sender = Thread(target=self.send_loop, daemon=True)
+        self.sender.start()
+
+    def post_kill_event(self, event):
+        self.enqueue("kill", event)
+
+    def post_death_event(self, event):
+        self.enqueue("death", event)
+
+    def enqueue(self, kind: str, event) -> None:
+        """Journal an event (or plain dict) with the key that was active when it happened."""
+        payload = to_json(event)
+        self.outbox.add(kind, self.api_key["value"], payload, event_key(kind, payload))
+        self.wakeup.set()
+
+    def send_loop(self) -> None:
+        """Sender thread: drain the outbox in order, backing off while offline."""
+        self.session = self.open_session()
+        retry = RETRY_MIN
+        delay = None
+        while True:
+            self.wakeup.wait(delay)
+            self.wakeup.clear()
+            try:
+                drained = self.drain()
+            except Exception as e:
+                # e.g. the outbox database is locked; back off like an outage
+                self.report_error(f"Error sending events: {e.__class__.__name__} {e}")
+                drained = False
+            if drained:
+                retry = RETRY_MIN
+                delay = None
+            elif self.rejected_key is not None:
+                # no request is made until the user activates another key
+                delay = KEY_POLL
+            else:
+                delay = retry
+                retry = min(retry * 2, RETRY_MAX)
+            if self.closing:
+                return
+
+    def open_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def drain(self) -> bool:
+        """
+        Send journaled events oldest first. Returns False if the backend could
+        not be reached or refused the key, leaving the rest in the outbox for
+        the next attempt.
+        """
+        import requests
+
+        if self.rejected_key is not None:
+            if self.api_key["value"] in (None, self.rejected_key):
+                return False
+            self.rejected_key = None
+        while True:
+            batch = self.outbox.pending(REPLAY_BATCH)
+            if not batch:
+                return True
+            for event_id, idempotency_key, kind, key, payload in batch:
+                headers = {
+                    "Authorization": f"Bearer {key}",
+                    "Content-Type": "application/json",
+                    # lets the backend drop a replay of an event it already stored
+                    "Idempotency-Key": idempotency_key,
+                }
+                sent_at = monotonic()
+                try:
+                    r = self.session.post(
+                        self.urls[kind], headers=headers, data=payload, timeout=5
+                    )
+                except requests.RequestException as e:
+                    self.metrics.incr("uploads_failed")
+                    self.report_error(f"Error sending event: {e.__class__.__name__} {e}")
+                    return False
+                self.metrics.observe("upload_rtt_ms", (monotonic() - sent_at) * 1000)
+                if r.status_code >= 500 or r.status_code in (408, 429):
+                    self.metrics.incr("uploads_failed")
+                    self.report_error(f"Backend busy ({r.status_code}), will retry.")
+                    return False
+                if r.status_code in (401, 403):
+                    current = self.api_key["value"]
+                    if current and current != key:
+                        # journaled under a key that has expired since; try the active one
+                        self.outbox.rekey(event_id, current)
+                        break
+                    self.rejected_key = key
+                    self.metrics.incr("uploads_failed")
+                    self.report_error(
+                        f"Key rejected by backend ({r.status_code}); events are kept until a new key is activated."
+                    )
+                    return False
+                if r.ok:
+                    self.metrics.incr("uploads_ok")
+                    self.record_latency(payload)
+                else:
+                    # the backend refused it outright; resending will not help
+                    self.metrics.incr("uploads_rejected")
+                    self.report_error(f"Event rejected by backend ({r.status_code}).")
+                self.outbox.done(event_id)
+
+    def record_latency(self, payload: str) -> None:
+        """Time from the event's Game.log timestamp to the backend's acknowledgement."""
+        try:
+            self.metrics.observe("upload_latency_ms", age_ms(json.loads(payload)["time"]))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def report_error(self, message: str) -> None:
+        if self.log is not None:
+            self.log.error(message)
+        else:
+            print(message)
 
-    def post_kill_event(self, kill_result):
-        data = kill_result["data"]
-        headers = {"Authorization": f"Bearer {self.api_key['value']}"}
-        requests.post(REPORT_KILL_URL, headers=headers, json=data, timeout=5)
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until the outbox is empty; False if it still is not after `timeout`."""
+        deadline = monotonic() + timeout
+        while self.outbox.count():
+            if monotonic() > deadline:
+                return False
+            sleep(0.01)
+        return True
 
-    def post_death_event(self, payload):
-        headers = {"Authorization": f"Bearer {self.api_key['value']}"}
-        requests.post(REPORT_DEATH_URL, headers=headers, json=payload, timeout=5)
+    def close(self) -> None:
+        """Make a last delivery attempt, then stop; unsent events stay journaled."""
+        self.closing = True
+        self.wakeup.set()
+        self.sender.join()
+        if self.session is not None:
+            self.session.close()
+        self.outbox.close()
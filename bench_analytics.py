@@ -0,0 +1,69 @@
+# bench_analytics.py
+"""
+Offline analytics over a pile of session logs: analytics.extract (block
+scanner, columnar aggregation) vs replaying every line through
+read_log_line, the only way to get at kills before.
+
+    python bench_analytics.py [logs] [mb_per_log]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import analytics
+from headless import make_parser
+from bench_log_parser import build_log
+
+
+def write_logs(folder: str, count: int, size_mb: int) -> list:
+    piece = build_log(50_000).encode("utf-8")
+    repeats = max(1, size_mb * 1024 * 1024 // len(piece))
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"Game Build({i}).log")
+        with open(path, "wb") as f:
+            for _ in range(repeats):
+                f.write(piece)
+        paths.append(path)
+    return paths
+
+
+def line_by_line(path: str) -> int:
+    collector = analytics.EventCollector()
+    collector.sessions.append(path)
+    parser = collector.parser = make_parser(collector)
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            parser.read_log_line(line, True)
+    return len(collector.columns["kind"])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    size_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    folder = tempfile.mkdtemp(prefix="bench_analytics_")
+    try:
+        paths = write_logs(folder, count, size_mb)
+        total_mb = sum(os.path.getsize(p) for p in paths) / 1024 / 1024
+
+        start = time.perf_counter()
+        table = analytics.extract(paths)
+        table.aggregates()
+        elapsed = time.perf_counter() - start
+        print(f"analytics.extract + aggregates: {total_mb:,.0f} MB in {elapsed:.2f}s "
+              f"({total_mb / elapsed:,.0f} MB/s), {len(table):,} events")
+
+        start = time.perf_counter()
+        events = line_by_line(paths[0])
+        elapsed = time.perf_counter() - start
+        one_mb = os.path.getsize(paths[0]) / 1024 / 1024
+        print(f"read_log_line replay, one log:  {one_mb:,.0f} MB in {elapsed:.2f}s "
+              f"({one_mb / elapsed:,.0f} MB/s), {events:,} events")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# bench_backfill.py
+"""
+Startup backfill of an existing Game.log: wall time and peak RSS.
+`resume` is a restart onto the same, unchanged log with a checkpoint on disk.
+
+    python bench_backfill.py [size_mb] [path]
+
+Each mode runs in its own interpreter so peak RSS is measured in isolation.
+Uses the `resource` module, so run it on Linux/macOS.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_log_parser import build_log
+from test_log_parser import legacy_read_log_line, make_parser
+
+
+def write_log(path: str, size_mb: int) -> None:
+    """Write a synthetic log of about size_mb megabytes, a slice at a time."""
+    piece = build_log(50_000).encode("utf-8")
+    with open(path, "wb") as f:
+        written = 0
+        while written < size_mb * 1024 * 1024:
+            f.write(piece)
+            written += len(piece)
+
+
+def run_mode(mode: str, path: str) -> None:
+    import resource
+
+    parser = make_parser()
+    parser.log_file_location = path
+    if mode == "resume":
+        parser.checkpoint_path = f"{path}.checkpoint.json"
+        with open(path, "rb") as sc_log:
+            parser.load_log(sc_log)
+        parser = make_parser()
+        parser.log_file_location = path
+        parser.checkpoint_path = f"{path}.checkpoint.json"
+    start = time.perf_counter()
+    if mode == "readlines":
+        with open(path, "r", encoding="utf-8", errors="replace") as sc_log:
+            for line in sc_log.readlines():
+                legacy_read_log_line(parser, line, False)
+    elif mode == "stream":
+        parser.backfill_log(path)
+    else:
+        with open(path, "rb") as sc_log:
+            parser.load_log(sc_log)
+        os.remove(parser.checkpoint_path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{mode:<10} {elapsed:8.3f}s  peak RSS {peak_kb / 1024:8.1f} MB")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], sys.argv[3])
+        return
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    path = sys.argv[2] if len(sys.argv) > 2 else None
+    tmp = None
+    if path is None or not os.path.exists(path):
+        tmp = path or os.path.join(tempfile.gettempdir(), f"bench_game_{size_mb}mb.log")
+        write_log(tmp, size_mb)
+        path = tmp
+    print(f"{path}: {os.path.getsize(path) / 1024 / 1024:.0f} MB")
+    try:
+        for mode in ("readlines", "stream", "resume"):
+            subprocess.run([sys.executable, __file__, "--mode", mode, path], check=True)
+    finally:
+        if tmp and len(sys.argv) <= 2:
+            os.remove(tmp)
+
+
+if __name__ == "__main__":
+    main()
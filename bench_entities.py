@@ -0,0 +1,82 @@
+# bench_entities.py
+"""
+GEID -> ship registry over a long PU session: manufacturer lookup, the
+cost per recorded entity, and memory held, against an unbounded dict.
+
+    python bench_entities.py [entities]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from entities import SHIP_MANUFACTURERS, EntityRegistry, ship_code
+from log_gen import LOCATIONS, SHIPS
+
+SHIP_LIST = sorted(SHIP_MANUFACTURERS)
+
+
+def startswith_loop(zone):
+    for ship in SHIP_LIST:
+        if zone.startswith(ship):
+            return zone.rsplit("_", 1)
+    return None
+
+
+def timed(label, fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed / len(items) * 1e9:7.0f} ns/op")
+
+
+def held(build):
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(20)
+    # entities keep coming; the recent ones are the ones kills refer back to
+    names = [f"{rng.choice(SHIPS)}_{n}" for n in range(count)]
+    zones = [rng.choice(names) if rng.random() < 0.5 else rng.choice(LOCATIONS) for _ in range(100_000)]
+    print(f"{count:,} entities")
+    timed("startswith loop", startswith_loop, zones)
+    timed("ship_code (set lookup)", ship_code, zones)
+
+    registry = EntityRegistry()
+    timed("EntityRegistry.note_name", registry.note_name, names)
+    unbounded = {}
+
+    def note_unbounded(name):
+        ship, _, geid = name.rpartition("_")
+        unbounded[geid] = ship
+
+    timed("unbounded dict", note_unbounded, names)
+
+    def fill_registry():
+        r = EntityRegistry()
+        for name in names:
+            r.note_name(name)
+        return r
+
+    def fill_dict():
+        d = {}
+        for name in names:
+            ship, _, geid = name.rpartition("_")
+            d[geid] = ship
+        return d
+
+    r, r_size = held(fill_registry)
+    d, d_size = held(fill_dict)
+    print(f"registry: {len(r):,} entries, {r_size / 1024 / 1024:6.1f} MiB")
+    print(f"dict:     {len(d):,} entries, {d_size / 1024 / 1024:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
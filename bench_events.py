@@ -0,0 +1,62 @@
+# bench_events.py
+"""
+Cost of a parsed kill: the old nested result dicts vs the slotted event
+records. Reports parse time, memory blocks kept alive per event, and the
+memory held by a session history of that many events.
+
+    python bench_events.py [events]
+"""
+import sys
+import time
+import tracemalloc
+
+from test_kill_line import legacy_parse_kill_line
+from test_log_parser import HANDLE, RECORDED_LOG, make_parser
+
+KILL_LINE = [l for l in RECORDED_LOG.splitlines(keepends=True) if "<Actor Death>" in l][0]
+
+
+def session_lines(count):
+    # distinct victims and timestamps, like a real session
+    return [
+        KILL_LINE.replace("Enemy_One", f"Enemy_{i}").replace("18:00:06.000", f"18:{i % 60:02d}:{i % 59:02d}.{i % 1000:03d}")
+        for i in range(count)
+    ]
+
+
+def measure(label, parse, lines):
+    start = time.perf_counter()
+    for line in lines:
+        parse(line)
+    elapsed = time.perf_counter() - start
+
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    history = [parse(line) for line in lines]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    kept = sys.getallocatedblocks() - blocks
+    print(
+        f"{label:<22} {elapsed / len(lines) * 1e6:6.2f} us/event  "
+        f"{kept / len(lines):5.1f} blocks/event  "
+        f"{held / 1024 / 1024:6.1f} MiB for {len(history):,} events"
+    )
+    return history
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parser = make_parser()
+    parser.game_mode = "SC_Default"
+    lines = session_lines(count)
+    measure("nested result dicts", lambda l: legacy_parse_kill_line(parser, l, HANDLE), lines)
+    measure("slotted event records", lambda l: parser.parse_kill_line(l, HANDLE), lines)
+    events = [parser.parse_kill_line(l, HANDLE) for l in lines[:10_000]]
+    start = time.perf_counter()
+    for event in events:
+        event.to_json()
+    print(f"to_json at upload:     {(time.perf_counter() - start) / len(events) * 1e6:6.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
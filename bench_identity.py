@@ -0,0 +1,77 @@
+# bench_identity.py
+"""
+Time until the player's RSI handle and GEID are known, for one launch plus
+one Activate click (four lookups before, two now).
+
+    python bench_identity.py [size_mb] [login_at_fraction]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from bench_log_parser import build_log
+from identity import find_identity
+from test_log_parser import RECORDED_LOG
+
+LOGIN_LINE, CHARACTER_LINE = RECORDED_LOG.splitlines(keepends=True)[:2]
+
+
+def legacy_find_rsi_handle(log_file_location):
+    acct_str = "<Legacy login response> [CIG-net] User Login Success"
+    with open(log_file_location, "r", encoding="utf-8", errors="replace") as sc_log:
+        for line in sc_log:
+            if acct_str in line:
+                idx = line.index("Handle[") + len("Handle[")
+                return line[idx:].split(" ")[0].rstrip("]")
+    return None
+
+
+def legacy_find_rsi_geid(log_file_location):
+    acct_kw = "AccountLoginCharacterStatus_Character"
+    with open(log_file_location, "r", encoding="utf-8", errors="replace") as sc_log:
+        for line in sc_log:
+            if acct_kw in line:
+                return line.split(" ")[11]
+    return None
+
+
+def write_log(path: str, size_mb: int, login_at: float) -> None:
+    piece = build_log(50_000).replace(LOGIN_LINE, "").replace(CHARACTER_LINE, "")
+    piece = piece.encode("utf-8")
+    pieces = max(1, size_mb * 1024 * 1024 // len(piece))
+    with open(path, "wb") as f:
+        for i in range(pieces):
+            if i == int(pieces * login_at):
+                f.write((LOGIN_LINE + CHARACTER_LINE).encode("utf-8"))
+            f.write(piece)
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<34} {time.perf_counter() - start:8.3f}s  {result}")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    login_at = float(sys.argv[2]) if len(sys.argv) > 2 else 0.25
+    path = os.path.join(tempfile.gettempdir(), "bench_identity_game.log")
+    write_log(path, size_mb, login_at)
+    try:
+        print(f"{os.path.getsize(path) / 1024 / 1024:.0f} MB, login at {login_at:.0%}")
+        timed(
+            "legacy: launch + Activate (4 scans)",
+            lambda: [
+                (legacy_find_rsi_handle(path), legacy_find_rsi_geid(path))
+                for _ in range(2)
+            ][-1],
+        )
+        timed("find_identity: first lookup", lambda: find_identity(path))
+        timed("find_identity: cached lookup", lambda: find_identity(path))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
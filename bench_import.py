@@ -0,0 +1,46 @@
+# bench_import.py
+"""
+Backup import throughput: a folder of generated session logs, parsed
+serially and with 2..N worker processes.
+
+    python bench_import.py [logs] [sessions_per_log]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from import_backups import collect
+from log_archive import log_paths
+from test_log_parser import RECORDED_LOG
+
+
+def write_backups(folder, logs, repeat):
+    backups = os.path.join(folder, "logbackups")
+    os.makedirs(backups)
+    for n in range(logs):
+        day = f"2025-{1 + n // 28:02d}-{1 + n % 28:02d}"
+        with open(os.path.join(backups, f"Game Build({n}).log"), "w", encoding="utf-8") as f:
+            f.write(RECORDED_LOG.replace("2025-05-01", day) * repeat)
+
+
+def main():
+    logs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as folder:
+        write_backups(folder, logs, repeat)
+        paths = log_paths([folder], include_current=False)
+        size = sum(os.path.getsize(p) for p in paths)
+        print(f"{logs} logs, {size / 1e6:.1f} MB, {cores} cores")
+        if cores == 1:
+            print("one core: the pool can only add overhead here; scaling needs a multi-core run")
+        for workers in sorted({1, 2, cores}):
+            start = time.perf_counter()
+            events = collect(paths, workers)
+            elapsed = time.perf_counter() - start
+            print(f"workers={workers:<3} {elapsed:6.2f} s  {size / elapsed / 1e6:6.1f} MB/s  {len(events)} events")
+
+
+if __name__ == "__main__":
+    main()
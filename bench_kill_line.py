@@ -0,0 +1,42 @@
+# bench_kill_line.py
+"""
+parse_kill_line: the split-on-spaces parse with a lowercased line per
+ignore entry vs the compiled extractor with cached NPC verdicts.
+
+    python bench_kill_line.py [lines]
+"""
+import sys
+import time
+
+from kill_line import is_ignored
+from log_gen import LogGenerator
+from test_kill_line import legacy_parse_kill_line
+from test_log_parser import HANDLE, make_parser
+
+
+def run(label, parse, lines):
+    start = time.perf_counter()
+    for line in lines:
+        parse(line)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed / len(lines) * 1e6:6.2f} us/line  {len(lines) / elapsed:>11,.0f} lines/s")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    # a PU session: mostly NPC kills, some player kills and deaths
+    gen = LogGenerator(seed=8, mix={"npc_kill": 6, "player_kill": 3, "death": 1})
+    lines = list(gen.lines(count + 2))[2:]
+    parser = make_parser()
+    parser.game_mode = "SC_Default"
+    print(f"{len(lines):,} kill lines")
+    legacy = run("split + lowercase scans", lambda l: legacy_parse_kill_line(parser, l, HANDLE), lines)
+    is_ignored.cache_clear()
+    compiled = run("compiled + cached verdicts", lambda l: parser.parse_kill_line(l, HANDLE), lines)
+    info = is_ignored.cache_info()
+    print(f"speedup {legacy / compiled:.2f}x, verdict cache {info.hits / (info.hits + info.misses):.0%} hits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# bench_line_pipeline.py
+"""
+CPU and memory of getting a realistic Game.log through the parser:
+
+- text:     safe_open in text mode, every line decoded, read_log_line per line
+- backfill: LogParser.backfill_log, raw bytes, only marker lines decoded
+- tail:     LogParser.follow_log from the start of the file, as the live tail
+
+    python bench_line_pipeline.py [lines] [path]
+
+The log is log_gen's default mix plus a few multi-megabyte dump lines.
+Each mode runs in its own interpreter, twice: once for CPU time and peak
+RSS, once under tracemalloc for the peak of Python allocations.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from headless import EventSink, make_parser
+from log_gen import DEFAULT_MIX, write_log
+from log_parser import safe_open
+from test_log_parser import DrainWatcher
+
+MODES = ("text", "backfill", "tail")
+# about one dump line per 20,000 lines
+MIX = dict(DEFAULT_MIX, dump=0.05)
+
+
+def run_mode(mode: str, path: str, traced: bool) -> None:
+    import resource
+    import tracemalloc
+
+    sink = EventSink()
+    parser = make_parser(sink)
+    parser.log_file_location = path
+    if traced:
+        tracemalloc.start()
+    cpu = time.process_time()
+    if mode == "text":
+        with safe_open(path) as f:
+            for line in f:
+                parser.read_log_line(line, True)
+    elif mode == "backfill":
+        parser.backfill_log(path, upload_kills=True)
+    else:
+        parser.monitoring["active"] = True
+        parser.follow_log(open(path, "rb"), DrainWatcher(parser))
+    cpu = time.process_time() - cpu
+    if traced:
+        print(f"{mode:<9} traced peak {tracemalloc.get_traced_memory()[1] / 1024 / 1024:8.1f} MB")
+        return
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{mode:<9} {cpu:7.3f} s CPU  peak RSS {peak_kb / 1024:7.1f} MB  {len(sink.events)} events")
+
+
+def main():
+    if sys.argv[1:2] == ["--mode"]:
+        run_mode(sys.argv[2], sys.argv[3], sys.argv[4] == "traced")
+        return
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as folder:
+        path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(folder, "Game.log")
+        if len(sys.argv) <= 2:
+            write_log(path, lines, seed=25, mix=MIX)
+        print(f"{os.path.getsize(path) / 1024 / 1024:.1f} MB log")
+        for traced in ("plain", "traced"):
+            for mode in MODES:
+                subprocess.run([sys.executable, __file__, "--mode", mode, path, traced], check=True)
+
+
+if __name__ == "__main__":
+    main()
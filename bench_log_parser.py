@@ -0,0 +1,64 @@
+# bench_log_parser.py
+"""
+Lines-per-second for the LogParser dispatch paths.
+
+    python bench_log_parser.py [total_lines]
+"""
+import random
+import sys
+import time
+
+from test_log_parser import RECORDED_LOG, legacy_read_log_line, make_parser
+
+NOISE = [
+    "<2025-05-01T18:00:00.000Z> [Notice] <CSCLoadingPlatformManager::OnLoadingPlatformStateChanged> [Loading Platform] Loading Platform Manager [LoadingPlatformManager_ShipElevator_HangarXLTop] State Changed [Closed] -> [OpeningLoadingGate] [Team_ArenaCommander][Spawning]\n",
+    "<2025-05-01T18:00:00.000Z> [Notice] <CEntity::OnOwnerChanged> Entity 'ItemPort_Weapon_Left' [201234567890] owner changed from 0 to 200146295176 [Team_CoreTech][Entity]\n",
+    "<2025-05-01T18:00:00.000Z> [Notice] <SHUDEvent_OnNotification> Added notification \"Entered Monitored Space: \" [12] to queue. New queue size: 1, MissionId: [00000000-0000-0000-0000-000000000000], ObjectiveId: [] [Team_CoreGameplayFeatures][Missions][Comms]\n",
+    "<2025-05-01T18:00:00.000Z> [Notice] <StatObjLoad 0x800 Format> 'objects/spaceships/ships/aegs/gladius/exterior/aegs_gladius_body.cgf' Streaming took 12.2 ms [Team_Engine][Streaming]\n",
+]
+
+
+def build_log(total_lines: int, seed: int = 7) -> str:
+    """Mostly noise, with the recorded session's marker lines sprinkled in (~1%)."""
+    rng = random.Random(seed)
+    events = RECORDED_LOG.splitlines(keepends=True)
+    out = []
+    for i in range(total_lines):
+        if rng.random() < 0.01:
+            out.append(events[i % len(events)])
+        else:
+            out.append(rng.choice(NOISE))
+    return "".join(out)
+
+
+def run(label, fn, lines):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {lines / elapsed:>14,.0f} lines/s  ({elapsed:.3f}s)")
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    text = build_log(total)
+    lines = text.splitlines(keepends=True)
+    for upload_kills in (False, True):
+        print(f"-- upload_kills={upload_kills}, {total:,} lines")
+        legacy = make_parser()
+        run(
+            "legacy substring chain",
+            lambda: [legacy_read_log_line(legacy, l, upload_kills) for l in lines],
+            total,
+        )
+        single = make_parser()
+        run(
+            "read_log_line",
+            lambda: [single.read_log_line(l, upload_kills) for l in lines],
+            total,
+        )
+        block = make_parser()
+        run("read_log_block", lambda: block.read_log_block(text, upload_kills), total)
+
+
+if __name__ == "__main__":
+    main()
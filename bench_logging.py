@@ -0,0 +1,54 @@
+# bench_logging.py
+"""
+Cost of the per-line debug calls on the hot path when debug output is off:
+an f-string built and handed to the logger (before) vs a level check with
+lazy arguments (now), plus a burst of identical errors collapsed to one.
+
+    python bench_logging.py [calls]
+"""
+import sys
+import timeit
+
+from event_logger import INFO, EventLogger
+
+
+class NullTextbox:
+    def after(self, ms, fn):
+        pass
+
+
+class LegacyLogger:
+    """The old sink: every call formats and queues, whatever the level."""
+
+    def __init__(self):
+        self.pending = []
+
+    def debug(self, m):
+        self.pending.append(f"[DEBUG] {m}")
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    zone = "OOC_Stanton_1b_Aberdeen"
+    line = "<2025-05-01T18:00:00.000Z> [Notice] <CEntity::OnOwnerChanged> noise\n"
+    legacy = LegacyLogger()
+    logger = EventLogger(NullTextbox(), level=INFO)
+
+    before = timeit.timeit(
+        lambda: legacy.debug(f"on_entity_enter_zone(): zone={zone} line={line!r}"), number=calls
+    )
+    after = timeit.timeit(
+        lambda: logger.debug("on_entity_enter_zone(): zone=%s line=%r", zone, line), number=calls
+    )
+    print(f"debug off, f-string:     {before / calls * 1e9:7.1f} ns/call")
+    print(f"debug off, lazy args:    {after / calls * 1e9:7.1f} ns/call  ({before / after:.1f}x)")
+
+    errors = timeit.timeit(
+        lambda: logger.error("parse_kill_line(): Error: %s", "list index out of range"),
+        number=calls,
+    )
+    print(f"repeated error:          {errors / calls * 1e9:7.1f} ns/call, {len(logger.pending)} line(s) queued")
+
+
+if __name__ == "__main__":
+    main()
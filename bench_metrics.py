@@ -0,0 +1,47 @@
+# bench_metrics.py
+"""
+Cost of the stats counters on the parse path: backfill throughput of a
+generated log with metrics recording vs switched off, plus the newline
+count the live tail adds to get its lines/s.
+
+    python bench_metrics.py [lines] [repeats]
+"""
+import io
+import statistics
+import sys
+import time
+
+from log_gen import generate
+from metrics import Metrics, NullMetrics
+from test_log_parser import make_parser
+
+
+def throughput(data: bytes, metrics) -> float:
+    parser = make_parser()
+    parser.metrics = metrics
+    start = time.perf_counter()
+    parser.backfill_stream(io.BytesIO(data), upload_kills=True, chunk_size=64 * 1024)
+    return len(data) / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    data = generate(lines, seed=4).encode("utf-8")
+    off, on = [], []
+    # interleaved, so drift on the machine hits both alike
+    for _ in range(repeats):
+        off.append(throughput(data, NullMetrics()))
+        on.append(throughput(data, Metrics()))
+    off_mbs, on_mbs = statistics.median(off), statistics.median(on)
+    print(f"{lines:,} lines, {len(data) / 1e6:.1f} MB, median of {repeats}")
+    print(f"metrics off  {off_mbs:7.1f} MB/s")
+    print(f"metrics on   {on_mbs:7.1f} MB/s  ({(off_mbs - on_mbs) / off_mbs * 100:+.1f}% cost)")
+    start = time.perf_counter()
+    data.count(b"\n")
+    count_mbs = len(data) / (time.perf_counter() - start) / 1e6
+    print(f"line count   {count_mbs:7.1f} MB/s  ({on_mbs / count_mbs * 100:+.1f}% on the live tail)")
+
+
+if __name__ == "__main__":
+    main()
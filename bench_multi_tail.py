@@ -0,0 +1,100 @@
+# bench_multi_tail.py
+"""
+CPU cost of tailing several Game.logs: one MultiTail thread against one
+LogParser thread per log, per watcher backend.
+
+    python bench_multi_tail.py [seconds]
+
+A separate writer process appends to the first log at a steady rate, as
+the channel being played would; the other logs stay idle, as installed
+channels that are not running do. CPU time of this process is sampled
+over the run, so the writer's own cost is not counted.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from headless import EventSink, NullLog, make_parser
+from log_gen import LogGenerator
+from multi_tail import MultiTail
+
+COUNTS = (1, 2, 4, 8, 16)
+# lines per second written to the active log
+WRITE_RATE = 200
+
+
+def write_lines(path: str, seconds: float) -> None:
+    gen = LogGenerator(24)
+    batch = WRITE_RATE // 20
+    deadline = time.monotonic() + seconds
+    with open(path, "a", encoding="utf-8") as f:
+        while time.monotonic() < deadline:
+            f.writelines(gen.lines(batch))
+            f.flush()
+            time.sleep(0.05)
+
+
+def make_logs(folder: str, count: int) -> list:
+    paths = []
+    for n in range(count):
+        path = os.path.join(folder, f"channel{n}", "Game.log")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(LogGenerator(n).lines(2000))
+        paths.append(path)
+    return paths
+
+
+def threads_per_log(paths, backend):
+    sink = EventSink()
+    parsers = []
+    for path in paths:
+        parser = make_parser(sink)
+        parser.log_file_location = path
+        parser.watch_backend = backend
+        parser.start_tail_log_thread()
+        parsers.append(parser)
+    return lambda: [parser.stop_tail_log_thread(timeout=5) for parser in parsers]
+
+
+def one_thread(paths, backend):
+    tails = MultiTail(EventSink(), NullLog(), watch_backend=backend)
+    for path in paths:
+        tails.add(path).checkpoint_path = None
+    return lambda: tails.stop(timeout=5)
+
+
+def cpu_ms_per_s(start_tailing, count: int, backend: str, seconds: float) -> float:
+    with tempfile.TemporaryDirectory() as folder:
+        paths = make_logs(folder, count)
+        stop = start_tailing(paths, backend)
+        # let every tail catch up with its existing log first
+        time.sleep(1.5)
+        writer = subprocess.Popen([sys.executable, __file__, "--write", paths[0], str(seconds)])
+        cpu, wall = time.process_time(), time.monotonic()
+        writer.wait()
+        cpu, wall = time.process_time() - cpu, time.monotonic() - wall
+        stop()
+    return cpu / wall * 1000
+
+
+def main():
+    if sys.argv[1:2] == ["--write"]:
+        write_lines(sys.argv[2], float(sys.argv[3]))
+        return
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    backends = ["poll", "inotify"] if sys.platform.startswith("linux") else ["poll"]
+    print(f"CPU ms per second, one log written at {WRITE_RATE} lines/s, the rest idle")
+    print(f"{'logs':>4}  " + "  ".join(f"{b + ' threads':>14}  {b + ' multi':>12}" for b in backends))
+    for count in COUNTS:
+        row = []
+        for backend in backends:
+            row.append(f"{cpu_ms_per_s(threads_per_log, count, backend, seconds):14.1f}")
+            row.append(f"{cpu_ms_per_s(one_thread, count, backend, seconds):12.1f}")
+        print(f"{count:>4}  " + "  ".join(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# bench_parser.py
+"""
+pytest-benchmark suite for the parser paths, fed by log_gen's seeded logs.
+
+    python -m pytest bench_parser.py --benchmark-only [--benchmark-autosave]
+    python -m pytest bench_parser.py --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Whole-log passes put lines/s in extra_info; single-line benches are the
+per-event latency. Every bench also records the peak traced memory of one
+run (`peak_kib`), which --benchmark-json keeps for comparison.
+"""
+import importlib.util
+import os
+import sys
+import tracemalloc
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from log_gen import LogGenerator, generate
+from test_log_parser import HANDLE, DrainWatcher, legacy_read_log_line, make_parser, FakeLogger
+
+LINES = 20_000
+ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def log_text():
+    return generate(LINES, seed=11)
+
+
+@pytest.fixture(scope="module")
+def log_lines(log_text):
+    return log_text.splitlines(keepends=True)
+
+
+@pytest.fixture(scope="module")
+def log_file(tmp_path_factory, log_text):
+    path = tmp_path_factory.mktemp("bench") / "Game.log"
+    path.write_text(log_text, encoding="utf-8", newline="\n")
+    return path
+
+
+def sample(kind: str) -> str:
+    gen = LogGenerator(seed=3, mix={kind: 1})
+    return list(gen.lines(3))[-1]
+
+
+def record_memory(benchmark, fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_kib"] = round(peak / 1024, 1)
+
+
+def bench_pass(benchmark, fn, lines: int):
+    """Time fn(parser) on a fresh parser each round; lines/s goes to extra_info."""
+    benchmark.pedantic(fn, setup=lambda: ((make_parser(),), {}), rounds=ROUNDS)
+    if benchmark.stats:  # None under --benchmark-disable
+        benchmark.extra_info["lines_per_s"] = round(lines / benchmark.stats.stats.mean)
+    record_memory(benchmark, fn, make_parser())
+
+
+def load_regex_parser():
+    """2ndmain.py's LogParser, with its HTTP calls answered locally."""
+    if importlib.util.find_spec("config") is None:
+        spec = importlib.util.spec_from_file_location("config", "config.example.py")
+        sys.modules["config"] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sys.modules["config"])
+    # the file opens with a stray "2ndmain.py" line, so it cannot be imported as is
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "2ndmain.py")
+    with open(path, encoding="utf-8") as f:
+        source = f.read().split("\n", 1)[1]
+    module = ModuleType("secondmain")
+    exec(compile(source, path, "exec"), module.__dict__)
+    ok = SimpleNamespace(status_code=200)
+    module.requests = SimpleNamespace(post=lambda *args, **kwargs: ok)
+    return module.LogParser
+
+
+@pytest.mark.parametrize("upload_kills", [False, True])
+def test_read_log_line(benchmark, log_lines, upload_kills):
+    def run(parser):
+        for line in log_lines:
+            parser.read_log_line(line, upload_kills)
+
+    bench_pass(benchmark, run, len(log_lines))
+
+
+def test_legacy_substring_chain(benchmark, log_lines):
+    def run(parser):
+        for line in log_lines:
+            legacy_read_log_line(parser, line, True)
+
+    bench_pass(benchmark, run, len(log_lines))
+
+
+def test_read_log_block(benchmark, log_text, log_lines):
+    bench_pass(benchmark, lambda parser: parser.read_log_block(log_text, True), len(log_lines))
+
+
+def test_regex_parser_2ndmain(benchmark, log_lines):
+    pytest.importorskip("psutil")
+    pytest.importorskip("requests")
+    pytest.importorskip("tkinter")
+    regex_parser = load_regex_parser()
+    geid = make_parser().player_geid["current"]
+
+    def run(_):
+        parser = regex_parser({"value": "key"}, {"current": geid}, FakeLogger())
+        for line in log_lines:
+            parser.read_line(line)
+
+    bench_pass(benchmark, run, len(log_lines))
+
+
+def test_backfill_from_disk(benchmark, log_file, log_lines):
+    bench_pass(benchmark, lambda parser: parser.backfill_log(log_file, upload_kills=True), len(log_lines))
+
+
+def test_follow_log(benchmark, log_file, log_lines):
+    def run(parser):
+        parser.log_file_location = log_file
+        parser.follow_log(open(log_file, "rb"), DrainWatcher(parser))
+
+    bench_pass(benchmark, run, len(log_lines))
+
+
+@pytest.mark.parametrize("kind", ["player_kill", "npc_kill", "death"])
+def test_parse_kill_line(benchmark, kind):
+    parser = make_parser()
+    parser.game_mode = "SC_Default"
+    line = sample(kind)
+    benchmark(parser.parse_kill_line, line, HANDLE)
+    record_memory(benchmark, parser.parse_kill_line, line, HANDLE)
+
+
+@pytest.mark.parametrize("kind, use_jd", [("zone", False), ("jump", True)])
+def test_set_player_zone(benchmark, kind, use_jd):
+    parser = make_parser()
+    line = sample(kind)
+    benchmark(parser.set_player_zone, line, use_jd)
+    record_memory(benchmark, parser.set_player_zone, line, use_jd)
+
+
+def test_dispatch_noise_line(benchmark):
+    parser = make_parser()
+    line = sample("noise")
+    benchmark(parser.read_log_line, line, True)
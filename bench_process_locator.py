@@ -0,0 +1,42 @@
+# bench_process_locator.py
+"""
+Cost of the game/launcher lookups done at startup and on each Activate
+click: the old full walk reading every process's exe vs ProcessLocator.
+
+    python bench_process_locator.py [process_name]
+"""
+import sys
+import time
+
+import psutil
+
+from process_locator import ProcessLocator
+
+
+def legacy_check_if_process_running(process_name):
+    for proc in psutil.process_iter(["pid", "name", "exe"]):
+        if process_name.lower() in proc.info["name"].lower():
+            return proc.info["exe"]
+    return None
+
+
+def timed(label, fn, rounds=20):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    print(f"{label:<28} {(time.perf_counter() - start) / rounds * 1000:8.3f} ms  {result}")
+
+
+def main():
+    # something that is surely running, standing in for StarCitizen
+    name = sys.argv[1] if len(sys.argv) > 1 else psutil.Process().name()
+    print(f"{len(psutil.pids())} processes, looking for {name!r}")
+    timed("legacy walk (name + exe)", lambda: legacy_check_if_process_running(name))
+    locator = ProcessLocator()
+    timed("locator: first lookup", lambda: locator.find(name), rounds=1)
+    timed("locator: cached lookup", lambda: locator.find(name))
+    timed("locator: not running", lambda: locator.find("NoSuchGame"))
+
+
+if __name__ == "__main__":
+    main()
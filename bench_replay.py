@@ -0,0 +1,208 @@
+# bench_replay.py
+"""
+End-to-end load run: a Game.log is replayed into a temp file at a chosen
+speed while the real tail thread and APIClient upload to a local stub
+backend. Reports replay throughput, backend request rate, tail lag and
+the latency from each event's log timestamp to its acknowledgement.
+
+    python bench_replay.py [--players 40] [--speed 1] [--log GAME_LOG]
+                           [--latency S] [--error-rate P] [--rate-limit N]
+                           [--drain-timeout S]
+
+Without --log the source is a generated arena wipe: every one of
+`players - 1` opponents is killed by the local player within --window
+seconds of game time, the player dies once, and noise fills the gaps.
+Each line is stamped with the wall clock as it is written.
+"""
+import argparse
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from conftest import use_example_config
+
+use_example_config()
+
+from api_client import APIClient
+from headless import NullLog, make_parser
+from log_gen import GEID, HANDLE, LogGenerator
+from metrics import Metrics, age_ms, tail_lag
+from stub_backend import StubBackend
+from version import CLIENT_VERSION
+
+# seconds between tail lag samples
+SAMPLE_INTERVAL = 0.05
+
+
+class ReadyLog(NullLog):
+    """Parser log that notices when the tail goes live."""
+
+    def __init__(self):
+        self.live = threading.Event()
+
+    def success(self, m, *args):
+        if m.startswith("Kill Tracking initiated"):
+            self.live.set()
+
+
+def arena_wipe(players: int, window: float, noise_per_kill: int = 20, seed: int = 22) -> list:
+    """Header lines, then a wipe of `players - 1` opponents and one death of the player."""
+    gen = LogGenerator(seed, mix={"noise": 1})
+    lines = gen.header()
+    start = gen.clock
+    deaths = players - 1
+    step = timedelta(seconds=window / players)
+    for n in range(players):
+        for _ in range(noise_per_kill):
+            lines.append(gen.noise(gen.stamp()))
+        gen.clock = start + step * (n + 1)
+        stamp = f"<{gen.clock.isoformat(timespec='milliseconds')}Z>"
+        if n < deaths:
+            lines.append(gen.kill_line(stamp, f"Pilot_{n}", 300000000000 + n, gen.ship(), HANDLE, GEID))
+        else:
+            lines.append(gen.kill_line(stamp, HANDLE, GEID, gen.ship(), "Pilot_0", 300000000000))
+    return lines
+
+
+def line_time(line: str):
+    try:
+        return datetime.fromisoformat(line[1 : line.index(">")].rstrip("Z"))
+    except ValueError:
+        return None
+
+
+def restamp(line: str, now: datetime) -> str:
+    if not line.startswith("<") or ">" not in line:
+        return line
+    return f"<{now.isoformat(timespec='milliseconds')[:23]}Z>{line[line.index('>') + 1:]}"
+
+
+def replay(lines, path, speed: float, header: int = 2) -> float:
+    """Append lines to `path` at `speed` times their logged pace; returns seconds taken."""
+    times = [line_time(line) for line in lines]
+    first = next((t for t in times[header:] if t is not None), None)
+    start = time.monotonic()
+    with open(path, "a", encoding="utf-8", newline="\n") as f:
+        for line, at in zip(lines[header:], times[header:]):
+            if at is not None and first is not None:
+                delay = (at - first).total_seconds() / speed - (time.monotonic() - start)
+                if delay > 0:
+                    f.flush()
+                    time.sleep(delay)
+            f.write(restamp(line, datetime.now(timezone.utc).replace(tzinfo=None)))
+        f.flush()
+    return time.monotonic() - start
+
+
+def percentiles(values) -> str:
+    if len(values) < 2:
+        return ", ".join(f"{v:.0f}" for v in values) or "none"
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return f"p50 {cuts[49]:.0f}  p90 {cuts[89]:.0f}  p99 {cuts[98]:.0f}  max {max(values):.0f}"
+
+
+def run(lines, speed=1.0, latency=0.0, error_rate=0.0, rate_limit=None, drain_timeout=120.0) -> dict:
+    """One replay; returns the measurements as a dict."""
+    with tempfile.TemporaryDirectory() as folder, StubBackend(
+        latency=latency, error_rate=error_rate, rate_limit=rate_limit
+    ) as backend:
+        path = os.path.join(folder, "Game.log")
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(lines[:2])
+        metrics = Metrics()
+        api = APIClient(
+            {"value": "key"},
+            NullLog(),
+            kill_url=backend.url("/reportKill"),
+            death_url=backend.url("/reportDeath"),
+            outbox_path=os.path.join(folder, "outbox.db"),
+            metrics=metrics,
+        )
+        log = ReadyLog()
+        parser = make_parser(api, logger=log, local_version=CLIENT_VERSION)
+        parser.metrics = metrics
+        parser.log_file_location = path
+        parser.watch_backend = "auto"
+        parser.start_tail_log_thread()
+        if not log.live.wait(10):
+            raise SystemExit("The tail never went live.")
+
+        lag = []
+        sampling = threading.Event()
+
+        def sample():
+            while not sampling.wait(SAMPLE_INTERVAL):
+                lag.append(tail_lag(metrics.gauges))
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        elapsed = replay(lines, path, speed)
+        drained = api.flush(timeout=drain_timeout)
+        sampling.set()
+        sampler.join()
+        parser.stop_tail_log_thread(timeout=5)
+        api.close()
+
+    acked = [age_ms(payload["time"], datetime.fromtimestamp(at, timezone.utc)) for at, payload in backend.acks]
+    per_second = Counter(int(t) for t in backend.request_times)
+    return {
+        "lines": len(lines) - 2,
+        "replay_s": elapsed,
+        "events": parser.events_posted,
+        "acked": len(backend.acks),
+        "drained": drained,
+        "requests": len(backend.requests),
+        "peak_rps": max(per_second.values(), default=0),
+        "failed": metrics.counters.get("uploads_failed", 0),
+        "lag_max": max(lag, default=0),
+        "lag_mean": statistics.fmean(lag) if lag else 0.0,
+        "latency_ms": acked,
+    }
+
+
+def report(result: dict, speed: float) -> None:
+    r = result
+    print(
+        f"replayed {r['lines']:,} lines at {speed:g}x in {r['replay_s']:.2f} s "
+        f"({r['lines'] / r['replay_s']:,.0f} lines/s), {r['events']} events posted"
+    )
+    print(
+        f"backend: {r['requests']} requests, peak {r['peak_rps']}/s, {r['acked']} accepted, "
+        f"{r['failed']} failed or rate-limited" + ("" if r["drained"] else ", outbox NOT drained")
+    )
+    print(f"tail lag: max {r['lag_max']:,} B, mean {r['lag_mean']:,.0f} B")
+    print(f"log -> ack latency ms: {percentiles(r['latency_ms'])}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--log", help="replay this Game.log instead of a generated wipe")
+    ap.add_argument("--players", type=int, default=40)
+    ap.add_argument("--window", type=float, default=20.0, help="game seconds the wipe takes")
+    ap.add_argument("--speed", type=float, default=1.0, help="replay speed multiple")
+    ap.add_argument("--latency", type=float, default=0.05, help="stub reply delay, seconds")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fraction of posts answered 500")
+    ap.add_argument("--rate-limit", type=int, default=None, help="posts accepted per second")
+    ap.add_argument(
+        "--drain-timeout", type=float, default=120.0, help="seconds to wait for the outbox after the replay"
+    )
+    args = ap.parse_args(argv)
+
+    if args.log:
+        with open(args.log, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    else:
+        lines = arena_wipe(args.players, args.window)
+    result = run(
+        lines, args.speed, args.latency, args.error_rate, args.rate_limit, args.drain_timeout
+    )
+    report(result, args.speed)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
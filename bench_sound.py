@@ -0,0 +1,41 @@
+# bench_sound.py
+"""
+Time the tail thread spends on kill sounds during a 5-kill burst: playing
+each clip in line (the old way) vs handing kills to KillSoundPlayer.
+The backend only waits out the clip's length, so this runs anywhere.
+
+    python bench_sound.py
+"""
+import time
+import wave
+
+from sound_player import KILL_CLIP, KillSoundPlayer, NullBackend
+
+
+def main():
+    with wave.open(KILL_CLIP) as w:
+        clip_seconds = w.getnframes() / w.getframerate()
+    kills = 5
+
+    backend = NullBackend(duration=clip_seconds)
+    start = time.perf_counter()
+    for _ in range(kills):
+        with open(KILL_CLIP, "rb") as f:
+            backend.play(f.read())
+    print(f"in line:  {time.perf_counter() - start:8.3f} s on the tail thread, {len(backend.played)} clips")
+
+    backend = NullBackend(duration=clip_seconds)
+    player = KillSoundPlayer(backend=backend)
+    start = time.perf_counter()
+    for _ in range(kills):
+        player.play_random_sound()
+    stalled = time.perf_counter() - start
+    while not player.cues:
+        time.sleep(0.01)
+    print(f"player:   {stalled:8.6f} s on the tail thread, {len(player.cues)} cue for {player.cues[0]} kills")
+    backend.done.set()
+    player.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# bench_startup.py
+"""
+Startup cost of the tracker entry point, each measurement in a fresh
+interpreter so nothing is already imported or cached:
+
+- import cost of every module main.py pulls in at load time, and of the
+  ones it imports on first use, from `python -X importtime`; and which of
+  the latter are loaded by `import main` all the same, through another
+  dependency
+- `import main` as a whole
+- time to interactive: wall clock from launching `python main.py` until
+  the window has been drawn (needs a display; the tracker exits right
+  after its first paint when KILLTRACKER_EXIT_AFTER_PAINT is set)
+- the headless daemon against the GUI: import cost and resident memory
+  after import, and the daemon's time and memory until it is tailing a
+  log (against a local stub backend)
+
+    python bench_startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# imported when main.py loads
+EAGER = [
+    "customtkinter",
+    "tkinter.font",
+    "config",
+    "log_parser",
+    "identity",
+    "api_client",
+    "event_logger",
+    "helpers",
+    "process_locator",
+    "startup",
+]
+# imported on first use by main.py itself; whether `import main` still loads
+# them (customtkinter, for one, imports PIL and packaging) is checked below
+LAZY = ["requests", "psutil", "packaging.version", "webbrowser", "PIL.Image", "PIL.ImageTk", "logging.handlers"]
+
+
+def import_time_us(module: str):
+    """Cumulative import time of `module` in microseconds, or None if it fails."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode != 0:
+        return None
+    for line in reversed(out.stderr.splitlines()):
+        # "import time: self [us] | cumulative | imported package"
+        fields = [f.strip() for f in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    return None
+
+
+def median_import(module: str, runs: int):
+    samples = [import_time_us(module) for _ in range(runs)]
+    if None in samples:
+        return None
+    return statistics.median(samples)
+
+
+def loaded_by(module: str, candidates) -> list:
+    """Which of `candidates` are in sys.modules after `import module` in a fresh interpreter."""
+    # config.example stands in for config.py if need be
+    code = (
+        f"import conftest, json, sys; import {module}; "
+        f"print(json.dumps([m for m in {list(candidates)!r} if m in sys.modules]))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True)
+    if out.returncode != 0:
+        return None
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def rss_mb(pid: int) -> float:
+    import psutil
+
+    return psutil.Process(pid).memory_info().rss / 1024 / 1024
+
+
+def import_rss_mb(module: str):
+    """Resident memory of a fresh interpreter after `import module`, or None if it fails."""
+    code = f"import os, psutil, {module}; print(psutil.Process(os.getpid()).memory_info().rss)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True
+    )
+    if out.returncode != 0:
+        return None
+    return int(out.stdout.split()[-1]) / 1024 / 1024
+
+
+def daemon_to_tailing(runs: int):
+    """(wall seconds, MB resident) of the median daemon run until it tails a log."""
+    from log_gen import LogGenerator
+    from stub_backend import StubBackend
+
+    samples = []
+    with tempfile.TemporaryDirectory() as folder, StubBackend(valid_keys={"bench"}) as backend:
+        with open(os.path.join(folder, "Game.log"), "w", encoding="utf-8") as f:
+            f.writelines(LogGenerator(0).lines(50_000))
+        with open(os.path.join(folder, "killtracker_key.cfg"), "w", encoding="utf-8") as f:
+            json.dump({"key": "bench", "expires_at": "2999-01-01T00:00:00Z"}, f)
+        for _ in range(runs):
+            # a fresh cache each run, so the key check goes to the backend
+            for name in os.listdir(folder):
+                if name.startswith("killtracker_http_cache"):
+                    os.remove(os.path.join(folder, name))
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [sys.executable, os.path.join(HERE, "daemon.py"), "--json", "--log", "Game.log",
+                 "--backend", backend.url("")],
+                cwd=folder,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            for line in proc.stdout:
+                if json.loads(line)["message"].endswith("Kill Tracking initiated."):
+                    samples.append((time.perf_counter() - start, rss_mb(proc.pid)))
+                    break
+            proc.kill()
+            proc.wait()
+    if len(samples) < runs:
+        return None
+    return sorted(samples)[len(samples) // 2]
+
+
+def time_to_interactive(runs: int):
+    """(wall seconds, timings reported by the tracker, MB resident) of the median run, or None."""
+    if sys.platform != "win32" and not os.environ.get("DISPLAY"):
+        return None
+    env = dict(os.environ, KILLTRACKER_EXIT_AFTER_PAINT="1")
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "main.py"],
+            cwd=HERE,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        for line in proc.stdout:
+            if line.startswith("interactive "):
+                samples.append(
+                    (time.perf_counter() - start, line.split(" ", 1)[1].strip(), rss_mb(proc.pid))
+                )
+                break
+        proc.kill()
+        proc.wait()
+    if len(samples) < runs:
+        return None
+    return sorted(samples)[len(samples) // 2]
+
+
+def report(label, modules, runs):
+    print(label)
+    for module in modules:
+        us = median_import(module, runs)
+        shown = "import failed" if us is None else f"{us / 1000:8.1f} ms"
+        print(f"  {module:<20} {shown}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    report("imported by main.py at load time:", EAGER, runs)
+    report("imported on first use by main.py:", LAZY, runs)
+    loaded = loaded_by("main", LAZY)
+    if loaded is None:
+        print("loaded anyway by import main: import failed")
+    else:
+        print(f"loaded anyway by import main: {', '.join(loaded) or 'none'}")
+    us = median_import("main", runs)
+    print(f"import main: {'import failed' if us is None else f'{us / 1000:.1f} ms'}")
+    tti = time_to_interactive(runs)
+    if tti is None:
+        print("time to interactive: skipped (no display, or main.py did not start)")
+    else:
+        print(
+            f"time to interactive: {tti[0] * 1000:.0f} ms wall clock, {tti[2]:.1f} MB resident, "
+            f"tracker timings {tti[1]}"
+        )
+
+    print("headless daemon vs GUI:")
+    for module in ("daemon", "main"):
+        us = median_import(module, runs)
+        rss = import_rss_mb(module)
+        shown = "import failed" if us is None or rss is None else f"{us / 1000:8.1f} ms {rss:6.1f} MB"
+        print(f"  import {module:<14} {shown}")
+    tailing = daemon_to_tailing(runs)
+    if tailing is None:
+        print("  daemon to tailing: failed (is config.py there?)")
+    else:
+        print(f"  daemon to tailing: {tailing[0] * 1000:.0f} ms wall clock, {tailing[1]:.1f} MB resident")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# bench_tail_latency.py
+"""
+Kill-line-to-handler latency of the live tail, per watcher backend.
+
+    python bench_tail_latency.py [kills]
+
+A separate writer process appends kill lines stamped with the wall clock;
+the parser records when each one reaches APIClient.post_kill_event.
+"""
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from log_watcher import PollingWatcher, make_watcher
+from test_log_parser import RECORDED_LOG, make_parser
+
+KILL_TEMPLATE = RECORDED_LOG.splitlines(keepends=True)[6]
+KILL_STAMP = "<2025-05-01T18:00:06.000Z>"
+NOISE = "<2025-05-01T18:00:00.000Z> [Notice] <CEntity::OnOwnerChanged> noise [Team_CoreTech]\n"
+
+
+def write_kills(path: str, kills: int) -> None:
+    rng = random.Random(3)
+    with open(path, "a", encoding="utf-8") as f:
+        for _ in range(kills):
+            time.sleep(rng.uniform(0.05, 0.3))
+            f.write(NOISE * rng.randint(0, 20))
+            f.write(KILL_TEMPLATE.replace(KILL_STAMP, f"<{time.time():.6f}>"))
+            f.flush()
+
+
+def measure(label: str, watcher, path: str, kills: int) -> None:
+    parser = make_parser()
+    parser.log_file_location = path
+    latencies = []
+    post = parser.api.post_kill_event
+
+    def timed_post(kill):
+        latencies.append(time.time() - float(kill.time))
+        post(kill)
+
+    parser.api.post_kill_event = timed_post
+    sc_log = open(path, "rb")
+    sc_log.seek(0, 2)
+    thread = threading.Thread(target=parser.follow_log, args=(sc_log, watcher), daemon=True)
+    thread.start()
+    subprocess.run([sys.executable, __file__, "--write", path, str(kills)], check=True)
+    time.sleep(1.5)
+    parser.monitoring["active"] = False
+    thread.join()
+    watcher.close()
+    ms = sorted(x * 1000 for x in latencies)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{label:<22} n={len(ms):<4} median {statistics.median(ms):7.1f} ms  "
+        f"p95 {p95:7.1f} ms  max {ms[-1]:7.1f} ms"
+    )
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--write":
+        write_kills(sys.argv[2], int(sys.argv[3]))
+        return
+    kills = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "Game.log")
+        open(path, "w").close()
+        measure("fixed 1s poll (old)", PollingWatcher(path, 1.0, 1.0), path, kills)
+        measure("adaptive poll", make_watcher(path, "poll"), path, kills)
+        if sys.platform.startswith("linux"):
+            measure("inotify", make_watcher(path, "inotify"), path, kills)
+
+
+if __name__ == "__main__":
+    main()
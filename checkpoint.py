@@ -0,0 +1,55 @@
+import hashlib
+import json
+import os
+
+CHECKPOINT_PATH = "killtracker_checkpoint.json"
+
+
+def log_fingerprint(log_path) -> dict:
+    """Identify a Game.log: where it lives, its inode and a hash of its first line."""
+    st = os.stat(log_path)
+    with open(log_path, "rb") as f:
+        first_line = f.readline(4096)
+    return {
+        "path": os.path.abspath(log_path),
+        "device": st.st_dev,
+        "inode": st.st_ino,
+        "size": st.st_size,
+        "first_line": hashlib.sha1(first_line).hexdigest(),
+    }
+
+
+def checkpoint_path_for(log_path, base=CHECKPOINT_PATH) -> str:
+    """A checkpoint file of its own for `log_path`, when several logs are tailed at once."""
+    digest = hashlib.sha1(os.path.abspath(log_path).encode("utf-8")).hexdigest()[:10]
+    root, ext = os.path.splitext(base)
+    return f"{root}-{digest}{ext}"
+
+
+def save_checkpoint(checkpoint_path, log_path, offset: int, state: dict) -> None:
+    """Atomically record how far into `log_path` the parser got, and its state there."""
+    data = {"log": log_fingerprint(log_path), "offset": offset, "state": state}
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path, log_path):
+    """
+    Return (offset, state) saved for `log_path`, or (0, None) when there is no
+    checkpoint or the log is not the same file any more.
+    """
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        saved = data["log"]
+        current = log_fingerprint(log_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0, None
+    same_file = all(
+        saved.get(k) == current[k] for k in ("path", "device", "inode", "first_line")
+    )
+    if not same_file or current["size"] < data["offset"]:
+        return 0, None
+    return data["offset"], data["state"]
@@ -3,3 +3,4 @@ BACKEND_URL = "https://your-backend-url"
 API_KEY = "your-72h-api-key-here"
 VALIDATE_URL = f"{BACKEND_URL}/keys/validate"
 REPORT_KILL_URL = f"{BACKEND_URL}/reportKill"
+REPORT_DEATH_URL = f"{BACKEND_URL}/reportDeath"
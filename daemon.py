@@ -0,0 +1,147 @@
+# daemon.py
+"""
+Headless tracker: finds the Game.logs when Star Citizen starts, loads the key
+saved by the GUI, then tails and uploads like the GUI does, logging to
+the console instead of a window. No Tk, CustomTkinter or Pillow is loaded.
+
+    python daemon.py [--json] [--debug] [--log GAME_LOG ...] [--key-file PATH]
+                     [--backend URL] [--stats-port PORT]
+
+Runs until Ctrl+C or SIGTERM.
+"""
+import argparse
+from datetime import datetime
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+
+from config import BACKEND_URL
+from api_client import APIClient
+from headless import ConsoleLogger
+from metrics import metrics, serve
+from multi_tail import MultiTail
+from process_locator import GameWatcher, find_game_logs
+from response_cache import ResponseCache, cached_key_valid, check_key, revalidate_key
+from version import CLIENT_VERSION
+
+KEY_FILE = "killtracker_key.cfg"
+
+
+def load_key(path: str, cache: ResponseCache, url: str):
+    """
+    (key, cached) for the saved key, where cached means it was accepted on
+    the strength of an earlier check; raises SystemExit when there is no
+    usable key.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            info = json.load(f)
+        key = info["key"]
+        expires_at = datetime.fromisoformat(info["expires_at"].rstrip("Z"))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        raise SystemExit(f"No saved key in {path}; activate one in the tracker first.")
+    if cached_key_valid(cache, key, expires_at):
+        return key, True
+    valid = check_key(key, cache, url)
+    if valid is None:
+        raise SystemExit("Could not reach the backend to check the saved key.")
+    if not valid:
+        raise SystemExit("The saved key was rejected; activate a new one in the tracker.")
+    return key, False
+
+
+def revalidate(key_store: dict, cache: ResponseCache, url: str, logger) -> None:
+    if revalidate_key(key_store, key_store["value"], cache, url):
+        logger.error("The saved key was rejected; activate a new one in the tracker.")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--json", action="store_true", help="log JSON lines instead of text")
+    ap.add_argument("--debug", action="store_true")
+    ap.add_argument(
+        "--log",
+        action="append",
+        help="tail this Game.log now instead of waiting for the game; may be repeated",
+    )
+    ap.add_argument("--key-file", default=KEY_FILE)
+    ap.add_argument("--backend", default=BACKEND_URL, help="backend base URL")
+    ap.add_argument("--stats-port", type=int, help="serve the stats as JSON on localhost")
+    args = ap.parse_args(argv)
+    missing = [p for p in args.log or () if not os.path.isfile(p)]
+    if missing:
+        raise SystemExit(f"Not found: {', '.join(missing)}")
+
+    logger = ConsoleLogger(logging.DEBUG if args.debug else logging.INFO, json_lines=args.json)
+    validate_url = f"{args.backend}/keys/validate"
+    cache = ResponseCache()
+    key, cached = load_key(args.key_file, cache, validate_url)
+    api_key = {"value": key}
+    logger.success("Key loaded. Servitor connection established.")
+    if cached:
+        threading.Thread(
+            target=revalidate, args=(api_key, cache, validate_url, logger), daemon=True
+        ).start()
+    if args.stats_port:
+        serve(metrics, args.stats_port)
+
+    api = APIClient(
+        api_key,
+        logger,
+        kill_url=f"{args.backend}/reportKill",
+        death_url=f"{args.backend}/reportDeath",
+    )
+    tails = MultiTail(api, logger, local_version=CLIENT_VERSION)
+
+    def attach(log_path):
+        try:
+            parser = tails.add(log_path)
+        except OSError as e:
+            # e.g. a log found for the game that is gone or locked by the time it is read
+            logger.error("Could not open %s: %s %s", log_path, e.__class__.__name__, e)
+            return
+        logger.info("Tailing %s as %s.", log_path, parser.rsi_handle["current"])
+
+    def attach_to_game(exe):
+        log_paths = find_game_logs(exe)
+        if not log_paths:
+            return False
+        for log_path in log_paths:
+            attach(log_path)
+
+    def detach_from_game():
+        logger.info("Star Citizen exited. Tracking paused until it starts again.")
+        tails.stop()
+
+    watcher = None
+    if args.log:
+        for log_path in args.log:
+            attach(log_path)
+    else:
+        logger.info("Waiting for Star Citizen to start...")
+        watcher = GameWatcher(attach_to_game, detach_from_game, logger=logger)
+        watcher.start()
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    try:
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    logger.info("Shutting down.")
+    if watcher is not None:
+        watcher.close()
+    tails.stop(timeout=5)
+    api.close()
+    try:
+        metrics.dump()
+    except OSError as e:
+        logger.error("Could not write stats: %s %s", e.__class__.__name__, e)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+# Manufacturer codes that open a ship entity name, e.g. AEGS_Gladius_1001.
+SHIP_MANUFACTURERS = frozenset(
+    {
+        "DRAK",
+        "ORIG",
+        "AEGS",
+        "ANVL",
+        "CRUS",
+        "BANU",
+        "MISC",
+        "KRIG",
+        "XNAA",
+        "ARGO",
+        "VNCL",
+        "ESPR",
+        "RSI",
+        "CNOU",
+        "GRIN",
+        "TMBL",
+        "GAMA",
+    }
+)
+# GEIDs remembered at once; a long PU session sees far more entities than this.
+ENTITY_CAPACITY = 10_000
+
+
+def ship_code(name: str):
+    """(ship, entity id) for a ship entity name such as AEGS_Gladius_1001, else None."""
+    maker, sep, _ = name.partition("_")
+    if not sep or maker not in SHIP_MANUFACTURERS:
+        return None
+    ship, _, entity_id = name.rpartition("_")
+    return ship, entity_id
+
+
+class EntityRegistry:
+    """
+    Which ship each GEID was last seen as or in, for attributing kills.
+    Players are kept by the entity id of the ship they spawned, so a ship
+    that is destroyed or a player who dies is no longer attached to kills.
+    Least recently used entries are dropped beyond `capacity`.
+    """
+
+    def __init__(self, capacity: int = ENTITY_CAPACITY):
+        self.capacity = capacity
+        self.ships = OrderedDict()
+        # player GEID -> entity id of the ship they are in
+        self.aboard = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.ships)
+
+    def note(self, geid: str, ship: str) -> None:
+        ships = self.ships
+        if geid in ships:
+            ships.move_to_end(geid)
+        ships[geid] = ship
+        if len(ships) > self.capacity:
+            ships.popitem(last=False)
+
+    def note_name(self, name: str):
+        """Record a ship entity by its name; returns ship_code(name)."""
+        code = ship_code(name)
+        if code is not None:
+            self.note(code[1], code[0])
+        return code
+
+    def board(self, player: str, entity_id: str) -> None:
+        aboard = self.aboard
+        if player in aboard:
+            aboard.move_to_end(player)
+        aboard[player] = entity_id
+        if len(aboard) > self.capacity:
+            aboard.popitem(last=False)
+
+    def leave(self, player: str) -> None:
+        """The player died or left their ship."""
+        self.aboard.pop(player, None)
+
+    def destroyed(self, entity_id: str) -> None:
+        """The ship is gone, and with it the players recorded aboard."""
+        self.ships.pop(entity_id, None)
+
+    def ship(self, geid: str, default: str = "N/A") -> str:
+        ship = self.ships.get(geid)
+        if ship is None:
+            entity_id = self.aboard.get(geid)
+            ship = self.ships.get(entity_id) if entity_id is not None else None
+            if ship is None:
+                return default
+            geid = entity_id
+        self.ships.move_to_end(geid)
+        return ship
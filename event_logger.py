@@ -0,0 +1,162 @@
+from collections import deque
+import logging
+import queue
+import tkinter as tk
+from time import monotonic
+
+# Most lines kept in the log textbox; older ones scroll off the top.
+MAX_LINES = 2000
+# How often the Tk main loop moves queued messages into the textbox (~60 fps).
+FLUSH_INTERVAL_MS = 16
+# Identical warnings/errors inside this many seconds are shown once.
+REPEAT_WINDOW = 10.0
+# Rotating file sink: size per file and how many old files to keep.
+LOG_FILE_BYTES = 2 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+SUCCESS = 25
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+
+def open_file_sink(path):
+    """
+    Rotating log file written by a background listener thread, so the
+    caller only pays for a queue put.
+    """
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+    file_logger = logging.getLogger(f"killtracker.{path}")
+    file_logger.setLevel(DEBUG)
+    file_logger.propagate = False
+    records = queue.SimpleQueue()
+    file_logger.addHandler(QueueHandler(records))
+    handler = RotatingFileHandler(
+        path, maxBytes=LOG_FILE_BYTES, backupCount=LOG_FILE_BACKUPS, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    listener = QueueListener(records, handler)
+    listener.start()
+    return file_logger, listener
+
+
+class EventLogger:
+    """
+    Log sink for the GUI textbox that any thread may write to.
+    Messages are queued and the Tk main loop inserts them in one batch per
+    frame, so worker threads never touch the widget and a flood of messages
+    costs one redraw per frame instead of one per line.
+
+    Level methods take printf-style arguments, e.g. debug("zone %s", zone);
+    below the threshold they return before anything is formatted.
+    """
+
+    def __init__(
+        self,
+        widget,
+        max_lines=MAX_LINES,
+        interval_ms=FLUSH_INTERVAL_MS,
+        level=INFO,
+        log_file=None,
+        repeat_window=REPEAT_WINDOW,
+    ):
+        self.w = widget
+        self.max_lines = max_lines
+        self.interval_ms = interval_ms
+        self.level = level
+        self.repeat_window = repeat_window
+        # message -> [first seen, repeats held back since]
+        self.recent = {}
+        self.file_logger = None
+        self.file_listener = None
+        if log_file:
+            self.file_logger, self.file_listener = open_file_sink(log_file)
+        # ring buffer: a burst bigger than the textbox only keeps what would stay visible
+        self.pending = deque(maxlen=max_lines)
+        self.lines_shown = 0
+        self.w.after(self.interval_ms, self.pump)
+
+    def log(self, m, *args):
+        self.emit(INFO, "", m, args)
+
+    def emit(self, level, tag, m, args):
+        text = tag + (m % args if args else m)
+        if level >= WARNING:
+            text = self.collapse_repeats(text)
+            if text is None:
+                return
+        self.pending.append(text)
+        if self.file_logger is not None:
+            self.file_logger.log(level, text)
+
+    def collapse_repeats(self, text):
+        """None while `text` repeats inside the window; afterwards it is shown with a count."""
+        now = monotonic()
+        seen = self.recent.get(text)
+        if seen is not None and now - seen[0] < self.repeat_window:
+            seen[1] += 1
+            return None
+        if len(self.recent) > 256:
+            self.recent.clear()
+        self.recent[text] = [now, 0]
+        if seen is not None and seen[1]:
+            return f"{text} (repeated {seen[1]} more times)"
+        return text
+
+    def pump(self):
+        """Runs on the Tk main loop once per frame."""
+        try:
+            self.flush()
+        finally:
+            self.w.after(self.interval_ms, self.pump)
+
+    def flush(self):
+        """Move queued messages into the textbox. Tk main thread only."""
+        batch = []
+        while True:
+            try:
+                batch.append(self.pending.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
+        self.w.configure(state=tk.NORMAL)
+        self.w.insert(tk.END, "\n".join(batch) + "\n")
+        self.lines_shown += len(batch) + sum(m.count("\n") for m in batch)
+        excess = self.lines_shown - self.max_lines
+        if excess > 0:
+            self.w.delete("1.0", f"{excess + 1}.0")
+            self.lines_shown = self.max_lines
+        self.w.configure(state=tk.DISABLED)
+        self.w.see(tk.END)
+
+    def close(self):
+        """Stop the file sink, writing out whatever it still holds."""
+        if self.file_listener is not None:
+            self.file_listener.stop()
+            self.file_listener = None
+
+    def debug(self, m, *args):
+        if self.level > DEBUG:
+            return
+        self.emit(DEBUG, "[DEBUG] ", m, args)
+
+    def info(self, m, *args):
+        if self.level > INFO:
+            return
+        self.emit(INFO, "[INFO] ", m, args)
+
+    def success(self, m, *args):
+        if self.level > SUCCESS:
+            return
+        self.emit(SUCCESS, "[SUCCESS] ", m, args)
+
+    def warning(self, m, *args):
+        if self.level > WARNING:
+            return
+        self.emit(WARNING, "[WARNING] ", m, args)
+
+    def error(self, m, *args):
+        self.emit(ERROR, "[ERROR] ", m, args)
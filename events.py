@@ -0,0 +1,196 @@
+import json
+import sys
+
+RSI_PROFILE_URL = "https://robertsspaceindustries.com/citizens/"
+
+# the low-cardinality fields of an event (game mode, damage type, ship
+# codes, zones) share one string object per distinct value
+intern = sys.intern
+# compact and reused, instead of json.dumps building an encoder per call
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def game_mode_kind(game_mode: str) -> str:
+    return "ac-kill" if game_mode.startswith("EA_") else "pu-kill"
+
+
+class Event:
+    """
+    What parse_kill_line made of a kill line. `result` keeps the names of
+    the old result dicts ("killer", "killed", ...); the payload sent to the
+    backend is only built by to_dict()/to_json() when the event is uploaded.
+    """
+
+    __slots__ = ()
+    result = None
+
+    def to_dict(self) -> dict:
+        return {}
+
+    def to_json(self) -> str:
+        return _encode(self.to_dict())
+
+
+class KillEvent(Event):
+    """The player killed someone."""
+
+    __slots__ = (
+        "player",
+        "victim",
+        "time",
+        "zone",
+        "weapon",
+        "damage_type",
+        "game_mode",
+        "client_ver",
+        "killers_ship",
+        "victim_ship",
+        "anonymize_state",
+    )
+    result = "killer"
+
+    def __init__(
+        self,
+        player,
+        victim,
+        time,
+        zone,
+        weapon,
+        damage_type,
+        game_mode,
+        client_ver,
+        killers_ship,
+        victim_ship,
+        anonymize_state,
+    ):
+        self.player = player
+        self.victim = victim
+        self.time = time
+        self.zone = zone
+        self.weapon = weapon
+        self.damage_type = damage_type
+        self.game_mode = game_mode
+        self.client_ver = client_ver
+        self.killers_ship = killers_ship
+        self.victim_ship = victim_ship
+        self.anonymize_state = anonymize_state
+
+    def to_dict(self) -> dict:
+        return {
+            "player": self.player,
+            "victim": self.victim,
+            "time": self.time,
+            "zone": self.zone,
+            "weapon": self.weapon,
+            "damage_type": self.damage_type,
+            "rsi_profile": RSI_PROFILE_URL + self.victim,
+            "game_mode": self.game_mode,
+            "mode": game_mode_kind(self.game_mode),
+            "client_ver": self.client_ver,
+            "killers_ship": self.killers_ship,
+            "victim_ship": self.victim_ship,
+            "anonymize_state": self.anonymize_state,
+        }
+
+
+class DeathEvent(Event):
+    """Someone else killed the player."""
+
+    __slots__ = (
+        "killer",
+        "victim",
+        "time",
+        "zone",
+        "weapon",
+        "damage_type",
+        "game_mode",
+        "killers_ship",
+        "victim_ship",
+    )
+    result = "killed"
+
+    def __init__(
+        self,
+        killer,
+        victim,
+        time,
+        zone,
+        weapon,
+        damage_type,
+        game_mode,
+        victim_ship,
+        killers_ship="N/A",
+    ):
+        self.killer = killer
+        self.victim = victim
+        self.time = time
+        self.zone = zone
+        self.weapon = weapon
+        self.damage_type = damage_type
+        self.game_mode = game_mode
+        self.killers_ship = killers_ship
+        self.victim_ship = victim_ship
+
+    def to_dict(self) -> dict:
+        return {
+            "killer": self.killer,
+            "victim": self.victim,
+            "time": self.time,
+            "zone": self.zone,
+            "weapon": self.weapon,
+            "damage_type": self.damage_type,
+            "rsi_profile": RSI_PROFILE_URL + self.killer,
+            "game_mode": self.game_mode,
+            "mode": game_mode_kind(self.game_mode),
+            "killers_ship": self.killers_ship,
+            "victim_ship": self.victim_ship,
+        }
+
+
+class SuicideEvent(Event):
+    """The player killed themselves."""
+
+    __slots__ = ("player", "time", "zone")
+    result = "suicide"
+
+    def __init__(self, player, time, zone):
+        self.player = player
+        self.time = time
+        self.zone = zone
+
+    def to_dict(self) -> dict:
+        return {"player": self.player, "time": self.time, "zone": self.zone}
+
+
+class ResetEvent(Event):
+    """Killed by 'unknown', e.g. a respawn reset."""
+
+    __slots__ = ()
+    result = "reset"
+
+
+class ExclusionEvent(Event):
+    """An NPC or an ignored edge case; nothing to report."""
+
+    __slots__ = ()
+    result = "exclusion"
+
+
+class ErrorEvent(Event):
+    """The kill line could not be parsed."""
+
+    __slots__ = ()
+    result = "error"
+
+
+# the field-less outcomes carry nothing, so one instance of each will do
+RESET = ResetEvent()
+EXCLUSION = ExclusionEvent()
+PARSE_ERROR = ErrorEvent()
+
+
+def to_json(payload) -> str:
+    """JSON text of an event or a plain dict, for the outbox."""
+    if isinstance(payload, Event):
+        return payload.to_json()
+    return _encode(payload)
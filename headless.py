@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+import json
+import logging
+import sys
+import threading
+
+from log_parser import LogParser
+
+SUCCESS = 25
+LEVEL_NAMES = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    SUCCESS: "success",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+}
+
+
+class NullLog:
+    def log(self, m, *args):
+        pass
+
+    debug = info = success = warning = error = log
+
+
+class ConsoleLogger:
+    """
+    Tk-free log sink with EventLogger's methods, writing one line per
+    message to `stream`: plain text, or JSON lines with `json_lines` set.
+    """
+
+    def __init__(self, level=logging.INFO, json_lines=False, stream=None):
+        self.level = level
+        self.json_lines = json_lines
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+
+    def emit(self, level, m, args):
+        if level < self.level:
+            return
+        text = m % args if args else m
+        now = datetime.now(timezone.utc)
+        if self.json_lines:
+            line = json.dumps(
+                {"time": now.isoformat(timespec="milliseconds"), "level": LEVEL_NAMES[level], "message": text}
+            )
+        else:
+            line = f"{now:%H:%M:%S} [{LEVEL_NAMES[level].upper()}] {text}"
+        with self.lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def log(self, m, *args):
+        self.emit(logging.INFO, m, args)
+
+    def debug(self, m, *args):
+        self.emit(logging.DEBUG, m, args)
+
+    def info(self, m, *args):
+        self.emit(logging.INFO, m, args)
+
+    def success(self, m, *args):
+        self.emit(SUCCESS, m, args)
+
+    def warning(self, m, *args):
+        self.emit(logging.WARNING, m, args)
+
+    def error(self, m, *args):
+        self.emit(logging.ERROR, m, args)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullModule:
+    """Sound and heartbeat stand-in: every call is a no-op."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class EventSink:
+    """API client stand-in that keeps every event the parser would upload."""
+
+    def __init__(self):
+        self.api_key = {"value": "offline"}
+        self.events = []
+
+    def post_kill_event(self, event):
+        self.events.append(event)
+
+    post_death_event = post_kill_event
+
+
+def make_parser(api, logger=None, local_version="offline") -> LogParser:
+    """A LogParser with no GUI, sound or checkpoint, reporting to `api`."""
+    parser = LogParser(
+        gui_module=logger or NullLog(),
+        api_client_module=api,
+        sound_module=NullModule(),
+        cm_module=NullModule(),
+        local_version=local_version,
+        monitoring={"active": False},
+        rsi_handle={"current": None},
+        player_geid={"current": None},
+        active_ship={"current": "N/A"},
+        anonymize_state=False,
+    )
+    parser.checkpoint_path = None
+    return parser
@@ -1,7 +1,6 @@
 from os import path
 import sys
 import os
-from winsound import PlaySound, SND_FILENAME
 
 
 def resource_path(relative_path: str) -> str:
@@ -19,5 +18,7 @@ def resource_path(relative_path: str) -> str:
 
 
 def play_kill_sound():
+    from winsound import PlaySound, SND_FILENAME
+
     path = resource_path(os.path.join("assets", "kill.wav"))
     PlaySound(path, SND_FILENAME)
@@ -0,0 +1,93 @@
+import threading
+
+from checkpoint import log_fingerprint
+
+LOGIN_MARKER = "<Legacy login response> [CIG-net] User Login Success"
+CHARACTER_MARKER = "AccountLoginCharacterStatus_Character"
+_LOGIN_BYTES = LOGIN_MARKER.encode("utf-8")
+_CHARACTER_BYTES = CHARACTER_MARKER.encode("utf-8")
+
+SCAN_CHUNK_SIZE = 1024 * 1024
+
+# (path, device, inode, first-line hash) -> {"handle", "geid", "offset"}
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def parse_handle(line: str) -> str:
+    """RSI handle from a login success line."""
+    idx = line.index("Handle[") + len("Handle[")
+    return line[idx:].split(" ")[0].rstrip("]")
+
+
+def parse_geid(line: str) -> str:
+    """Player GEID from an AccountLoginCharacterStatus_Character line."""
+    return line.split(" ")[11]
+
+
+def _cache_key(log_path) -> tuple:
+    fp = log_fingerprint(log_path)
+    return (fp["path"], fp["device"], fp["inode"], fp["first_line"])
+
+
+def find_identity(log_path) -> tuple:
+    """
+    (handle, geid) of the logged-in player, either of which may be None.
+    Both are pulled from a single scan that stops as soon as both are known.
+    Results are cached per log file; a later call on the same file only scans
+    what was written since.
+    """
+    key = _cache_key(log_path)
+    with _cache_lock:
+        entry = _cache.setdefault(key, {"handle": None, "geid": None, "offset": 0})
+        if entry["handle"] is None or entry["geid"] is None:
+            _scan(log_path, entry)
+        return entry["handle"], entry["geid"]
+
+
+def note_identity(log_path, handle=None, geid=None) -> None:
+    """Record a re-login or character change seen by the live tail."""
+    if log_path is None:
+        return
+    try:
+        key = _cache_key(log_path)
+    except OSError:
+        return
+    with _cache_lock:
+        entry = _cache.setdefault(key, {"handle": None, "geid": None, "offset": 0})
+        if handle is not None:
+            entry["handle"] = handle
+        if geid is not None:
+            entry["geid"] = geid
+
+
+def _scan(log_path, entry: dict) -> None:
+    """Fill in whatever `entry` is missing, reading on from entry["offset"]."""
+    pending = b""
+    with open(log_path, "rb") as raw:
+        raw.seek(entry["offset"])
+        while entry["handle"] is None or entry["geid"] is None:
+            chunk = raw.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                return
+            data = pending + chunk if pending else chunk
+            end = data.rfind(b"\n") + 1
+            if entry["handle"] is None:
+                entry["handle"] = _first_match(data, end, _LOGIN_BYTES, parse_handle)
+            if entry["geid"] is None:
+                entry["geid"] = _first_match(data, end, _CHARACTER_BYTES, parse_geid)
+            entry["offset"] += end
+            pending = data[end:]
+
+
+def _first_match(data: bytes, end: int, marker: bytes, parse):
+    pos = data.find(marker, 0, end)
+    while pos != -1:
+        start = data.rfind(b"\n", 0, pos) + 1
+        stop = data.find(b"\n", pos, end)
+        line = data[start : stop + 1].decode("utf-8", errors="replace")
+        try:
+            return parse(line)
+        except (ValueError, IndexError):
+            pos = data.find(marker, stop, end)
+    return None
@@ -0,0 +1,113 @@
+# import_backups.py
+"""
+Send the kills and deaths in Star Citizen's logbackups that the tracker
+never saw, e.g. sessions played while it was not running.
+
+    python import_backups.py [--workers N] [--dry-run] SC_FOLDER_OR_LOGS [...]
+
+Every log (.log, .log.gz, .log.zst) is parsed by its own worker process
+with the tracker's LogParser rules. The results are merged in timestamp
+order, duplicates are dropped, and the rest go through an outbox of the
+importer's own, so a tracker running alongside never sends them too.
+The current Game.log is never read, even when named: the tracker sends
+its kills while it runs.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import json
+import os
+import sys
+
+from headless import EventSink, make_parser
+from log_archive import log_paths, open_log
+from version import CLIENT_VERSION
+
+KEY_FILE = "killtracker_key.cfg"
+# not the tracker's outbox: its sender would post the same rows as ours
+IMPORT_OUTBOX_PATH = "killtracker_import_outbox.db"
+
+
+def extract_events(path) -> list:
+    """Worker: every event the live tracker would have sent for one log, in log order."""
+    sink = EventSink()
+    parser = make_parser(sink, local_version=CLIENT_VERSION)
+    with open_log(path) as raw:
+        parser.backfill_stream(raw, upload_kills=True)
+    return sink.events
+
+
+def merge_events(per_file) -> list:
+    """One timeline out of the per-log event lists, each event once."""
+    merged = []
+    seen = set()
+    for event in heapq.merge(*per_file, key=lambda e: e.time):
+        identity = (event.result, event.to_json())
+        if identity not in seen:
+            seen.add(identity)
+            merged.append(event)
+    return merged
+
+
+def collect(paths, workers=None) -> list:
+    if workers == 1 or len(paths) < 2:
+        return merge_events([extract_events(p) for p in paths])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # biggest logs first, so one large straggler does not end up last
+        by_size = sorted(paths, key=lambda p: os.path.getsize(p), reverse=True)
+        return merge_events(pool.map(extract_events, by_size))
+
+
+def upload(events, api_key: str, **client_args) -> bool:
+    """Journal every event and wait for the backend to take them; False if some are still queued."""
+    from api_client import APIClient, event_key
+    from outbox import Outbox
+
+    client_args.setdefault("outbox_path", IMPORT_OUTBOX_PATH)
+    # left over from an earlier import; the client replays these itself
+    queued = Outbox(client_args["outbox_path"])
+    leftover = queued.pending_keys()
+    queued.close()
+    api = APIClient({"value": api_key}, **client_args)
+    for event in events:
+        kind = "kill" if event.result == "killer" else "death"
+        if event_key(kind, event.to_json()) not in leftover:
+            api.enqueue(kind, event)
+    sent = api.flush(timeout=max(30.0, len(events) * 0.5))
+    api.close()
+    return sent
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("logs", nargs="+", help="the Star Citizen folder (its logbackups are read), or log files")
+    ap.add_argument("--workers", type=int, default=None, help="processes to use (default: one per core)")
+    ap.add_argument("--dry-run", action="store_true", help="only list what would be sent")
+    args = ap.parse_args(argv)
+
+    paths = log_paths(args.logs, include_current=False)
+    if not paths:
+        raise SystemExit("No log files found.")
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        raise SystemExit(f"Not found: {', '.join(missing)}")
+    events = collect(paths, args.workers)
+    kills = sum(e.result == "killer" for e in events)
+    print(f"{len(paths)} logs: {kills} kills, {len(events) - kills} deaths")
+    if args.dry_run:
+        for event in events:
+            print(event.result, event.to_json())
+        return
+    try:
+        with open(KEY_FILE, "r", encoding="utf-8") as f:
+            api_key = json.load(f)["key"]
+    except (OSError, ValueError, KeyError):
+        raise SystemExit(f"No saved key in {KEY_FILE}; activate one in the tracker first.")
+    if upload(events, api_key):
+        print("All events sent.")
+    else:
+        print(f"Some events are still queued in {IMPORT_OUTBOX_PATH}; run the import again to send them.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
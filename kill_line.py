@@ -0,0 +1,71 @@
+from functools import lru_cache
+import re
+
+# Actors, zones and weapons whose kills are never reported: NPCs and fauna.
+# Matched case-insensitively anywhere in a field.
+IGNORE_KILL_SUBSTRINGS = (
+    "PU_Pilots",
+    "NPC_Archetypes",
+    "PU_Human",
+    "kopion",
+    "marok",
+    "vlk_juvenile_",
+    "vlk_adult_",
+    "Quasigrazer",
+)
+IGNORE_RX = re.compile("|".join(map(re.escape, IGNORE_KILL_SUBSTRINGS)), re.IGNORECASE)
+
+KILL_MARKER = "CActor::Kill: "
+# <time> [Notice] <Actor Death> CActor::Kill: 'victim' [geid] in zone 'zone'
+# killed by 'killer' [geid] using 'weapon' [Class class] with damage type 'damage' ...
+# matched from KILL_MARKER on; the time is the line's first token
+KILL_FIELDS_RX = re.compile(
+    r"CActor::Kill: "
+    r"'(?P<victim>[^']*)' \[(?P<victim_geid>[^\]]*)\] in zone '(?P<zone>[^']*)' "
+    r"killed by '(?P<killer>[^']*)' \[(?P<killer_geid>[^\]]*)\] "
+    r"using '(?P<weapon>[^']*)' \[Class (?P<weapon_class>[^\]]*)\] "
+    r"with damage type '(?P<damage>[^']*)'"
+)
+
+# Distinct names remembered by is_ignored. Names are cached without their
+# trailing entity id, so every NPC of one archetype shares an entry.
+NPC_CACHE_SIZE = 4096
+DIGITS = "0123456789"
+
+
+def match_kill_line(line: str):
+    """The named fields of a kill line, or None if it is not one."""
+    start = line.find(KILL_MARKER)
+    if start == -1:
+        return None
+    return KILL_FIELDS_RX.match(line, start)
+
+
+def parse_time(line: str) -> str:
+    """Timestamp of a log line, e.g. 2025-05-01T18:00:06.000Z."""
+    return line.partition(" ")[0].strip("<>")
+
+
+@lru_cache(maxsize=NPC_CACHE_SIZE)
+def is_ignored(name: str) -> bool:
+    """True for an NPC or fauna name (or a zone/weapon named after one)."""
+    return IGNORE_RX.search(name) is not None
+
+
+def ignored_kill(kill, line: str) -> bool:
+    """
+    Whether a kill line involves an ignored actor. Each field's verdict is
+    cached; a line KILL_FIELDS_RX could not take apart is searched whole.
+    """
+    if kill is None:
+        return IGNORE_RX.search(line) is not None
+    victim, _, zone, killer, _, weapon, weapon_class, damage = kill.groups()
+    # no ignored substring contains a digit, so dropping the id keeps the verdict
+    return (
+        is_ignored(victim.rstrip(DIGITS))
+        or is_ignored(killer.rstrip(DIGITS))
+        or is_ignored(zone.rstrip(DIGITS))
+        or is_ignored(weapon.rstrip(DIGITS))
+        or is_ignored(weapon_class)
+        or is_ignored(damage)
+    )
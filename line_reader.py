@@ -0,0 +1,69 @@
+# Bytes asked for per read.
+READ_SIZE = 4 * 1024 * 1024
+# Longest line kept; Game.log's multi-megabyte dumps are skipped, every line
+# the tracker acts on is well under a kilobyte.
+MAX_LINE_BYTES = 1024 * 1024
+
+
+class LineReader:
+    """
+    Reads a binary log into one reusable buffer and hands back blocks of
+    complete lines in place, as `buffer[start:end]`, so a chunk is never copied
+    into a new bytes object. The incomplete line at the end of a read is
+    moved to the front for the next one. Once an incomplete line reaches
+    `max_line` bytes it is skipped up to its newline, so memory stays at
+    read_size + max_line bytes whatever the log holds. (A longer line that
+    arrives whole in one read is still handed out.)
+    """
+
+    def __init__(self, read_size: int = READ_SIZE, max_line: int = MAX_LINE_BYTES):
+        self.read_size = read_size
+        self.max_line = max_line
+        self.buffer = bytearray(read_size + max_line)
+        self.view = memoryview(self.buffer)
+        # buffer[:end] was read last; buffer[end:total] is the incomplete line after it
+        self.end = 0
+        self.total = 0
+        # bytes of the log past the last complete line, kept or skipped
+        self.pending = 0
+        self.skipping = False
+        self.lines_skipped = 0
+
+    def reset(self) -> None:
+        """Forget the incomplete line, e.g. when the log was replaced."""
+        self.end = self.total = self.pending = 0
+        self.skipping = False
+
+    def read(self, raw) -> tuple:
+        """
+        One read from `raw`: (bytes read, start, end), where buffer[start:end]
+        now holds complete lines; it is empty if there are none yet. Nothing
+        read means end of file. The block stays valid until the next call.
+        """
+        buf = self.buffer
+        kept = self.total - self.end
+        if self.end and kept:
+            # never more than max_line bytes: anything longer is being skipped
+            buf[:kept] = buf[self.end : self.total]
+        n = raw.readinto(self.view[kept : kept + self.read_size]) or 0
+        total = kept + n
+        start = 0
+        self.end = self.total = 0
+        if self.skipping:
+            newline = buf.find(b"\n", 0, total)
+            if newline == -1:
+                self.pending += n
+                return n, 0, 0
+            # the long line ends here; the lines after it are handed out in place
+            self.skipping = False
+            start = newline + 1
+        end = max(buf.rfind(b"\n", start, total) + 1, start)
+        self.pending = total - end
+        if self.pending >= self.max_line:
+            # the line after the last newline is already too long to keep
+            self.skipping = True
+            self.lines_skipped += 1
+            self.end = self.total = end
+            return n, start, end
+        self.end, self.total = end, total
+        return n, start, end
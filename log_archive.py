@@ -0,0 +1,47 @@
+import gzip
+import os
+
+# what Star Citizen (or the player) leaves in logbackups
+LOG_SUFFIXES = (".log", ".log.gz", ".log.zst")
+
+
+def open_log(path):
+    """Binary reader over a log, decompressing .gz and .zst archives on the fly."""
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise OSError(f"{path}: reading .zst logs needs zstandard (pip install zstandard)")
+        raw = open(path, "rb")
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return open(path, "rb")
+
+
+def log_paths(args, include_current=True) -> list:
+    """
+    Expand the command line: files are kept as given, a folder stands for
+    its logbackups (oldest name first) followed by its Game.log, and a
+    logbackups folder itself for every log in it. With include_current
+    false, Game.log is left out wherever it comes from, for callers that
+    must not see the log the running tracker is tailing.
+    """
+    paths = []
+    for arg in args:
+        arg = str(arg)
+        if not os.path.isdir(arg):
+            if include_current or os.path.basename(arg) != "Game.log":
+                paths.append(arg)
+            continue
+        backups = os.path.join(arg, "logbackups")
+        folder = backups if os.path.isdir(backups) else arg
+        paths.extend(
+            os.path.join(folder, name)
+            for name in sorted(os.listdir(folder))
+            if name.endswith(LOG_SUFFIXES) and name != "Game.log"
+        )
+        if include_current and os.path.exists(os.path.join(arg, "Game.log")):
+            paths.append(os.path.join(arg, "Game.log"))
+    return paths
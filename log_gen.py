@@ -0,0 +1,222 @@
+# log_gen.py
+"""
+Seeded synthetic Game.log streams for tests and benchmarks.
+
+    python log_gen.py OUT [--lines N] [--seed S] [--mix kind=weight ...]
+
+The same seed and mix always give the same bytes. Alongside the text the
+generator counts the uploads the tracker should make for it, so a parser
+run can be checked against the log it was fed.
+"""
+import argparse
+from collections import Counter
+from datetime import datetime, timedelta
+import random
+import sys
+
+HANDLE = "RRRthur"
+GEID = "200146295176"
+
+# relative weight of every line kind; anything not listed is never produced
+DEFAULT_MIX = {
+    "noise": 940,
+    "context": 2,
+    "zone": 15,
+    "jump": 8,
+    "respawn": 8,
+    "destruction": 5,
+    "player_kill": 10,
+    "npc_kill": 8,
+    "death": 4,
+    # multi-megabyte single-line dumps; off unless asked for
+    "dump": 0,
+}
+GAME_MODES = ("SC_Default", "EA_FreeFlight", "EA_SquadronBattle", "EA_FPSGunGame")
+SHIPS = (
+    "AEGS_Gladius",
+    "AEGS_Sabre",
+    "ANVL_Hornet_F7A_Mk2",
+    "ANVL_Arrow",
+    "DRAK_Cutlass_Black",
+    "MISC_Freelancer",
+    "RSI_Constellation_Andromeda",
+    "CRUS_Starfighter_Ion",
+)
+LOCATIONS = ("OOC_Stanton", "Stanton1_Lorville", "Stanton2_Orison", "Stanton4_Area18", "Pyro1")
+WEAPONS = (
+    "KLWE_LaserRepeater_S3",
+    "BEHR_BallisticGatling_S4",
+    "BEHR_P4AR",
+    "KSAR_Devastator",
+    "GATS_BallisticCannon_S3",
+)
+DAMAGE_TYPES = ("Combat", "Bullet", "VehicleDestruction", "Explosion")
+NPC_NAMES = ("PU_Human_Enemy_Pilot", "PU_Pilots_Xenothreat", "NPC_Archetypes_Outlaw", "kopion_Adult", "marok_Adult")
+NOISE = (
+    "[Notice] <CSCLoadingPlatformManager::OnLoadingPlatformStateChanged> [Loading Platform] Loading Platform Manager [LoadingPlatformManager_ShipElevator_HangarXLTop] State Changed [Closed] -> [OpeningLoadingGate] [Team_ArenaCommander][Spawning]",
+    "[Notice] <CEntity::OnOwnerChanged> Entity 'ItemPort_Weapon_Left' [{id}] owner changed from 0 to {id} [Team_CoreTech][Entity]",
+    '[Notice] <SHUDEvent_OnNotification> Added notification "Entered Monitored Space: " [{n}] to queue. New queue size: 1, MissionId: [00000000-0000-0000-0000-000000000000], ObjectiveId: [] [Team_CoreGameplayFeatures][Missions][Comms]',
+    "[Notice] <StatObjLoad 0x800 Format> 'objects/spaceships/ships/aegs/gladius/exterior/aegs_gladius_body.cgf' Streaming took {n}.2 ms [Team_Engine][Streaming]",
+    "<SpawnFlow> Player '{handle}' [{geid}] lost reservation for spawnpoint bed_{n} at location {n} [Team_ActorFeatures][Spawn]",
+    "[Notice] <CGlobalResourceStreamer> Streaming request {id} completed in {n} ms [Team_Engine][Streaming]",
+)
+
+
+class LogGenerator:
+    """One player's session, line by line; `expected` counts the uploads it should cause."""
+
+    def __init__(self, seed=0, mix=None, handle=HANDLE, geid=GEID, start=None):
+        self.rng = random.Random(seed)
+        mix = DEFAULT_MIX if mix is None else mix
+        self.kinds = [kind for kind, weight in mix.items() if weight > 0]
+        self.weights = [mix[kind] for kind in self.kinds]
+        self.handle = handle
+        self.geid = geid
+        self.clock = start or datetime(2025, 5, 1, 18, 0, 0)
+        self.game_mode = "SC_Default"
+        self.ship_id = None
+        self.next_id = 1000
+        self.expected = Counter()
+        self.makers = {
+            "noise": self.noise,
+            "context": self.context,
+            "zone": self.zone,
+            "jump": self.jump,
+            "respawn": self.respawn,
+            "destruction": self.destruction,
+            "player_kill": self.player_kill,
+            "npc_kill": self.npc_kill,
+            "death": self.death,
+            "dump": self.dump,
+        }
+
+    def stamp(self) -> str:
+        self.clock += timedelta(milliseconds=self.rng.randint(1, 400))
+        return f"<{self.clock.isoformat(timespec='milliseconds')}Z>"
+
+    def entity(self) -> str:
+        self.next_id += 1
+        return str(self.next_id)
+
+    def ship(self) -> str:
+        return f"{self.rng.choice(SHIPS)}_{self.entity()}"
+
+    def header(self) -> list:
+        """Login and character lines, so the parser learns who is playing."""
+        return [
+            f"{self.stamp()} [Notice] <Legacy login response> [CIG-net] User Login Success - Handle[{self.handle}] - Time[1234]\n",
+            f"{self.stamp()} [Notice] <AccountLoginCharacterStatus_Character> Character: createdAt 1 - updatedAt 2 - geid {self.geid} - accountId 1 - name {self.handle} - state STATE_CURRENT [Team_GameServices]\n",
+        ]
+
+    def noise(self, t) -> str:
+        text = self.rng.choice(NOISE).format(
+            id=200000000000 + self.rng.randrange(10**9),
+            n=self.rng.randrange(1000),
+            handle=self.handle,
+            geid=self.geid,
+        )
+        return f"{t} {text}\n"
+
+    def context(self, t) -> str:
+        self.game_mode = self.rng.choice(GAME_MODES)
+        return f'{t} [Notice] <Context Establisher Done> establisher="CReplicationModel" runningTime=10.5 map="megamap" gamerules="{self.game_mode}" sessionId="{self.entity()}" [Team_Network]\n'
+
+    def zone(self, t) -> str:
+        ship = self.ship()
+        self.ship_id = ship.rsplit("_", 1)[1]
+        return f"{t} [Notice] <CEntityComponentInstancedInterior::OnEntityEnterZone> [InstancedInterior] OnEntityEnterZone - InstancedInterior -> Entity [{ship}] [{self.ship_id}] [Team_CoreGameplayFeatures]\n"
+
+    def jump(self, t) -> str:
+        ship = self.ship()
+        self.ship_id = ship.rsplit("_", 1)[1]
+        return f"{t} [Notice] <Jump Drive State Changed> Now Idle (adam: {ship} in zone {self.rng.choice(LOCATIONS)}) [Team_VehicleFeatures]\n"
+
+    def respawn(self, t) -> str:
+        ship = self.ship()
+        return f"{t} [Notice] <CPlayerShipRespawnManager::OnVehicleSpawned> Vehicle spawned: [{ship}] by player {self.geid} [Team_ArenaCommander]\n"
+
+    def destruction(self, t) -> str:
+        ship_id = self.ship_id or self.entity()
+        ship = f"{self.rng.choice(SHIPS)}_{ship_id}"
+        return f"{t} [Notice] <Vehicle Destruction> CVehicle::OnAdvanceDamageState: Vehicle '{ship}' [{ship_id}] in zone '{self.rng.choice(LOCATIONS)}' [Team_VehicleFeatures]\n"
+
+    def kill_line(self, t, victim, victim_id, zone, killer, killer_id) -> str:
+        weapon = f"{self.rng.choice(WEAPONS)}_{self.entity()}"
+        damage = self.rng.choice(DAMAGE_TYPES)
+        return (
+            f"{t} [Notice] <Actor Death> CActor::Kill: '{victim}' [{victim_id}] in zone '{zone}' "
+            f"killed by '{killer}' [{killer_id}] using '{weapon}' [Class unknown] with damage type "
+            f"'{damage}' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]\n"
+        )
+
+    def where(self) -> str:
+        return self.ship() if self.rng.random() < 0.5 else self.rng.choice(LOCATIONS)
+
+    def player_kill(self, t) -> str:
+        self.expected["kill"] += 1
+        victim = f"Pilot_{self.rng.randrange(10**6)}"
+        return self.kill_line(t, victim, 200000000000 + self.rng.randrange(10**9), self.where(), self.handle, self.geid)
+
+    def npc_kill(self, t) -> str:
+        victim = f"{self.rng.choice(NPC_NAMES)}_{self.entity()}"
+        return self.kill_line(t, victim, self.entity(), self.where(), self.handle, self.geid)
+
+    def death(self, t) -> str:
+        self.expected["death"] += 1
+        killer = f"Pilot_{self.rng.randrange(10**6)}"
+        return self.kill_line(t, self.handle, self.geid, self.where(), killer, 200000000000 + self.rng.randrange(10**9))
+
+    def dump(self, t) -> str:
+        """One very long line, like the entity and streaming dumps a real Game.log carries."""
+        entries = self.rng.randint(4_000, 200_000)
+        body = " ".join(f"[{self.entity()}:{self.rng.choice(SHIPS)}]" for _ in range(entries))
+        return f"{t} [Notice] <CEntitySystem::DumpEntities> {body} [Team_CoreTech][Entity]\n"
+
+    def lines(self, count: int):
+        """`count` lines, header included."""
+        header = self.header()
+        yield from header[:count]
+        kinds = self.rng.choices(self.kinds, self.weights, k=max(0, count - len(header)))
+        for kind in kinds:
+            yield self.makers[kind](self.stamp())
+
+
+def parse_mix(items) -> dict:
+    mix = dict(DEFAULT_MIX)
+    for item in items:
+        kind, _, weight = item.partition("=")
+        if kind not in DEFAULT_MIX:
+            raise ValueError(f"unknown line kind {kind!r}; one of {', '.join(DEFAULT_MIX)}")
+        mix[kind] = float(weight)
+    return mix
+
+
+def generate(count: int, seed=0, mix=None) -> str:
+    return "".join(LogGenerator(seed, mix).lines(count))
+
+
+def write_log(path, count: int, seed=0, mix=None) -> Counter:
+    """Write a log of `count` lines; returns the uploads it should cause."""
+    gen = LogGenerator(seed, mix)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.writelines(gen.lines(count))
+    return gen.expected
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("out", help="file to write")
+    ap.add_argument("--lines", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--mix", nargs="*", default=[], metavar="KIND=WEIGHT", help=f"kinds: {', '.join(DEFAULT_MIX)}")
+    args = ap.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    expected = write_log(args.out, args.lines, args.seed, mix)
+    print(f"wrote {args.lines} lines to {args.out}: {expected['kill']} kills, {expected['death']} deaths")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
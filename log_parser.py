@@ -1,7 +1,47 @@
 from time import sleep
-from os import stat
 from threading import Thread
+from time import monotonic
+import os
 import re
+from checkpoint import CHECKPOINT_PATH, load_checkpoint, save_checkpoint
+from identity import (
+    CHARACTER_MARKER,
+    LOGIN_MARKER,
+    find_identity,
+    note_identity,
+    parse_geid,
+    parse_handle,
+)
+from events import (
+    EXCLUSION,
+    PARSE_ERROR,
+    RESET,
+    DeathEvent,
+    KillEvent,
+    SuicideEvent,
+    intern,
+)
+from entities import SHIP_MANUFACTURERS, EntityRegistry, ship_code
+from kill_line import IGNORE_KILL_SUBSTRINGS, ignored_kill, match_kill_line, parse_time
+from line_reader import READ_SIZE, LineReader
+from log_watcher import log_replaced, make_watcher
+from metrics import LAG_GAUGE, metrics
+
+# Bytes read per step, when replaying the existing log at startup and on the live tail.
+BACKFILL_CHUNK_SIZE = READ_SIZE
+# Seconds between checkpoints while the log is busy.
+CHECKPOINT_INTERVAL = 5.0
+
+
+class BackfillStopped(Exception):
+    """The key went away partway through replaying the old log."""
+
+
+def decode_line(raw: bytes) -> str:
+    """Decode one raw log line the same way safe_open's text mode would."""
+    if raw.endswith(b"\r\n"):
+        raw = raw[:-2] + b"\n"
+    return raw.decode("utf-8", errors="replace")
 
 
 def safe_open(path, mode="r"):
@@ -48,163 +88,363 @@ class LogParser:
         self.active_ship_id = "N/A"
         self.player_geid = player_geid
         self.log_file_location = None
+        # "auto", "inotify" or "poll"; see log_watcher.make_watcher
+        self.watch_backend = "auto"
+        # where parser progress is saved between runs; None turns it off
+        self.checkpoint_path = CHECKPOINT_PATH
+        # gauge the live tail's lag is reported under; one per log when tailing several
+        self.lag_gauge = LAG_GAUGE
+        # send kills the game logged after the last checkpoint, while we were down
+        self.upload_missed_kills = False
+        self.events_posted = 0
+        self.tail_thread = None
         ##self.curr_killstreak = 0
         ##self.max_killstreak = 0
         ##self.kill_total = 0
 
-        self.global_ship_list = [
-            "DRAK",
-            "ORIG",
-            "AEGS",
-            "ANVL",
-            "CRUS",
-            "BANU",
-            "MISC",
-            "KRIG",
-            "XNAA",
-            "ARGO",
-            "VNCL",
-            "ESPR",
-            "RSI",
-            "CNOU",
-            "GRIN",
-            "TMBL",
-            "GAMA",
-        ]
+        self.global_ship_list = SHIP_MANUFACTURERS
+        # GEID -> ship from zone, jump drive and spawn lines, for kill attribution
+        self.entities = EntityRegistry()
         # Substrings to ignore
-        self.ignore_kill_substrings = [
-            "PU_Pilots",
-            "NPC_Archetypes",
-            "PU_Human",
-            "kopion",
-            "marok",
+        self.ignore_kill_substrings = IGNORE_KILL_SUBSTRINGS
+        # Line handlers in the order they must run when one line carries
+        # several markers. Every state change starts from one of these markers.
+        self.line_handlers = [
+            ((LOGIN_MARKER,), self.on_login),
+            ((CHARACTER_MARKER,), self.on_character),
+            (("<Context Establisher Done>",), self.on_context_established),
+            (("OnEntityEnterZone",), self.on_entity_enter_zone),
+            (("<Jump Drive State Changed>",), self.on_jump_drive),
+            (
+                ("CPlayerShipRespawnManager::OnVehicleSpawned",),
+                self.on_vehicle_spawned,
+            ),
+            (
+                (
+                    "<Vehicle Destruction>",
+                    "<local client>: Entering control state dead",
+                ),
+                self.on_destruction,
+            ),
+            (("CActor::Kill",), self.on_kill),
+        ]
+        self.kill_slot = len(self.line_handlers) - 1
+        # flat (marker, handler slot) table, ordered by slot
+        self.markers = [
+            (marker, slot)
+            for slot, (markers, _) in enumerate(self.line_handlers)
+            for marker in markers
+        ]
+        self.byte_markers = [
+            (marker.encode("utf-8"), slot) for marker, slot in self.markers
+        ]
+        # counters are bumped per block and per matched line, never per line read
+        self.metrics = metrics
+        self.match_names = [
+            f"match.{handler.__name__[len('on_'):]}" for _, handler in self.line_handlers
         ]
 
     def start_tail_log_thread(self) -> None:
         """Start the log tailing in a separate thread only if it's not already running."""
-        thr = Thread(target=self.tail_log, daemon=True)
-        thr.start()
+        if self.tail_thread is not None and self.tail_thread.is_alive():
+            return
+        self.monitoring["active"] = True
+        self.tail_thread = Thread(target=self.tail_log, daemon=True)
+        self.tail_thread.start()
+
+    def stop_tail_log_thread(self, timeout=None) -> None:
+        """Stop tailing, e.g. when the game exits; progress is checkpointed on the way out."""
+        self.monitoring["active"] = False
+        if self.tail_thread is not None:
+            self.tail_thread.join(timeout)
 
     def tail_log(self) -> None:
         """Read the log file and display events in the GUI."""
         try:
-            sc_log = safe_open(self.log_file_location, "r")
+            sc_log = open(self.log_file_location, "rb")
             if sc_log is None:
                 self.log.log(f"No log file found at {self.log_file_location}")
                 return
         except Exception as e:
             self.log.log(f"Error opening log file: {e.__class__.__name__} {e}")
         try:
-            self.log.log("Enter Kill Tracker Key to establish Servitor connection...")
-            sleep(1)
+            if not self.api.api_key["value"]:
+                self.log.log("Enter Kill Tracker Key to establish Servitor connection...")
             while self.monitoring["active"]:
                 # Block loop until API key is valid
                 if self.api.api_key["value"]:
                     break
                 sleep(1)
-            self.log.debug(
-                f"tail_log(): Received key: {self.api.api_key}. Moving on..."
-            )
+            self.log.debug("tail_log(): Received key: %s. Moving on...", self.api.api_key)
+            if not self.monitoring["active"]:
+                sc_log.close()
+                return
         except Exception as e:
             self.log.log(
                 f"Error waiting for Servitor connection to be established: {e.__class__.__name__} {e}"
             )
 
+        self.catch_up(sc_log)
+
+        watcher = make_watcher(self.log_file_location, self.watch_backend)
+        try:
+            self.follow_log(sc_log, watcher)
+        finally:
+            watcher.close()
+        self.log.info("Game log monitoring has stopped.")
+
+    def catch_up(self, sc_log) -> None:
+        """Replay what the log already holds, then announce that live tracking starts."""
         try:
             # Read all lines to find out what game mode player is currently, in case they booted up late.
             # Don't upload kills, we don't want repeating last session's kills in case they are actually available.
             self.log.info(
                 "Loading old log (if available)! Note that old kills shown will not be uploaded as they are stale."
             )
-            lines = sc_log.readlines()
-            for line in lines:
-                if not self.api.api_key["value"]:
-                    self.log.log("Error: key is invalid. Loading old log stopped.")
-                    break
-                self.read_log_line(line, False)
+            self.load_log(sc_log)
         except Exception as e:
             self.log.log(f"Error reading old log file: {e.__class__.__name__} {e}")
+            # never replay stale kills as live ones
+            sc_log.seek(0, 2)
 
         try:
-            # Main loop to monitor the log
-            last_log_file_size = stat(self.log_file_location).st_size
-            self.log.debug(f"tail_log(): Last log size: {last_log_file_size}.")
+            self.log.debug("tail_log(): Live tail from byte %s.", sc_log.tell())
             self.log.success("Kill Tracking initiated.")
             self.log.success("Go Forth And Slaughter...")
         except Exception as e:
-            self.log.log(f"Error getting log file size: {e.__class__.__name__} {e}")
-
+            self.log.log(f"Error getting log file position: {e.__class__.__name__} {e}")
+
+    def load_log(self, sc_log) -> None:
+        """
+        Bring parser state up to date with the existing log and seek sc_log to
+        where live tailing starts. When the log is the same file as at the last
+        checkpoint, only what was written after it is read.
+        """
+        start, state = 0, None
+        if self.checkpoint_path:
+            start, state = load_checkpoint(self.checkpoint_path, self.log_file_location)
+        upload_kills = False
+        if state is not None:
+            self.restore_state(state)
+            upload_kills = self.upload_missed_kills
+            self.log.info(f"Resuming game log from last checkpoint (byte {start}).")
+        offset = self.backfill_log(
+            self.log_file_location, start=start, upload_kills=upload_kills
+        )
+        sc_log.seek(offset)
+        self.save_checkpoint(offset)
+
+    def snapshot_state(self) -> dict:
+        """Parser state that the log has to be replayed to rebuild."""
+        return {
+            "game_mode": self.game_mode,
+            "active_ship": self.active_ship["current"],
+            "active_ship_id": self.active_ship_id,
+        }
+
+    def restore_state(self, state: dict) -> None:
+        self.game_mode = state["game_mode"]
+        self.active_ship["current"] = state["active_ship"]
+        self.active_ship_id = state["active_ship_id"]
+
+    def save_checkpoint(self, offset: int) -> None:
+        """Record that everything before `offset` has been handled."""
+        if not self.checkpoint_path:
+            return
+        try:
+            save_checkpoint(
+                self.checkpoint_path,
+                self.log_file_location,
+                offset,
+                self.snapshot_state(),
+            )
+        except OSError as e:
+            self.log.debug("save_checkpoint(): %s %s", e.__class__.__name__, e)
+
+    def follow_log(self, sc_log, watcher) -> None:
+        """
+        Live loop: hand every complete new line to the parser as soon as the
+        watcher reports a write, and reopen the log when the game replaces it.
+        Progress is checkpointed every CHECKPOINT_INTERVAL and right after an
+        upload, so a restart neither re-reads the log nor re-sends a kill.
+        """
+        tail = LiveTail(self, sc_log)
         while self.monitoring["active"]:
             try:
                 if not self.api.api_key["value"]:
-                    self.log.log(
-                        "Error: key is invalid. Kill Tracking is not active..."
-                    )
+                    self.log.warning("Key is invalid. Kill Tracking is not active...")
                     sleep(5)
                     continue
-                where = sc_log.tell()
-                line = sc_log.readline()
-                if not line:
-                    sleep(1)
-                    sc_log.seek(where)
-                    if last_log_file_size > stat(self.log_file_location).st_size:
-                        sc_log.close()
-                        sc_log = safe_open(self.log_file_location, "r")
-                        last_log_file_size = stat(self.log_file_location).st_size
-                else:
-                    self.read_log_line(line, True)
+                if tail.read():
+                    watcher.activity()
+                    continue
+                tail.checkpoint()
+                watcher.wait()
+                tail.reopen_if_replaced()
             except Exception as e:
-                self.log.log(f"Error reading game log file: {e.__class__.__name__} {e}")
-        self.log.info("Game log monitoring has stopped.")
+                self.log.error(
+                    "Error reading game log file: %s %s", e.__class__.__name__, e
+                )
+        tail.close()
+
+    def backfill_log(
+        self,
+        path,
+        start: int = 0,
+        upload_kills: bool = False,
+        chunk_size: int = BACKFILL_CHUNK_SIZE,
+    ) -> int:
+        """
+        Replay the existing log from byte `start`, streamed in fixed-size binary chunks.
+        Memory stays bounded by the chunk size no matter how big the log is.
+        Returns the byte offset just past the last complete line that was read.
+        """
+        with open(path, "rb") as raw:
+            raw.seek(start)
+            return start + self.backfill_stream(raw, upload_kills, chunk_size)
+
+    def backfill_stream(
+        self, raw, upload_kills: bool = False, chunk_size: int = BACKFILL_CHUNK_SIZE
+    ) -> int:
+        """
+        backfill_log over an open binary reader, e.g. a decompressing one.
+        Returns the number of bytes consumed up to the last complete line;
+        raises BackfillStopped if the key is cleared before the end.
+        """
+        reader = LineReader(chunk_size)
+        consumed = 0
+        while True:
+            if not self.api.api_key["value"]:
+                # the rest of the old log must not be taken for live lines
+                raise BackfillStopped("key is invalid. Loading old log stopped.")
+            n, start, end = reader.read(raw)
+            if not n:
+                break
+            consumed += n
+            self.metrics.incr("bytes_read", n)
+            if end > start:
+                self.read_log_block(reader.buffer, upload_kills, end, start)
+        if reader.lines_skipped:
+            self.metrics.incr("lines_skipped", reader.lines_skipped)
+        return consumed - reader.pending
 
     def read_log_line(self, line: str, upload_kills: bool):
+        """Dispatch a single log line to every handler whose marker it contains."""
+        slots = [slot for marker, slot in self.markers if marker in line]
+        if slots:
+            self.dispatch_line(line, slots, upload_kills)
+
+    def read_log_block(self, text, upload_kills: bool, size=None, first: int = 0) -> None:
+        """
+        Dispatch a block of complete log lines in one pass.
+        Each marker is located with a single C-level scan over the whole block,
+        so lines that carry no marker never reach Python code at all.
+        `text` may also be raw bytes or a bytearray, in which case only
+        matching lines are decoded. Only text[first:size] is read; `first`
+        must be 0 or just past a newline.
+        """
+        raw = not isinstance(text, str)
+        markers = self.byte_markers if raw else self.markers
+        newline = b"\n" if raw else "\n"
+        size = len(text) if size is None else size
+        hits = {}
+        find = text.find
+        for marker, slot in markers:
+            if slot == self.kill_slot and not upload_kills:
+                # kill lines are only acted on when uploading
+                continue
+            pos = find(marker, first, size)
+            while pos != -1:
+                start = text.rfind(newline, 0, pos) + 1
+                hits.setdefault(start, []).append(slot)
+                end = find(newline, pos, size)
+                if end == -1:
+                    break
+                pos = find(marker, end, size)
+        for start in sorted(hits):
+            end = find(newline, start, size)
+            end = size if end == -1 else end + 1
+            line = text[start:end]
+            if raw:
+                line = decode_line(line)
+            self.dispatch_line(line, sorted(hits[start]), upload_kills)
+
+    def dispatch_line(self, line: str, slots: list, upload_kills: bool) -> None:
+        """Run the matched handlers in table order, each at most once."""
+        last = -1
+        try:
+            for slot in slots:
+                if slot != last:
+                    self.metrics.incr(self.match_names[slot])
+                    self.line_handlers[slot][1](line, upload_kills)
+                    last = slot
+        except Exception as e:
+            self.metrics.incr("parse_errors")
+            # one malformed line must not take the rest of its block down with it
+            self.log.error(
+                "Error reading game log line: %s %s", e.__class__.__name__, e
+            )
+
+    def on_login(self, line: str, upload_kills: bool) -> None:
+        # a (re-)login names the RSI handle kills are attributed to
+        handle = parse_handle(line)
+        if handle != self.rsi_handle["current"]:
+            self.rsi_handle["current"] = handle
+            self.log.info(f"RSI handle: {handle}")
+            note_identity(self.log_file_location, handle=handle)
+
+    def on_character(self, line: str, upload_kills: bool) -> None:
+        # character status carries the player's GEID
+        geid = parse_geid(line)
+        if geid != self.player_geid["current"]:
+            self.player_geid["current"] = geid
+            self.log.debug("Player GEID: %s", geid)
+            note_identity(self.log_file_location, geid=geid)
+
+    def on_context_established(self, line: str, upload_kills: bool) -> None:
         # 0) always refresh game-mode
-        if "<Context Establisher Done>" in line:
-            self.set_game_mode(line)
+        self.set_game_mode(line)
 
+    def on_entity_enter_zone(self, line: str, upload_kills: bool) -> None:
         # 1) zone-enter (AC & PU)
-        if "OnEntityEnterZone" in line:
-            self.set_player_zone(line, use_jd=False)
+        self.set_player_zone(line, use_jd=False)
 
+    def on_jump_drive(self, line: str, upload_kills: bool) -> None:
         # 2) JumpDrive enter (AC FreeFlight ships)
-        if "<Jump Drive State Changed>" in line:
-            self.set_player_zone(line, use_jd=True)
-
-        # 3) direct respawn hook (some AC modes)
-        if (
-            "CPlayerShipRespawnManager::OnVehicleSpawned" in line
-            and self.game_mode != "SC_Default"
-            and self.player_geid["current"] in line
-        ):
+        self.set_player_zone(line, use_jd=True)
+
+    def on_vehicle_spawned(self, line: str, upload_kills: bool) -> None:
+        # 3) direct respawn hook (some AC modes); anyone's spawn names their ship
+        self.note_spawn(line)
+        if self.game_mode != "SC_Default" and self.player_geid["current"] in line:
             self.set_ac_ship(line)
 
+    def on_destruction(self, line: str, upload_kills: bool) -> None:
         # 4) destruction = you died → clear out
-        if (
-            "<Vehicle Destruction>" in line
-            or "<local client>: Entering control state dead" in line
-        ) and self.active_ship_id in line:
+        if self.active_ship_id in line:
             self.destroy_player_zone()
+        if "Vehicle '" in line:
+            code = ship_code(line.partition("Vehicle '")[2].split("'", 1)[0])
+            if code is not None:
+                self.entities.destroyed(code[1])
+        else:
+            self.entities.leave(self.player_geid["current"])
 
+    def on_kill(self, line: str, upload_kills: bool) -> None:
         # 5) finally, if it’s a kill line for you, send it
-        if (
-            upload_kills
-            and self.rsi_handle["current"] in line
-            and "CActor::Kill" in line
-        ):
-            self.log.debug(
-                f"→ kill fired; active_ship is '{self.active_ship['current']}'"
-            )
+        if upload_kills and self.rsi_handle["current"] in line:
+            self.log.debug("→ kill fired; active_ship is '%s'", self.active_ship["current"])
             kr = self.parse_kill_line(line, self.rsi_handle["current"])
-            if kr["result"] == "killer":
+            if kr.result == "killer":
                 # overwrite just in case:
-                kr["data"]["killers_ship"] = self.active_ship["current"]
-                self.log.debug(
-                    f"→ sending kill with ship = {kr['data']['killers_ship']}"
-                )
+                kr.killers_ship = self.active_ship["current"]
+                self.log.debug("→ sending kill with ship = %s", kr.killers_ship)
                 self.sounds.play_random_sound()
                 self.api.post_kill_event(kr)
-            elif kr["result"] in ("killed", "suicide"):
-                self.api.post_death_event(kr["data"])
+                self.events_posted += 1
+            elif kr.result in ("killed", "suicide"):
+                self.api.post_death_event(kr)
+                self.events_posted += 1
                 self.destroy_player_zone()
             ## WILL POSSIBLY USE LATER
             ##if kill_result["result"] in ("killed", "suicide"):
@@ -239,7 +479,7 @@ class LogParser:
     def set_game_mode(self, line: str) -> None:
         """Parse log for current active game mode."""
         split_line = line.split(" ")
-        curr_game_mode = split_line[8].split("=")[1].strip('"')
+        curr_game_mode = intern(split_line[8].split("=")[1].strip('"'))
         if curr_game_mode != self.game_mode:
             self.game_mode = curr_game_mode
         if self.game_mode == "SC_Default":
@@ -249,13 +489,25 @@ class LogParser:
     def set_ac_ship(self, line: str) -> None:
         """Parse log for current active ship."""
         self.active_ship["current"] = line.split(" ")[5][1:-1]
-        self.log.debug(f"Player has entered ship: {self.active_ship['current']}")
+        self.log.debug("Player has entered ship: %s", self.active_ship["current"])
+
+    def note_spawn(self, line: str) -> None:
+        """Record the spawned ship, and that the spawning player is in it."""
+        parts = line.split(" ")
+        if len(parts) < 6:
+            return
+        code = self.entities.note_name(parts[5][1:-1])
+        if code is not None and "by player " in line:
+            player = line.partition("by player ")[2].split(" ", 1)[0].strip()
+            self.entities.board(player, code[1])
 
     def destroy_player_zone(self) -> None:
         """Remove current active ship zone."""
         if self.active_ship["current"] != "N/A" or self.active_ship_id != "N/A":
             self.log.debug(
-                f"Ship Destroyed: {self.active_ship['current']} with ID: {self.active_ship_id}"
+                "Ship Destroyed: %s with ID: %s",
+                self.active_ship["current"],
+                self.active_ship_id,
             )
             self.active_ship["current"] = "N/A"
             self.active_ship_id = "N/A"
@@ -267,19 +519,19 @@ class LogParser:
         else:
             line_index = line.index("adam: ") + len("adam: ")
         if line_index < 0:
-            self.log.debug(f"Active Zone Change: {self.active_ship['current']}")
+            self.log.debug("Active Zone Change: %s", self.active_ship["current"])
             self.active_ship["current"] = "N/A"
             return
         potential_zone = line[line_index:].split(" ")[0].strip("[]'(")
-        for ship in self.global_ship_list:
-            if potential_zone.startswith(ship):
-                parts = potential_zone.rsplit("_", 1)
-                self.active_ship["current"], self.active_ship_id = parts[0], parts[1]
-                self.log.debug(
-                    f"Active Zone Change: {self.active_ship['current']} with ID: {self.active_ship_id}"
-                )
-                self.cm.post_heartbeat_enter_ship_event(self.active_ship["current"])
-                return
+        code = self.entities.note_name(potential_zone)
+        if code is not None:
+            self.active_ship["current"], self.active_ship_id = code
+            self.log.debug(
+                "Active Zone Change: %s with ID: %s",
+                self.active_ship["current"],
+                self.active_ship_id,
+            )
+            self.cm.post_heartbeat_enter_ship_event(self.active_ship["current"])
 
     def check_substring_list(self, line, substring_list: list) -> bool:
         """Check if any substring from the list is present in the given line."""
@@ -294,70 +546,58 @@ class LogParser:
         return True
 
     def parse_kill_line(self, line: str, curr_user: str):
+        kill = match_kill_line(line)
         # 0) filter out any NPC‐type kill/death
-        if any(
-            substr.lower() in line.lower() for substr in self.ignore_kill_substrings
-        ):
-            return {"result": "exclusion", "data": None}
+        if ignored_kill(kill, line):
+            return EXCLUSION
         try:
             if not self.check_exclusion_scenarios(line):
-                return {"result": "exclusion", "data": None}
-
-            # 1) split out time, actors, ships, damage
-            parts = line.split(" ")
-            kill_time = parts[0].strip("<>")
-            killed = parts[5].strip("'")
-            killed_geid = parts[6].strip("[]")
-            killed_zone = parts[9].strip("'")
-            killer = parts[12].strip("'")
-            weapon = parts[15].strip("'")
-            damage = parts[21].strip("'")
-
-            # 2) build common fields
-            rsi_profile = f"https://robertsspaceindustries.com/citizens/{killed}"
-
-            # 3) default both variables
+                return EXCLUSION
+            if kill is None:
+                raise ValueError("not a CActor::Kill line")
+
+            # 1) named fields: time, actors, ships, damage
+            kill_time = parse_time(line)
+            killed = kill["victim"]
+            killed_zone = kill["zone"]
+            killer = kill["killer"]
+            weapon = kill["weapon"]
+            damage = intern(kill["damage"])
+
+            # 2) default both variables (the profile URL is only built for upload)
             victim_ship = "N/A"
             data_zone = killed_zone
 
-            # 4) if it really is a ship code, override the defaults
-            if any(killed_zone.startswith(s) for s in self.global_ship_list):
-                victim_ship = killed_zone.rsplit("_", 1)[0]
+            # 4) if it really is a ship code, override the defaults;
+            # otherwise the victim may still be a ship we saw spawn or enter a zone
+            zone_ship = ship_code(killed_zone)
+            if zone_ship is not None:
+                victim_ship = intern(zone_ship[0])
                 data_zone = "N/A"
+            else:
+                victim_ship = self.entities.ship(kill["victim_geid"])
+            # a dead player respawns on foot or in a new ship
+            self.entities.leave(kill["victim_geid"])
 
             # 4) decide which kind of event it is
             if killed == killer:
-                return {
-                    "result": "suicide",
-                    "data": {
-                        "player": curr_user,
-                        "time": kill_time,
-                        "zone": killed_zone,
-                    },
-                }
+                return SuicideEvent(curr_user, kill_time, killed_zone)
 
             elif killed == curr_user:
-                return {
-                    "result": "killed",
-                    "data": {
-                        "killer": killer,
-                        "victim": curr_user,
-                        "time": kill_time,
-                        "zone": killed_zone,
-                        "weapon": weapon,
-                        "damage_type": damage,
-                        "rsi_profile": f"https://robertsspaceindustries.com/citizens/{killer}",
-                        "game_mode": self.game_mode,
-                        "mode": (
-                            "ac-kill" if self.game_mode.startswith("EA_") else "pu-kill"
-                        ),
-                        "killers_ship": "N/A",
-                        "victim_ship": victim_ship,
-                    },
-                }
+                return DeathEvent(
+                    killer=killer,
+                    victim=curr_user,
+                    time=kill_time,
+                    zone=killed_zone,
+                    weapon=weapon,
+                    damage_type=damage,
+                    game_mode=self.game_mode,
+                    victim_ship=victim_ship,
+                    killers_ship=self.entities.ship(kill["killer_geid"]),
+                )
 
             elif killer.lower() == "unknown":
-                return {"result": "reset", "data": {}}
+                return RESET
 
             else:
                 # 5) it’s a kill you made — pick your ship unless you’re in FPS mode
@@ -366,46 +606,88 @@ class LogParser:
                 else:
                     killers_ship = self.active_ship["current"]
 
-                return {
-                    "result": "killer",
-                    "data": {
-                        "player": curr_user,
-                        "victim": killed,
-                        "time": kill_time,
-                        "zone": data_zone,
-                        "weapon": weapon,
-                        "damage_type": damage,
-                        "rsi_profile": rsi_profile,
-                        "game_mode": self.game_mode,
-                        "mode": (
-                            "ac-kill" if self.game_mode.startswith("EA_") else "pu-kill"
-                        ),
-                        "client_ver": self.local_version,
-                        "killers_ship": killers_ship,
-                        "victim_ship": victim_ship,
-                        "anonymize_state": self.anonymize_state,
-                    },
-                }
+                return KillEvent(
+                    player=curr_user,
+                    victim=killed,
+                    time=kill_time,
+                    zone=data_zone,
+                    weapon=weapon,
+                    damage_type=damage,
+                    game_mode=self.game_mode,
+                    client_ver=self.local_version,
+                    killers_ship=killers_ship,
+                    victim_ship=victim_ship,
+                    anonymize_state=self.anonymize_state,
+                )
 
         except Exception as e:
-            self.log.log(f"parse_kill_line(): Error: {e}")
-            return {"result": "error", "data": None}
+            self.metrics.incr("parse_errors")
+            self.log.error("parse_kill_line(): Error: %s", e)
+            return PARSE_ERROR
 
     def find_rsu_handle(self) -> str:
         """Get the current user's RSI handle."""
-        acct_str = "<Legacy login response> [CIG-net] User Login Success"
-        with safe_open(self.log_file_location, "r") as sc_log:
-            for line in sc_log:
-                if acct_str in line:
-                    idx = line.index("Handle[") + len("Handle[")
-                    handle = line[idx:].split(" ")[0].rstrip("]")
-                    return handle
-        return ""
+        return find_identity(self.log_file_location)[0] or ""
 
     def find_rsi_geid(self) -> str:
         """Get the current user's GEID."""
-        acct_kw = "AccountLoginCharacterStatus_Character"
-        with safe_open(self.log_file_location, "r") as sc_log:
-            for line in sc_log:
-                if acct_kw in line:
-                    return line.split(" ")[11]
+        return find_identity(self.log_file_location)[1]
+
+
+class LiveTail:
+    """
+    Where one parser's live tail stands: the open log, the partial line
+    after the last newline, and when progress was last checkpointed.
+    LogParser.follow_log drives one; MultiTail drives many from one thread.
+    """
+
+    def __init__(self, parser, sc_log):
+        self.parser = parser
+        self.sc_log = sc_log
+        self.reader = LineReader(BACKFILL_CHUNK_SIZE)
+        self.dirty = False
+        self.last_save = monotonic()
+        self.posted = parser.events_posted
+
+    def read(self) -> bool:
+        """Hand the next chunk's complete lines to the parser; False at end of file."""
+        parser = self.parser
+        sc_log = self.sc_log
+        reader = self.reader
+        skipped = reader.lines_skipped
+        n, start, end = reader.read(sc_log)
+        if not n:
+            return False
+        parser.metrics.incr("bytes_read", n)
+        parser.metrics.set(parser.lag_gauge, os.fstat(sc_log.fileno()).st_size - sc_log.tell())
+        if reader.lines_skipped != skipped:
+            parser.metrics.incr("lines_skipped", reader.lines_skipped - skipped)
+        if end > start:
+            # a full pass over the data, so lines are counted on the live tail only
+            parser.metrics.incr("lines_read", reader.buffer.count(b"\n", start, end))
+            parser.read_log_block(reader.buffer, True, end, start)
+            self.dirty = True
+        if self.dirty and (
+            self.posted != parser.events_posted
+            or monotonic() - self.last_save >= CHECKPOINT_INTERVAL
+        ):
+            self.checkpoint()
+        return True
+
+    def checkpoint(self) -> None:
+        """Save progress if anything was parsed since the last save."""
+        if self.dirty:
+            self.parser.save_checkpoint(self.sc_log.tell() - self.reader.pending)
+            self.dirty, self.last_save, self.posted = False, monotonic(), self.parser.events_posted
+        self.parser.metrics.set(self.parser.lag_gauge, 0)
+
+    def reopen_if_replaced(self) -> None:
+        if log_replaced(self.parser.log_file_location, self.sc_log):
+            self.parser.log.debug("tail_log(): Game log was replaced, reopening.")
+            self.sc_log.close()
+            self.sc_log = open(self.parser.log_file_location, "rb")
+            self.reader.reset()
+
+    def close(self) -> None:
+        self.checkpoint()
+        self.sc_log.close()
@@ -0,0 +1,153 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from time import monotonic, sleep
+
+# inotify(7) flags
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+_EVENT = struct.Struct("iIII")
+
+# Longest a watcher blocks before handing control back to the tail loop,
+# so it can notice a stop request or a replaced file.
+IDLE_TIMEOUT = 2.0
+
+
+def file_identity(st) -> tuple:
+    """Identity of an open or named file: (device, inode). NTFS fills both too."""
+    return (st.st_dev, st.st_ino)
+
+
+def log_replaced(path, handle) -> bool:
+    """
+    True when `path` no longer names the file behind `handle`, or was
+    truncated below the handle's read position.
+    """
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        # mid-rotation; keep draining the old handle until the new file shows up
+        return False
+    if file_identity(current) != file_identity(os.fstat(handle.fileno())):
+        return True
+    return current.st_size < handle.tell()
+
+
+class PollingWatcher:
+    """Sleep-based fallback that backs off while the log is idle."""
+
+    def __init__(self, path, min_interval=0.05, max_interval=1.0):
+        self.path = path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+
+    def add(self, path) -> None:
+        """Polling covers every file the caller reads; nothing to register."""
+
+    def changed(self) -> set:
+        """Polling never knows which file changed; callers check each on a schedule."""
+        return set()
+
+    def activity(self) -> None:
+        """New data was read; poll quickly again."""
+        self.interval = self.min_interval
+
+    def wait(self, timeout: float = IDLE_TIMEOUT) -> None:
+        sleep(min(self.interval, timeout))
+        self.interval = min(self.interval * 2, self.max_interval)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """
+    Wakes up as soon as the kernel reports a write to, or replacement of,
+    the log, or of any log added later; one descriptor serves them all.
+    """
+
+    def __init__(self, path):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # watch descriptor -> {name: path} of the logs in that directory
+        self.names = {}
+        # paths written to or replaced since the last changed()
+        self.hits = set()
+        try:
+            self.add(path)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def add(self, path) -> None:
+        # Watch the directory, not the file, so a new Game.log is seen as well.
+        directory, name = os.path.split(os.path.abspath(path))
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.names.setdefault(wd, {})[os.fsencode(name)] = os.path.abspath(path)
+
+    def changed(self) -> set:
+        """Absolute paths of the logs written to or replaced since the last call."""
+        hits, self.hits = self.hits, set()
+        return hits
+
+    def activity(self) -> None:
+        pass
+
+    def wait(self, timeout: float = IDLE_TIMEOUT) -> None:
+        deadline = monotonic() + timeout
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready or self._drain():
+                return
+
+    def _drain(self) -> bool:
+        """Consume queued events; True if any of them concerned a watched log."""
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        hit = False
+        offset = 0
+        while offset < len(buf):
+            wd, _, _, length = _EVENT.unpack_from(buf, offset)
+            start = offset + _EVENT.size
+            path = self.names.get(wd, {}).get(buf[start : start + length].rstrip(b"\0"))
+            if path is not None:
+                self.hits.add(path)
+                hit = True
+            offset = start + length
+        return hit
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def make_watcher(path, backend: str = "auto"):
+    """Pick the best watcher for this platform: inotify on Linux, polling elsewhere."""
+    if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path)
+        except (OSError, AttributeError):
+            if backend == "inotify":
+                raise
+    return PollingWatcher(path)
@@ -1,26 +1,29 @@
 import os
 import json
-import psutil
-import requests
 import threading
-import webbrowser
 import customtkinter
 import tkinter as tk
 import tkinter.font as tkFont
-from tkinter import scrolledtext
-from tkinter import messagebox
 import sys
-from packaging import version
 import time
 import datetime
-from PIL import Image, ImageTk
 from datetime import datetime, timedelta
 import re
 from typing import Dict
 from config import BACKEND_URL, API_KEY, VALIDATE_URL, REPORT_KILL_URL, REPORT_DEATH_URL
-from log_parser import LogParser
+from multi_tail import MultiTail
+from entities import SHIP_MANUFACTURERS
+from identity import find_identity
+from kill_line import IGNORE_KILL_SUBSTRINGS
 from api_client import APIClient
-from helpers import play_kill_sound, resource_path
+from event_logger import DEBUG, INFO, EventLogger
+from metrics import metrics, panel_text, serve
+from helpers import resource_path
+from process_locator import GameWatcher, find_game_log_in_directory, find_game_logs, locator
+from startup import StartupPipeline
+from sound_player import KillSoundPlayer
+from response_cache import ResponseCache, cached_key_valid, check_key, conditional_get, revalidate_key
+from version import CLIENT_VERSION
 
 
 class NullCM:
@@ -32,8 +35,11 @@ class NullCM:
 
 
 # ─── Version & globals ──────────────────────────────────────────────────────────
-local_version = "7.0"
+# 3R_Transparent.png scaled to BANNER_SIZE with LANCZOS, so launches skip the resample
+BANNER_ASSET = "3R_Transparent_banner.png"
+BANNER_SIZE = (179, 146)
 api_key = {"value": None}
+response_cache = ResponseCache()
 
 global_game_mode = "Nothing"
 global_active_ship = "N/A"
@@ -42,25 +48,7 @@ global_player_geid = "N/A"
 global_active_zone = "Unknown"
 
 
-global_ship_list = [
-    "DRAK",
-    "ORIG",
-    "AEGS",
-    "ANVL",
-    "CRUS",
-    "BANU",
-    "MISC",
-    "KRIG",
-    "XNAA",
-    "ARGO",
-    "VNCL",
-    "ESPR",
-    "RSI",
-    "CNOU",
-    "GRIN",
-    "TMBL",
-    "GAMA",
-]
+global_ship_list = SHIP_MANUFACTURERS
 
 SHIP_RX = re.compile(r"([A-Z0-9]+_[A-Za-z0-9]+)_\d+")
 ON_SPAWN_RX = re.compile(r"OnVehicleSpawned.*?\(([^)]+)\)\s*by player\s*(\d+)")
@@ -98,24 +86,15 @@ def safe_open(path, mode="r"):
 
 
 def find_rsi_handle(log_file_location):
-    acct_str = "<Legacy login response> [CIG-net] User Login Success"
-    with safe_open(log_file_location, "r") as sc_log:
-        for line in sc_log:
-            if acct_str in line:
-                idx = line.index("Handle[") + len("Handle[")
-                return line[idx:].split(" ")[0].rstrip("]")
-    return None
+    return find_identity(log_file_location)[0]
 
 
 def find_rsi_geid(log_file_location):
     global global_player_geid
-    acct_kw = "AccountLoginCharacterStatus_Character"
-    with safe_open(log_file_location, "r") as sc_log:
-        for line in sc_log:
-            if acct_kw in line:
-                global_player_geid = line.split(" ")[11]
-                return global_player_geid
-    return None
+    geid = find_identity(log_file_location)[1]
+    if geid is not None:
+        global_player_geid = geid
+    return geid
 
 
 def resource_path(rel):
@@ -127,75 +106,35 @@ def resource_path(rel):
 
 
 def check_for_updates():
+    from packaging import version
+
     url = "https://api.github.com/repos/martinmedic/BeowulfHunterPy/releases/latest"
     try:
-        r = requests.get(url, headers={"User-Agent": "Killtracker/1.1"}, timeout=5)
-        if r.status_code == 200:
-            data = r.json()
+        # cached for a few hours, then revalidated with the release's ETag
+        status, data = conditional_get(
+            response_cache, url, headers={"User-Agent": "Killtracker/1.1"}
+        )
+        if status == 200:
             remote = data.get("tag_name", "v0").lstrip("v")
             link = data.get("html_url", "")
-            if version.parse(local_version) < version.parse(remote):
+            if version.parse(CLIENT_VERSION) < version.parse(remote):
                 return f"Update available: {remote}. Download here: {link}"
     except Exception:
         pass
     return None
 
 
-class EventLogger:
-    def __init__(self, widget):
-        self.w = widget
-
-    def log(self, m):
-        self.w.configure(state=tk.NORMAL)
-        self.w.insert(tk.END, m + "\n")
-        self.w.configure(state=tk.DISABLED)
-        self.w.see(tk.END)
-
-    # alias the other levels back to .log()
-    def debug(self, m):
-        self.log(f"[DEBUG] {m}")
-
-    def info(self, m):
-        self.log(f"[INFO] {m}")
-
-    def warning(self, m):
-        self.log(f"[WARNING] {m}")
-
-    def error(self, m):
-        self.log(f"[ERROR] {m}")
-
-    def success(self, m):
-        self.log(f"[SUCCESS] {m}")
-
-
 def show_loading_animation(logger, app):
     for dots in [".", "..", "..."]:
         logger.log(dots)
+        logger.flush()
         app.update_idletasks()
         time.sleep(0.2)
 
 
 def check_if_process_running(process_name):
     """Check if a process is running by name."""
-    for proc in psutil.process_iter(["pid", "name", "exe"]):
-        if process_name.lower() in proc.info["name"].lower():
-            return proc.info["exe"]
-    return None
-
-
-def find_game_log_in_directory(directory):
-    """Search for Game.log in the directory and its parent directory."""
-    game_log_path = os.path.join(directory, "Game.log")
-    if os.path.exists(game_log_path):
-        print(f"Found Game.log in: {directory}")
-        return game_log_path
-    # If not found in the same directory, check the parent directory
-    parent_directory = os.path.dirname(directory)
-    game_log_path = os.path.join(parent_directory, "Game.log")
-    if os.path.exists(game_log_path):
-        print(f"Found Game.log in parent directory: {parent_directory}")
-        return game_log_path
-    return None
+    return locator.find(process_name)
 
 
 def set_sc_log_location():
@@ -231,17 +170,8 @@ def set_sc_log_location():
         return None
 
 
-# Substrings to ignore
-ignore_kill_substrings = [
-    "PU_Pilots",
-    "NPC_Archetypes",
-    "PU_Human",
-    "kopion",
-    "marok",
-    "vlk_juvenile_",
-    "vlk_adult_",
-    "Quasigrazer",
-]
+# Substrings to ignore; the same set LogParser filters kills with
+ignore_kill_substrings = IGNORE_KILL_SUBSTRINGS
 
 
 def check_substring_list(line, substring_list):
@@ -264,19 +194,21 @@ def check_exclusion_scenarios(line, logger):
 
 # ─── Key validation ─────────────────────────────────────────────────────────────
 def validate_api_key(key: str) -> bool:
+    """Hit GET /keys/validate with Bearer <key>."""
+    return bool(check_key(key, response_cache, VALIDATE_URL))
+
+
+def recheck_api_key(key: str) -> None:
     """
-    Hit GET /keys/validate with Bearer <key>.
+    Re-check in the background a key that was trusted from the cache.
+    Called once the key is active, so a revocation found by the re-check
+    always reaches it.
     """
-    headers = {
-        "Authorization": f"Bearer {key}",
-        "Content-Type": "application/json",
-    }
-    try:
-        r = requests.get(VALIDATE_URL, headers=headers, timeout=5)
-        return r.status_code in (200, 201)
-    except Exception as e:
-        print("Key validation error:", e)
-        return False
+    threading.Thread(
+        target=revalidate_key,
+        args=(api_key, key, response_cache, VALIDATE_URL),
+        daemon=True,
+    ).start()
 
 
 def save_api_key(key: str):
@@ -330,16 +262,24 @@ def get_player_name(log_file_location):
     return rsi_handle
 
 
-# ─── Play sound on kill ──────────────────────────────────────────────────────
-class SoundsAdapter:
-    def __init__(self, logger):
-        self.log = logger
+def load_banner_image():
+    """
+    The banner at display size. Tk reads the pre-scaled PNG itself; Pillow is
+    only imported to scale the full-size logo if that asset is missing.
+    """
+    banner_path = resource_path(os.path.join("assets", BANNER_ASSET))
+    if os.path.exists(banner_path):
+        return tk.PhotoImage(file=banner_path)
+    from PIL import Image, ImageTk
 
-    def play_random_sound(self):
-        play_kill_sound()
+    original_image = Image.open(resource_path(os.path.join("assets", "3R_Transparent.png")))
+    return ImageTk.PhotoImage(original_image.resize(BANNER_SIZE, Image.Resampling.LANCZOS))
 
 
-def setup_gui(game_running):
+def setup_gui(startup):
+    # network first, so the update check runs while the window is built
+    update_check = startup.submit("update check", check_for_updates)
+
     app = tk.Tk()
     app.title("RRRthur Tracker")
     app.geometry("650x450")
@@ -367,24 +307,22 @@ def setup_gui(game_running):
 
     # Add Banner
     try:
-        banner_path = resource_path(os.path.join("assets", "3R_Transparent.png"))
-        original_image = Image.open(banner_path)
-
-        # Resize to 50% of original size (or change to specific size like (600, 150))
-        resized_image = original_image.resize((179, 146), Image.Resampling.LANCZOS)
-
-        banner_image = ImageTk.PhotoImage(resized_image)
+        banner_image = load_banner_image()
         banner_label = tk.Label(app, image=banner_image, bg="#1a1a1a")
         banner_label.image = banner_image
         banner_label.pack(pady=(0, 10))
     except Exception as e:
         print(f"Error loading banner image: {e}")
 
-    # Check for Updates
-    update_message = check_for_updates()
-    if update_message:
+    # Check for Updates; the message shows up here when the check comes back
+    update_frame = tk.Frame(app, bg="#1a1a1a")
+    update_frame.pack()
+
+    def show_update_message(update_message):
+        if not update_message:
+            return
         update_label = tk.Label(
-            app,
+            update_frame,
             text=update_message,
             font=("Times New Roman", 12),
             fg="#ff5555",
@@ -396,6 +334,8 @@ def setup_gui(game_running):
         update_label.pack(pady=(10, 10))
 
         def open_github(event):
+            import webbrowser
+
             try:
                 url = update_message.split("Download it here: ")[-1]
                 webbrowser.open(url)
@@ -404,183 +344,210 @@ def setup_gui(game_running):
 
         update_label.bind("<Button-1>", open_github)
 
-    if game_running:
-        # API Key Input
-        key_frame = tk.Frame(app, bg="#1a1a1a")
-        key_frame.pack(pady=(10, 10))
+    startup.then(update_check, show_update_message)
 
-        key_label = tk.Label(
-            key_frame,
-            text="Enter Key:",
-            font=("Times New Roman", 12),
-            fg="#ffffff",
-            bg="#1a1a1a",
-        )
-        key_label.pack(side=tk.LEFT, padx=(0, 5))
-
-        # key_entry = tk.Entry(key_frame, width=30, font=("Times New Roman", 12))
-        key_entry = customtkinter.CTkEntry(
-            master=key_frame,
-            width=250,
-            height=30,
-            corner_radius=10,
-            placeholder_text="Enter Key",
-            font=("Orbitron", 12),
-            fg_color="#0a0a0a",
-            text_color="#ffffff",
-            border_color="#1501ae",
-            border_width=2,
-        )
-        key_entry.pack(side=tk.LEFT)
+    # API Key Input
+    key_frame = tk.Frame(app, bg="#1a1a1a")
+    key_frame.pack(pady=(10, 10))
 
-        # API Status Label
-        api_status_label = tk.Label(
-            app,
-            text="API Status: Not Validated",
-            font=("Times New Roman", 12),
-            fg="#ffffff",
-            bg="#1a1a1a",
-        )
-        api_status_label.pack(pady=(10, 10))
-
-        # Activate API Key
-        def activate_key():
-            entered_key = key_entry.get().strip()
-            if not entered_key:
-                logger.log("No key entered. Please input a valid key.")
-                api_status_label.config(text="API Status: Invalid", fg="red")
-                return
-
-            log_file_location = set_sc_log_location()
-            if not log_file_location:
-                logger.log("Log file location not found.")
-                api_status_label.config(text="API Status: Error", fg="yellow")
-                return
-
-            player_name = get_player_name(log_file_location)
-            if not player_name:
-                logger.log(
-                    "RSI Handle not found. Please ensure the game is running and the log file is accessible."
-                )
-                api_status_label.config(text="API Status: Error", fg="yellow")
-                return
-
-            # Now validate
-            if validate_api_key(entered_key):
-                # success path
-                save_api_key(entered_key)
-                logger.log("Key activated and saved. Servitor connection established.")
-                api_status_label.config(text="API Status: Valid", fg="green")
-
-                # start a 72h countdown
-                expires_at = datetime.utcnow() + timedelta(hours=72)
-                start_api_key_countdown(expires_at, api_status_label)
-            else:
-                # failure path
-                logger.log("Invalid key. Please enter a valid API key.")
-                api_status_label.config(text="API Status: Invalid", fg="red")
-
-        button_style = customtkinter.CTkButton(
-            master=key_frame,
-            text="Activate",
-            command=activate_key,
-            width=100,
-            height=30,
-            corner_radius=10,
-            fg_color="#0f0f0f",  # Background
-            text_color="#008628",  # Text color
-            hover_color="#b1adc3",  # Hover background
-            font=("Orbitron", 12),
-            border_color="#1501ae",
-            border_width=2,
-        )
-        button_style.pack(side=tk.LEFT, padx=(5, 0))
-
-        # Load Existing Key
-        def load_existing_key():
-            try:
-                with safe_open("killtracker_key.cfg", "r") as f:
-                    info = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                logger.log("No existing key found. Please enter a valid key.")
-                api_status_label.config(text="API Status: Invalid", fg="red")
-                return
-
-            entered_key = info.get("key")
-            expires_at_str = info.get("expires_at")
-            if not entered_key or not expires_at_str:
-                logger.log("Invalid key file. Please enter a new key.")
-                api_status_label.config(text="API Status: Invalid", fg="red")
-                return
-
-            if not validate_api_key(entered_key):
-                logger.log("Invalid key. Please input a valid key.")
-                api_status_label.config(text="API Status: Invalid", fg="red")
-                return
-
-            # success!
-            api_key["value"] = entered_key
-            logger.log(
-                f"Existing key loaded: {entered_key}. Servitor connection established."
-            )
+    key_label = tk.Label(
+        key_frame,
+        text="Enter Key:",
+        font=("Times New Roman", 12),
+        fg="#ffffff",
+        bg="#1a1a1a",
+    )
+    key_label.pack(side=tk.LEFT, padx=(0, 5))
+
+    # key_entry = tk.Entry(key_frame, width=30, font=("Times New Roman", 12))
+    key_entry = customtkinter.CTkEntry(
+        master=key_frame,
+        width=250,
+        height=30,
+        corner_radius=10,
+        placeholder_text="Enter Key",
+        font=("Orbitron", 12),
+        fg_color="#0a0a0a",
+        text_color="#ffffff",
+        border_color="#1501ae",
+        border_width=2,
+    )
+    key_entry.pack(side=tk.LEFT)
+
+    # API Status Label
+    api_status_label = tk.Label(
+        app,
+        text="API Status: Not Validated",
+        font=("Times New Roman", 12),
+        fg="#ffffff",
+        bg="#1a1a1a",
+    )
+    api_status_label.pack(pady=(10, 10))
+
+    # Activate API Key
+    # the lookups and the round-trip run in the background, the result is applied here
+    def check_entered_key(entered_key):
+        log_file_location = set_sc_log_location()
+        if not log_file_location:
+            return "Log file location not found."
+
+        player_name = get_player_name(log_file_location)
+        if not player_name:
+            return "RSI Handle not found. Please ensure the game is running and the log file is accessible."
+
+        # Now validate
+        return validate_api_key(entered_key)
+
+    def apply_entered_key(entered_key, result):
+        if isinstance(result, str):
+            logger.log(result)
+            api_status_label.config(text="API Status: Error", fg="yellow")
+        elif result:
+            # success path
+            save_api_key(entered_key)
+            logger.log("Key activated and saved. Servitor connection established.")
             api_status_label.config(text="API Status: Valid", fg="green")
 
-            expires_at = datetime.fromisoformat(info["expires_at"].rstrip("Z"))
+            # start a 72h countdown
+            expires_at = datetime.utcnow() + timedelta(hours=72)
             start_api_key_countdown(expires_at, api_status_label)
-
-        load_key_button = customtkinter.CTkButton(
-            master=key_frame,
-            text="Load Existing Key",
-            command=load_existing_key,
-            width=150,
-            height=30,
-            corner_radius=10,
-            fg_color="#0f0f0f",
-            text_color="#008628",
-            hover_color="#b1adc3",
-            font=("Orbitron", 12),
-            border_color="#1501ae",
-            border_width=2,
-        )
-        load_key_button.pack(side=tk.LEFT, padx=(5, 0))
-
-        # Log Display
-        log_frame = customtkinter.CTkFrame(master=app, fg_color="transparent")
-        log_frame.pack(padx=10, pady=10)
-
-        # Textbox
-        text_area = customtkinter.CTkTextbox(
-            master=log_frame,
-            width=600,
-            height=250,
-            corner_radius=10,
-            fg_color="#121212",  # Background
-            text_color="#0086ff",  # Blue text
-            font=("Orbitron", 12),
-            border_color="#1501ae",
-            border_width=2,
-            wrap="word",
+        else:
+            # failure path
+            logger.log("Invalid key. Please enter a valid API key.")
+            api_status_label.config(text="API Status: Invalid", fg="red")
+
+    def activate_key():
+        entered_key = key_entry.get().strip()
+        if not entered_key:
+            logger.log("No key entered. Please input a valid key.")
+            api_status_label.config(text="API Status: Invalid", fg="red")
+            return
+        startup.then(
+            startup.submit("activate key", check_entered_key, entered_key),
+            lambda result: apply_entered_key(entered_key, result),
         )
-        text_area._textbox.configure(yscrollcommand=lambda *args: None)
 
-        text_area.configure(state="disabled")
-        text_area.pack(side="left", fill="both", expand=True)
+    button_style = customtkinter.CTkButton(
+        master=key_frame,
+        text="Activate",
+        command=activate_key,
+        width=100,
+        height=30,
+        corner_radius=10,
+        fg_color="#0f0f0f",  # Background
+        text_color="#008628",  # Text color
+        hover_color="#b1adc3",  # Hover background
+        font=("Orbitron", 12),
+        border_color="#1501ae",
+        border_width=2,
+    )
+    button_style.pack(side=tk.LEFT, padx=(5, 0))
+
+    # Load Existing Key: read and validated in the background, then applied here.
+    # Returns (info, trusted from the cache, problem).
+    def check_saved_key():
+        try:
+            with safe_open("killtracker_key.cfg", "r") as f:
+                info = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None, False, "No existing key found. Please enter a valid key."
+
+        entered_key = info.get("key")
+        expires_at_str = info.get("expires_at")
+        try:
+            expires_at = datetime.fromisoformat(expires_at_str.rstrip("Z"))
+        except (AttributeError, TypeError, ValueError):
+            expires_at = None
+        if not entered_key or not expires_at:
+            return None, False, "Invalid key file. Please enter a new key."
+
+        # a key the backend accepted before is trusted without the round-trip
+        cached = cached_key_valid(response_cache, entered_key, expires_at)
+        if not cached and not validate_api_key(entered_key):
+            return None, False, "Invalid key. Please input a valid key."
+        return info, cached, None
+
+    def apply_saved_key(result):
+        info, cached, problem = result
+        if problem:
+            logger.log(problem)
+            api_status_label.config(text="API Status: Invalid", fg="red")
+            return
+
+        # success!
+        entered_key = info["key"]
+        api_key["value"] = entered_key
+        logger.log(
+            f"Existing key loaded: {entered_key}. Servitor connection established."
+        )
+        api_status_label.config(text="API Status: Valid", fg="green")
+        if cached:
+            recheck_api_key(entered_key)
+
+        expires_at = datetime.fromisoformat(info["expires_at"].rstrip("Z"))
+        start_api_key_countdown(expires_at, api_status_label)
+
+    def load_existing_key():
+        startup.then(startup.submit("saved key", check_saved_key), apply_saved_key)
+
+    load_key_button = customtkinter.CTkButton(
+        master=key_frame,
+        text="Load Existing Key",
+        command=load_existing_key,
+        width=150,
+        height=30,
+        corner_radius=10,
+        fg_color="#0f0f0f",
+        text_color="#008628",
+        hover_color="#b1adc3",
+        font=("Orbitron", 12),
+        border_color="#1501ae",
+        border_width=2,
+    )
+    load_key_button.pack(side=tk.LEFT, padx=(5, 0))
+
+    # Log Display
+    log_frame = customtkinter.CTkFrame(master=app, fg_color="transparent")
+    log_frame.pack(padx=10, pady=10)
+
+    # Textbox
+    text_area = customtkinter.CTkTextbox(
+        master=log_frame,
+        width=600,
+        height=250,
+        corner_radius=10,
+        fg_color="#121212",  # Background
+        text_color="#0086ff",  # Blue text
+        font=("Orbitron", 12),
+        border_color="#1501ae",
+        border_width=2,
+        wrap="word",
+    )
+    text_area._textbox.configure(yscrollcommand=lambda *args: None)
 
-        logger = EventLogger(text_area)
+    text_area.configure(state="disabled")
+    text_area.pack(side="left", fill="both", expand=True)
 
-    else:
-        # Relaunch Message
-        message_label = tk.Label(
-            app,
-            text="You must launch Star Citizen before starting the tracker.\n\nPlease close this window, launch Star Citizen, and relaunch RRRthur Tracker. ",
-            font=("Times New Roman", 14),
-            fg="#ff4444",
-            bg="#1a1a1a",
-            wraplength=700,
-            justify="center",
-        )
-        message_label.pack(pady=(50, 10))
-        logger = None
+    # Stats panel: throughput, marker matches, errors and upload latency
+    stats_label = tk.Label(
+        app,
+        text="",
+        font=("Times New Roman", 10),
+        fg="#bcbcd8",
+        bg="#1a1a1a",
+        justify="left",
+    )
+    stats_label.pack(pady=(0, 10))
+    show_stats(stats_label)
+
+    # DEBUG_MODE=1 shows debug lines; KILLTRACKER_LOG_FILE also writes a rotating file
+    logger = EventLogger(
+        text_area,
+        level=DEBUG if os.environ.get("DEBUG_MODE") else INFO,
+        log_file=os.environ.get("KILLTRACKER_LOG_FILE"),
+    )
+    # a key saved by an earlier run is picked up without a click
+    load_existing_key()
 
     # Footer
     footer = tk.Frame(app, bg="#3e3b4d", height=50)
@@ -597,6 +564,7 @@ def setup_gui(game_running):
     )
     footer_text.pack(padx=10, pady=5, fill="x")
 
+    startup.attach(app, logger)
     return app, logger
 
 
@@ -622,41 +590,78 @@ def start_api_key_countdown(expiration_time: datetime, api_status_label):
     countdown()
 
 
+def show_stats(stats_label):
+    """
+    Refresh the stats panel from the shared metrics once a second.
+    """
+    previous = {"snapshot": None}
+
+    def refresh():
+        snapshot = metrics.snapshot()
+        stats_label.config(text=panel_text(snapshot, previous["snapshot"]))
+        previous["snapshot"] = snapshot
+        stats_label.after(1000, refresh)
+
+    refresh()
+
+
 if __name__ == "__main__":
-    # 1) launch GUI & get logger
-    app, logger = setup_gui(is_game_running())
+    # 1) launch GUI & get logger; the tracker is shown even before the game
+    # starts, the game watcher below attaches to it once it is up
+    startup = StartupPipeline()
+    app, logger = setup_gui(startup)
+    # Game.log discovery and the identity scans run on the game watcher's
+    # thread below, alongside the update check and key validation
+    startup.then(
+        startup.submit("game check", is_game_running),
+        lambda running: running or logger.log("Waiting for Star Citizen to start..."),
+    )
 
-    # 2) find the SC log file
-    log_file_location = set_sc_log_location()
-    if not log_file_location:
-        app.mainloop()
-        sys.exit(0)
+    if os.environ.get("KILLTRACKER_EXIT_AFTER_PAINT"):
+        # for bench_startup.py: report time to interactive and quit
+        def report_first_paint():
+            print("interactive", json.dumps(startup.timings), flush=True)
+            app.destroy()
 
-    # 3) grab your RSI handle & GEID
-    rsi_handle = find_rsi_handle(log_file_location)
-    find_rsi_geid(log_file_location)
-    player_geid = global_player_geid
+        app.after_idle(report_first_paint)
 
-    # 4) wire up support modules
-    api = APIClient(api_key)
-    sounds = SoundsAdapter(logger)  # <— only here, after logger exists
+    # KILLTRACKER_STATS_PORT serves the stats panel's numbers as JSON on localhost
+    if os.environ.get("KILLTRACKER_STATS_PORT"):
+        serve(metrics, int(os.environ["KILLTRACKER_STATS_PORT"]))
+
+    # 2) wire up support modules
+    api = APIClient(api_key, logger)
+    sounds = KillSoundPlayer(logger)  # <— only here, after logger exists
     cm = NullCM()
 
-    # 5) start the unified LogParser
-    monitoring = {"active": True}
-    parser = LogParser(
-        gui_module=logger,
-        api_client_module=api,
-        sound_module=sounds,
-        cm_module=cm,
-        local_version=local_version,
-        monitoring=monitoring,
-        rsi_handle={"current": rsi_handle},
-        player_geid={"current": player_geid},
-        active_ship={"current": global_active_ship},
-        anonymize_state=False,
-    )
-    parser.log_file_location = log_file_location
-    parser.start_tail_log_thread()
+    # 3) one LogParser per Game.log (LIVE, PTU, ...), all tailed on one
+    # thread, started and paused with the game
+    tails = MultiTail(api, logger, local_version=CLIENT_VERSION, sounds=sounds, cm=cm)
+
+    def attach_to_game(exe):
+        # find the SC log file; each log's RSI handle & GEID are read by MultiTail
+        log_file_location = set_sc_log_location()
+        if not log_file_location:
+            return False
+        tails.add(log_file_location)
+        # the other channels installed alongside, for testers switching between them
+        for log_path in find_game_logs(exe):
+            tails.add(log_path)
+
+    def detach_from_game():
+        logger.info("Star Citizen exited. Tracking paused until it starts again.")
+        tails.stop()
+
+    game_watcher = GameWatcher(attach_to_game, detach_from_game, logger=logger)
+    game_watcher.start()
 
     app.mainloop()
+    startup.close()
+    game_watcher.close()
+    tails.stop(timeout=5)
+    sounds.close()
+    try:
+        metrics.dump()
+    except OSError as e:
+        logger.error("Could not write stats: %s %s", e.__class__.__name__, e)
+    logger.close()
@@ -0,0 +1,180 @@
+import bisect
+from datetime import datetime, timezone
+import json
+import os
+import threading
+from time import monotonic
+
+METRICS_PATH = "killtracker_metrics.json"
+# Bytes a live tail is behind its log; "tail_lag_bytes.PTU" etc. when tailing several.
+LAG_GAUGE = "tail_lag_bytes"
+# Histogram bucket upper bounds in milliseconds; one more bucket takes the rest.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000, 300000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram: O(log buckets) to record, percentiles to bucket precision."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th sample (capped at the largest seen)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(BUCKETS_MS[i], self.max) if i < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max, 1),
+        }
+
+
+class Metrics:
+    """
+    Counters, gauges and histograms for the tail and upload paths.
+    Callers record per block or per event, never per line, so the cost
+    stays out of the parse loop. Each name is written by one thread only;
+    readers take a snapshot.
+    """
+
+    def __init__(self):
+        self.started = monotonic()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def incr(self, name: str, n: int = 1) -> None:
+        counters = self.counters
+        counters[name] = counters.get(name, 0) + n
+
+    def set(self, name: str, value) -> None:
+        self.gauges[name] = value
+
+    def observe(self, name: str, ms: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(name, Histogram())
+        histogram.observe(ms)
+
+    def snapshot(self) -> dict:
+        return {
+            "uptime_s": round(monotonic() - self.started, 1),
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "histograms": {name: h.to_dict() for name, h in list(self.histograms.items())},
+        }
+
+    def dump(self, path=METRICS_PATH) -> None:
+        """Atomically write a snapshot as JSON."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=1)
+        os.replace(tmp_path, path)
+
+
+class NullMetrics:
+    """Metrics that are switched off: every call is a no-op."""
+
+    def incr(self, name, n=1):
+        pass
+
+    def set(self, name, value):
+        pass
+
+    def observe(self, name, ms):
+        pass
+
+    def snapshot(self) -> dict:
+        return {"uptime_s": 0.0, "counters": {}, "gauges": {}, "histograms": {}}
+
+
+# shared by the parser, the API client and the stats panel
+metrics = Metrics()
+
+
+def age_ms(log_time: str, now=None) -> float:
+    """Milliseconds since a Game.log timestamp such as 2025-05-01T18:00:06.000Z (UTC)."""
+    stamp = datetime.fromisoformat(log_time.rstrip("Z")).replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return (now - stamp).total_seconds() * 1000
+
+
+def tail_lag(gauges: dict) -> int:
+    """The furthest any live tail is behind its log, in bytes."""
+    return max(
+        (n for name, n in gauges.items() if name == LAG_GAUGE or name.startswith(LAG_GAUGE + ".")),
+        default=0,
+    )
+
+
+def panel_text(snapshot: dict, previous=None) -> str:
+    """The stats panel's text; line rate is taken against the previous snapshot."""
+    counters = snapshot["counters"]
+    rate = 0.0
+    if previous is not None:
+        elapsed = snapshot["uptime_s"] - previous["uptime_s"]
+        if elapsed > 0:
+            rate = (counters.get("lines_read", 0) - previous["counters"].get("lines_read", 0)) / elapsed
+    matches = ", ".join(
+        f"{name[len('match.'):]} {n}" for name, n in sorted(counters.items()) if name.startswith("match.")
+    )
+    upload = snapshot["histograms"].get("upload_latency_ms")
+    upload_text = (
+        f"p50 {upload['p50_ms']:.0f} / p99 {upload['p99_ms']:.0f} ms"
+        if upload
+        else "no uploads yet"
+    )
+    return (
+        f"Lines: {counters.get('lines_read', 0):,} ({rate:,.0f}/s)  "
+        f"Read: {counters.get('bytes_read', 0) / 1024 / 1024:,.1f} MiB  "
+        f"Lag: {tail_lag(snapshot['gauges']):,} B\n"
+        f"Matches: {matches or 'none'}\n"
+        f"Parse errors: {counters.get('parse_errors', 0)}  "
+        f"Uploads: {counters.get('uploads_ok', 0)} ok, {counters.get('uploads_failed', 0)} failed, "
+        f"{upload_text}"
+    )
+
+
+def serve(source, port: int, host: str = "127.0.0.1"):
+    """Answer every GET on host:port with a JSON snapshot; returns the running server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class SnapshotHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            data = json.dumps(source.snapshot()).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer((host, port), SnapshotHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
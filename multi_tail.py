@@ -0,0 +1,220 @@
+from logging import DEBUG, INFO, WARNING
+import os
+import queue
+from threading import Thread
+from time import monotonic, sleep
+
+from checkpoint import checkpoint_path_for
+from headless import SUCCESS, NullModule
+from identity import find_identity
+from log_parser import LiveTail, LogParser
+from log_watcher import IDLE_TIMEOUT, make_watcher
+from metrics import LAG_GAUGE
+from version import CLIENT_VERSION
+
+# Seconds before an idle log is read again; doubles while it stays idle.
+POLL_INTERVAL = 0.05
+
+
+def channel_name(log_path) -> str:
+    """LIVE, PTU, ... for StarCitizen/<channel>/Game.log."""
+    return os.path.basename(os.path.dirname(os.path.abspath(log_path))) or log_path
+
+
+class TaggedLog:
+    """
+    Prefixes every message with its log's channel, e.g. "[PTU] ". Levels the
+    logger would drop return before the prefix is added, so a debug call
+    costs no more than on the logger itself.
+    """
+
+    def __init__(self, logger, tag):
+        self.logger = logger
+        self.prefix = f"[{tag}] "
+
+    def enabled(self, level) -> bool:
+        # loggers without a level (NullLog, test fakes) take everything
+        return getattr(self.logger, "level", DEBUG) <= level
+
+    def log(self, m, *args):
+        self.logger.log(self.prefix + m, *args)
+
+    def debug(self, m, *args):
+        if self.enabled(DEBUG):
+            self.logger.debug(self.prefix + m, *args)
+
+    def info(self, m, *args):
+        if self.enabled(INFO):
+            self.logger.info(self.prefix + m, *args)
+
+    def success(self, m, *args):
+        if self.enabled(SUCCESS):
+            self.logger.success(self.prefix + m, *args)
+
+    def warning(self, m, *args):
+        if self.enabled(WARNING):
+            self.logger.warning(self.prefix + m, *args)
+
+    def error(self, m, *args):
+        self.logger.error(self.prefix + m, *args)
+
+    def __getattr__(self, name):
+        # flush, close, ... go straight to the logger
+        return getattr(self.logger, name)
+
+
+class MultiTail:
+    """
+    Tails any number of Game.logs on one thread. Each log has its own
+    LogParser, so game mode, ship, identity and checkpoint stay per log,
+    while all of them share one APIClient and one logger. A single watcher
+    wakes the thread for a write to any of the logs and says which one, so
+    only that log is read.
+    """
+
+    def __init__(self, api, logger, watch_backend="auto", local_version=CLIENT_VERSION, sounds=None, cm=None):
+        self.api = api
+        self.log = logger
+        self.watch_backend = watch_backend
+        self.local_version = local_version
+        self.sounds = sounds or NullModule()
+        self.cm = cm or NullModule()
+        self.monitoring = {"active": False}
+        # log path -> its parser, for every log added so far
+        self.parsers = {}
+        # parsers the tail thread has not opened yet
+        self.added = queue.SimpleQueue()
+        self.thread = None
+
+    def make_parser(self, log_path) -> LogParser:
+        """A parser for one log, tagged with its channel and checkpointed on its own."""
+        handle, geid = find_identity(log_path)
+        parser = LogParser(
+            gui_module=TaggedLog(self.log, channel_name(log_path)),
+            api_client_module=self.api,
+            sound_module=self.sounds,
+            cm_module=self.cm,
+            local_version=self.local_version,
+            monitoring=self.monitoring,
+            rsi_handle={"current": handle},
+            player_geid={"current": geid},
+            active_ship={"current": "N/A"},
+            anonymize_state=False,
+        )
+        parser.log_file_location = log_path
+        parser.watch_backend = self.watch_backend
+        parser.checkpoint_path = checkpoint_path_for(log_path)
+        parser.lag_gauge = f"{LAG_GAUGE}.{channel_name(log_path)}"
+        return parser
+
+    def add(self, log_path, parser=None) -> LogParser:
+        """
+        Start tailing `log_path`; adding it again only restarts a stopped
+        tail. Safe from any thread; the tail thread picks the log up within
+        IDLE_TIMEOUT.
+        """
+        key = os.path.abspath(log_path)
+        known = self.parsers.get(key)
+        if known is None:
+            known = self.parsers[key] = parser or self.make_parser(log_path)
+            self.added.put(known)
+        self.start()
+        return known
+
+    def start(self) -> None:
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.monitoring["active"] = True
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=None) -> None:
+        """Stop tailing every log; each is checkpointed on the way out."""
+        self.monitoring["active"] = False
+        if self.thread is not None:
+            self.thread.join(timeout)
+        # a later start() opens them all again
+        self.added = queue.SimpleQueue()
+        for parser in self.parsers.values():
+            self.added.put(parser)
+
+    def open(self, parser):
+        """Catch one parser up with its log; its LiveTail, or None if it cannot be opened."""
+        try:
+            sc_log = open(parser.log_file_location, "rb")
+        except OSError as e:
+            parser.log.error("Error opening log file: %s %s", e.__class__.__name__, e)
+            return None
+        parser.catch_up(sc_log)
+        return LiveTail(parser, sc_log)
+
+    def take_added(self, tails, watcher, block: bool):
+        """Open the parsers added since the last pass; returns the (possibly new) watcher."""
+        while True:
+            try:
+                parser = self.added.get(timeout=IDLE_TIMEOUT) if block else self.added.get_nowait()
+            except queue.Empty:
+                return watcher
+            block = False
+            tail = self.open(parser)
+            if tail is None:
+                continue
+            tails[os.path.abspath(parser.log_file_location)] = tail
+            if watcher is None:
+                watcher = make_watcher(parser.log_file_location, self.watch_backend)
+            else:
+                watcher.add(parser.log_file_location)
+
+    def run(self) -> None:
+        # log path -> its LiveTail, and when each is next read unprompted
+        tails = {}
+        due = {}
+        watcher = None
+        try:
+            while self.monitoring["active"]:
+                try:
+                    if not self.api.api_key["value"]:
+                        if tails:
+                            self.log.warning("Key is invalid. Kill Tracking is not active...")
+                        sleep(5 if tails else 1)
+                        continue
+                    watcher = self.take_added(tails, watcher, block=not tails)
+                    if not tails:
+                        continue
+                    self.step(tails, due, watcher)
+                except Exception as e:
+                    self.log.error("Error tailing game logs: %s %s", e.__class__.__name__, e)
+        finally:
+            for tail in tails.values():
+                tail.close()
+            if watcher is not None:
+                watcher.close()
+        self.log.info("Game log monitoring has stopped.")
+
+    def step(self, tails, due, watcher) -> None:
+        """
+        Read the logs the watcher reported, and those whose idle check is
+        due, then wait for the next. A log that keeps turning up nothing is
+        checked less and less often, up to `max_interval`, so idle channels
+        cost next to nothing however many there are.
+        """
+        max_interval = getattr(watcher, "max_interval", IDLE_TIMEOUT)
+        changed = watcher.changed()
+        now = monotonic()
+        busy = False
+        for path, tail in tails.items():
+            interval, next_check = due.get(path, (POLL_INTERVAL, now))
+            if path not in changed and now < next_check:
+                continue
+            try:
+                if tail.read():
+                    busy = True
+                    due[path] = (POLL_INTERVAL, now)
+                    continue
+                tail.checkpoint()
+                tail.reopen_if_replaced()
+            except Exception as e:
+                tail.parser.log.error("Error reading game log file: %s %s", e.__class__.__name__, e)
+            due[path] = (min(interval * 2, max_interval), now + interval)
+        if not busy:
+            watcher.wait(max(0.0, min(next_check for _, next_check in due.values()) - monotonic()))
@@ -0,0 +1,73 @@
+import sqlite3
+import threading
+import time
+import uuid
+
+OUTBOX_PATH = "killtracker_outbox.db"
+
+
+class Outbox:
+    """
+    Append-only SQLite journal of events that have not been acknowledged yet.
+    WAL mode with synchronous=NORMAL keeps an insert in the tens of
+    microseconds while still surviving a crash of the tracker itself.
+    """
+
+    def __init__(self, path=OUTBOX_PATH):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_key TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                api_key TEXT,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+
+    def add(self, kind: str, api_key, payload: str, event_key=None) -> int:
+        """
+        Journal one event, already serialized to JSON text; returns its id.
+        event_key is sent as the Idempotency-Key; a random one by default.
+        """
+        with self.lock:
+            cur = self.db.execute(
+                "INSERT INTO events (event_key, kind, api_key, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (event_key or uuid.uuid4().hex, kind, api_key, payload, time.time()),
+            )
+            return cur.lastrowid
+
+    def pending(self, limit: int = 100) -> list:
+        """Oldest unacknowledged events: (id, event_key, kind, api_key, payload_json)."""
+        with self.lock:
+            return self.db.execute(
+                "SELECT id, event_key, kind, api_key, payload FROM events ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+    def pending_keys(self) -> set:
+        """Event keys of everything still unacknowledged."""
+        with self.lock:
+            return {row[0] for row in self.db.execute("SELECT event_key FROM events")}
+
+    def rekey(self, event_id: int, api_key) -> None:
+        """Send the event with `api_key` from now on, e.g. once its own has expired."""
+        with self.lock:
+            self.db.execute("UPDATE events SET api_key = ? WHERE id = ?", (api_key, event_id))
+
+    def done(self, event_id: int) -> None:
+        """The backend has the event; forget it."""
+        with self.lock:
+            self.db.execute("DELETE FROM events WHERE id = ?", (event_id,))
+
+    def count(self) -> int:
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,153 @@
+import os
+import threading
+
+GAME_PROCESS = "StarCitizen"
+# Release channels installed side by side under one StarCitizen folder.
+GAME_CHANNELS = ("LIVE", "PTU", "EPTU", "TECH-PREVIEW", "HOTFIX")
+# Seconds between game process checks in the background watcher.
+WATCH_INTERVAL = 3.0
+
+
+class ProcessLocator:
+    """
+    Finds running processes by (case-insensitive) name and remembers them.
+    A remembered process is confirmed with one liveness check instead of a
+    walk over every process, and a walk only reads process names; the exe
+    path is fetched for matches alone. Every name asked for so far is
+    looked up in the same walk, so the launcher and the game cost one pass.
+    """
+
+    def __init__(self, ps=None):
+        # psutil module (or a stand-in); imported on first lookup, off the startup path
+        self.ps = ps
+        self.lock = threading.Lock()
+        # lowercased name -> (psutil.Process, exe path)
+        self.found = {}
+        self.wanted = set()
+
+    def find(self, process_name):
+        """Exe path of a running process whose name contains `process_name`, or None."""
+        key = process_name.lower()
+        with self.lock:
+            if self.ps is None:
+                import psutil
+
+                self.ps = psutil
+            self.wanted.add(key)
+            hit = self.found.get(key)
+            if hit is not None:
+                if self.alive(hit[0]):
+                    return hit[1]
+                del self.found[key]
+            self.scan()
+            hit = self.found.get(key)
+            return hit[1] if hit is not None else None
+
+    def is_running(self, process_name) -> bool:
+        return self.find(process_name) is not None
+
+    def alive(self, proc) -> bool:
+        try:
+            # also catches a PID that was reused by another process
+            return proc.is_running() and proc.status() != self.ps.STATUS_ZOMBIE
+        except self.ps.Error:
+            return False
+
+    def scan(self) -> None:
+        missing = [key for key in self.wanted if key not in self.found]
+        for proc in self.ps.process_iter(["name"]):
+            name = (proc.info["name"] or "").lower()
+            for key in missing:
+                if key in name and key not in self.found:
+                    try:
+                        self.found[key] = (proc, proc.exe())
+                    except self.ps.Error:
+                        pass
+            if len(self.found) == len(self.wanted):
+                return
+
+
+# shared by the GUI and the game watcher
+locator = ProcessLocator()
+
+
+def find_game_log_in_directory(directory):
+    """Game.log in the game's exe directory or its parent, or None."""
+    for folder in (directory, os.path.dirname(directory)):
+        game_log_path = os.path.join(folder, "Game.log")
+        if os.path.exists(game_log_path):
+            return game_log_path
+    return None
+
+
+class GameWatcher:
+    """
+    Background thread that checks for the game every `interval` seconds and
+    calls on_start(exe) when it appears and on_exit() when it goes away.
+    on_start may return False (e.g. Game.log is not there yet) to be called
+    again on the next check.
+    """
+
+    def __init__(
+        self,
+        on_start,
+        on_exit,
+        process_name=GAME_PROCESS,
+        process_locator=None,
+        interval=WATCH_INTERVAL,
+        logger=None,
+    ):
+        self.on_start = on_start
+        self.on_exit = on_exit
+        self.process_name = process_name
+        self.locator = process_locator or locator
+        self.interval = interval
+        self.log = logger
+        self.attached = False
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        while True:
+            try:
+                self.poll()
+            except Exception as e:
+                if self.log is not None:
+                    self.log.error("GameWatcher: %s %s", e.__class__.__name__, e)
+            if self.stopped.wait(self.interval):
+                return
+
+    def poll(self) -> None:
+        """One check; runs the callback for a start or exit since the last one."""
+        exe = self.locator.find(self.process_name)
+        if exe is not None and not self.attached:
+            self.attached = self.on_start(exe) is not False
+        elif exe is None and self.attached:
+            self.attached = False
+            self.on_exit()
+
+    def close(self, timeout=None) -> None:
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+
+def find_game_logs(exe):
+    """
+    Game.log of the running game, then of every other channel installed
+    next to it, e.g. StarCitizen/LIVE and StarCitizen/PTU.
+    """
+    current = find_game_log_in_directory(os.path.dirname(exe))
+    if current is None:
+        return []
+    logs = [current]
+    root = os.path.dirname(os.path.dirname(current))
+    for channel in GAME_CHANNELS:
+        path = os.path.join(root, channel, "Game.log")
+        if path != current and os.path.exists(path):
+            logs.append(path)
+    return logs
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+import hashlib
+import json
+import os
+import threading
+import time
+
+CACHE_PATH = "killtracker_http_cache.json"
+# A key the backend accepted is trusted without asking again until this long
+# before the expiry stored next to it.
+KEY_EXPIRY_MARGIN = timedelta(minutes=10)
+# How long a fetched update check is reused before it is revalidated.
+UPDATE_CHECK_TTL = 6 * 60 * 60
+
+
+class ResponseCache:
+    """
+    Small JSON file of HTTP results, shared between threads. Loaded on first
+    use and rewritten atomically on every change.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = None
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        if not isinstance(self.entries, dict):
+            self.entries = {}
+
+    def get(self, name):
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            entry = self.entries.get(name)
+            return dict(entry) if isinstance(entry, dict) else None
+
+    def put(self, name, entry: dict) -> None:
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            self.entries[name] = entry
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                # a cache that cannot be written just means asking again next time
+                pass
+
+
+def key_entry_name(key: str) -> str:
+    # the cache file only ever holds a hash of the key
+    return "key:" + hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def record_key_result(cache: ResponseCache, key: str, valid: bool) -> None:
+    cache.put(key_entry_name(key), {"valid": valid, "checked_at": time.time()})
+
+
+def check_key(key: str, cache: ResponseCache, url: str):
+    """
+    Ask the backend's /keys/validate at `url` about `key` and cache the
+    answer: True/False, or None when it could not be reached.
+    """
+    import requests
+
+    headers = {
+        "Authorization": f"Bearer {key}",
+        "Content-Type": "application/json",
+    }
+    try:
+        r = requests.get(url, headers=headers, timeout=5)
+    except Exception:
+        return None
+    valid = r.status_code in (200, 201)
+    record_key_result(cache, key, valid)
+    return valid
+
+
+def revalidate_key(key_store: dict, key: str, cache: ResponseCache, url: str) -> bool:
+    """
+    Re-check a key that was accepted on the strength of the cache. A key
+    revoked since its last check stops tracking, if it is still the active
+    one; being offline does not. True when the key was dropped.
+    """
+    if check_key(key, cache, url) is False and key_store["value"] == key:
+        key_store["value"] = None
+        return True
+    return False
+
+
+def cached_key_valid(cache: ResponseCache, key: str, expires_at: datetime, now=None) -> bool:
+    """
+    True when the backend accepted `key` at its last check and its stored
+    expiry (naive UTC) is more than KEY_EXPIRY_MARGIN away.
+    """
+    now = datetime.utcnow() if now is None else now
+    if now >= expires_at - KEY_EXPIRY_MARGIN:
+        return False
+    entry = cache.get(key_entry_name(key))
+    return bool(entry and entry.get("valid"))
+
+
+def conditional_get(cache: ResponseCache, url: str, headers=None, ttl=UPDATE_CHECK_TTL, timeout=5):
+    """
+    GET a JSON document through the cache. A copy younger than `ttl` is
+    returned without a request; an older one is revalidated with
+    If-None-Match and kept on 304 Not Modified. Returns (status, body),
+    where status is 200 for a cached copy and body is None unless it is 200.
+    """
+    import requests
+
+    now = time.time()
+    entry = cache.get(url)
+    if entry is not None and now - entry["fetched_at"] < ttl:
+        return 200, entry["body"]
+    headers = dict(headers or {})
+    if entry is not None and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    r = requests.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and entry is not None:
+        entry["fetched_at"] = now
+        cache.put(url, entry)
+        return 200, entry["body"]
+    if r.status_code != 200:
+        return r.status_code, None
+    body = r.json()
+    cache.put(url, {"fetched_at": now, "etag": r.headers.get("ETag"), "body": body})
+    return 200, body
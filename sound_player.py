@@ -0,0 +1,128 @@
+from collections import deque
+import os
+import sys
+from threading import Event, Lock, Thread
+
+from helpers import resource_path
+
+KILL_CLIP = os.path.join("assets", "kill.wav")
+# Seconds to wait after a kill for the rest of its burst.
+BURST_WINDOW = 0.15
+# Seconds after a cue ends before the next one may start; kills in
+# between are folded into that next cue.
+COOLDOWN = 0.5
+# Recent cues remembered, for the multi-kill tests and the bench.
+CUE_HISTORY = 32
+
+
+class WinsoundBackend:
+    """Plays WAV bytes from memory with the Windows API."""
+
+    def __init__(self):
+        import winsound
+
+        self.winsound = winsound
+
+    def play(self, clip: bytes) -> None:
+        # SND_MEMORY cannot be combined with SND_ASYNC; the worker thread is what keeps this off the tail
+        self.winsound.PlaySound(clip, self.winsound.SND_MEMORY)
+
+
+class NullBackend:
+    """Plays nothing, but remembers every cue; for tests and non-Windows runs."""
+
+    def __init__(self, duration: float = 0.0):
+        self.duration = duration
+        self.played = []
+        self.done = Event()
+
+    def play(self, clip: bytes) -> None:
+        self.played.append(clip)
+        if self.duration:
+            self.done.wait(self.duration)
+
+
+def default_backend():
+    if sys.platform == "win32":
+        try:
+            return WinsoundBackend()
+        except ImportError:
+            pass
+    return NullBackend()
+
+
+class KillSoundPlayer:
+    """
+    Kill sounds off the tail thread. The clip is read into memory once;
+    play_random_sound only counts the kill and returns. A worker plays one
+    cue per burst, so a quick multi-kill is heard once, not queued up clip
+    after clip.
+    """
+
+    def __init__(
+        self,
+        logger=None,
+        backend=None,
+        clip_path=None,
+        burst_window: float = BURST_WINDOW,
+        cooldown: float = COOLDOWN,
+    ):
+        self.log = logger
+        self.backend = backend if backend is not None else default_backend()
+        self.clip_path = clip_path or resource_path(KILL_CLIP)
+        self.burst_window = burst_window
+        self.cooldown = cooldown
+        self.clip = None
+        self.pending = 0
+        self.lock = Lock()
+        self.wakeup = Event()
+        self.stopped = Event()
+        # kills per recent cue, newest last
+        self.cues = deque(maxlen=CUE_HISTORY)
+        self.worker = Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def play_random_sound(self) -> None:
+        with self.lock:
+            self.pending += 1
+        self.wakeup.set()
+
+    def load(self) -> None:
+        try:
+            with open(self.clip_path, "rb") as f:
+                self.clip = f.read()
+        except OSError as e:
+            self.report(f"Kill sound unavailable: {e.__class__.__name__} {e}")
+
+    def run(self) -> None:
+        self.load()
+        while True:
+            self.wakeup.wait()
+            if self.stopped.wait(self.burst_window):
+                return
+            with self.lock:
+                kills, self.pending = self.pending, 0
+                self.wakeup.clear()
+            if not kills:
+                continue
+            self.cues.append(kills)
+            if kills > 1 and self.log is not None:
+                self.log.success(f"Multi-kill x{kills}!")
+            if self.clip is not None:
+                try:
+                    self.backend.play(self.clip)
+                except Exception as e:
+                    self.report(f"Error playing kill sound: {e.__class__.__name__} {e}")
+            if self.stopped.wait(self.cooldown):
+                return
+
+    def report(self, message: str) -> None:
+        if self.log is not None:
+            self.log.error(message)
+        else:
+            print(message)
+
+    def close(self) -> None:
+        self.stopped.set()
+        self.wakeup.set()
+        self.worker.join()
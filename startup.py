@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+import queue
+from time import perf_counter
+
+# How often the Tk main loop picks up finished startup tasks.
+POLL_INTERVAL_MS = 50
+
+
+class StartupPipeline:
+    """
+    Runs the slow, independent startup work (update check, key validation,
+    ...) on a small thread pool so the window can be drawn right away.
+    Results are handed back to the Tk main loop, where then() callbacks
+    fill them into the GUI as they arrive.
+
+    timings records, per task and for "first paint", the seconds since the
+    pipeline was created.
+    """
+
+    def __init__(self, max_workers=4, started=None):
+        self.started = perf_counter() if started is None else started
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="startup")
+        # (callback, future) pairs waiting for the main loop
+        self.ready = queue.SimpleQueue()
+        self.timings = {}
+        self.w = None
+        self.log = None
+
+    def submit(self, name, fn, *args):
+        """Start fn(*args) in the background; returns its Future."""
+
+        def timed():
+            try:
+                return fn(*args)
+            finally:
+                self.timings[name] = perf_counter() - self.started
+
+        return self.executor.submit(timed)
+
+    def then(self, future, callback) -> None:
+        """Call callback(result) on the Tk main loop once `future` is done."""
+        future.add_done_callback(lambda f: self.ready.put((callback, f)))
+
+    def attach(self, widget, logger=None) -> None:
+        """Start delivering results through `widget`'s event loop."""
+        self.w = widget
+        self.log = logger
+        self.w.after_idle(self.first_paint)
+        self.w.after(POLL_INTERVAL_MS, self.pump)
+
+    def first_paint(self) -> None:
+        self.timings["first paint"] = perf_counter() - self.started
+        if self.log is not None:
+            self.log.debug("Startup: window shown after %.0f ms", self.timings["first paint"] * 1000)
+
+    def pump(self) -> None:
+        try:
+            self.run_ready()
+        finally:
+            self.w.after(POLL_INTERVAL_MS, self.pump)
+
+    def run_ready(self) -> None:
+        """Run the callbacks of every task finished so far. Tk main thread only."""
+        while True:
+            try:
+                callback, future = self.ready.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(future.result())
+            except Exception as e:
+                if self.log is not None:
+                    self.log.error("Startup: %s %s", e.__class__.__name__, e)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,138 @@
+# stub_backend.py
+"""
+Local stand-in for the tracker backend, for tests and benchmarks.
+
+    with StubBackend(latency=0.2, error_rate=0.05, rate_limit=20) as backend:
+        APIClient(key_store, kill_url=backend.url("/reportKill"), ...)
+"""
+from collections import deque
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status: int, body, etag=None) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if etag:
+            self.send_header("ETag", etag)
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def authorized(self) -> bool:
+        valid_keys = self.server.backend.valid_keys
+        key = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        return valid_keys is None or key in valid_keys
+
+    def do_GET(self):
+        backend = self.server.backend
+        backend.record(self, None)
+        time.sleep(backend.latency)
+        if backend.valid_keys is not None and self.path.startswith("/keys/validate"):
+            status = 200 if self.authorized() else 401
+            self.reply(status, {"valid": status == 200})
+            return
+        if backend.etag and self.headers.get("If-None-Match") == backend.etag:
+            self.reply(304, None, backend.etag)
+            return
+        self.reply(backend.get_status, backend.get_body, backend.etag)
+
+    def do_POST(self):
+        backend = self.server.backend
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"null")
+        backend.record(self, payload)
+        time.sleep(backend.latency)
+        status = backend.post_status() if self.authorized() else 401
+        if status == 201:
+            backend.acknowledge(payload)
+        self.reply(status, {"ok": status == 201})
+
+
+class StubBackend:
+    """
+    Serves /reportKill, /reportDeath and /keys/validate on a random local port.
+    Any GET answers get_status/get_body; with `etag` set it also honours
+    If-None-Match, like the GitHub releases API. With `valid_keys` set,
+    /keys/validate and the POSTs only accept those bearer keys.
+
+    POSTs fail with a 500 at `error_rate` (seeded, so runs repeat) and get
+    a 429 beyond `rate_limit` requests in any one second.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit=None,
+        valid_keys=None,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.valid_keys = valid_keys
+        self.rng = random.Random(seed)
+        self.get_status = 200
+        self.get_body = {"valid": True}
+        self.etag = None
+        self.requests = []
+        # wall-clock time of every request, and (time, payload) of every accepted event
+        self.request_times = []
+        self.acks = []
+        self.recent = deque()
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.daemon_threads = True
+        self.server.backend = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def record(self, handler, payload) -> None:
+        with self.lock:
+            self.connections.add(handler.client_address)
+            self.requests.append(
+                (handler.command, handler.path, payload, dict(handler.headers))
+            )
+            self.request_times.append(time.time())
+
+    def post_status(self) -> int:
+        with self.lock:
+            if self.rate_limit is not None:
+                now = time.monotonic()
+                while self.recent and now - self.recent[0] >= 1.0:
+                    self.recent.popleft()
+                if len(self.recent) >= self.rate_limit:
+                    return 429
+                self.recent.append(now)
+            if self.error_rate and self.rng.random() < self.error_rate:
+                return 500
+            return 201
+
+    def acknowledge(self, payload) -> None:
+        with self.lock:
+            self.acks.append((time.time(), payload))
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,79 @@
+# test_analytics.py
+import csv
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import analytics
+from log_archive import log_paths
+from test_log_parser import HANDLE, RECORDED_LOG, make_parser
+
+
+@pytest.fixture
+def sc_folder(tmp_path):
+    (tmp_path / "logbackups").mkdir()
+    (tmp_path / "Game.log").write_text(RECORDED_LOG, encoding="utf-8")
+    older = RECORDED_LOG.replace("2025-05-01", "2025-04-30")
+    (tmp_path / "logbackups" / "Game Build(1).log").write_text(older, encoding="utf-8")
+    return tmp_path
+
+
+def test_events_match_what_the_live_tracker_uploads(sc_folder):
+    table = analytics.extract([sc_folder / "Game.log"])
+    live = make_parser()
+    for line in RECORDED_LOG.splitlines(keepends=True):
+        live.read_log_line(line, True)
+
+    header, rows = table.events()
+    kinds = [row[header.index("kind")] for row in rows]
+    assert kinds == ["mode", "zone", "kill", "zone", "death", "mode", "kill", "suicide"]
+    kills = [row for row in rows if row[header.index("kind")] == "kill"]
+    sent = [payload for kind, payload in live.api.sent if kind == "kill"]
+    assert [row[header.index("opponent")] for row in kills] == [p["victim"] for p in sent]
+    assert [row[header.index("ship")] for row in kills] == [p["killers_ship"] for p in sent]
+    assert [row[header.index("game_mode")] for row in kills] == [p["game_mode"] for p in sent]
+    assert all(row[header.index("player")] == HANDLE for row in rows)
+
+
+def test_zone_and_game_mode_changes_are_rows(sc_folder):
+    header, rows = analytics.extract([sc_folder / "Game.log"]).events()
+    changes = [
+        (row[header.index("time")], row[header.index("kind")], row[header.index("game_mode")], row[header.index("zone")])
+        for row in rows
+        if row[header.index("kind")] in ("zone", "mode")
+    ]
+    assert changes == [
+        ("2025-05-01T18:00:03.000", "mode", "EA_FreeFlight", "N/A"),
+        ("2025-05-01T18:00:05.000", "zone", "EA_FreeFlight", "AEGS_Gladius_1001"),
+        ("2025-05-01T18:00:08.000", "zone", "EA_FreeFlight", "AEGS_Sabre_4004"),
+        ("2025-05-01T18:00:11.000", "mode", "SC_Default", "N/A"),
+    ]
+
+
+def test_aggregates_per_session_weapon_and_day(sc_folder):
+    table = analytics.extract(log_paths([sc_folder]))
+    reports = table.aggregates()
+    assert reports["sessions"][1] == [
+        ("Game Build(1).log", "2025-04-30T18:00:06.000", "2025-04-30T18:00:15.000", 2, 1, 1),
+        ("Game.log", "2025-05-01T18:00:06.000", "2025-05-01T18:00:15.000", 2, 1, 1),
+    ]
+    # weapon entity ids are dropped so the same gun adds up
+    assert ("KLWE_LaserRepeater_S3", 2, 0, 0) in reports["by_weapon"][1]
+    assert ("AEGS_Sabre", 0, 2, 0) in reports["by_ship"][1]
+    assert reports["by_day"][1] == [("2025-04-30", 2, 1, 1), ("2025-05-01", 2, 1, 1)]
+
+
+def test_csv_export(sc_folder, tmp_path):
+    out = tmp_path / "stats"
+    analytics.main([str(sc_folder), "--out", str(out)])
+    with open(out / "by_game_mode.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["game_mode", "kills", "deaths", "suicides"]
+    assert sorted(rows[1:]) == [
+        ["EA_FreeFlight", "2", "2", "0"],
+        ["SC_Default", "2", "0", "2"],
+    ]
+    assert sorted(p.name for p in out.iterdir()) == [
+        "by_day.csv", "by_game_mode.csv", "by_ship.csv", "by_weapon.csv", "events.csv", "sessions.csv"
+    ]
@@ -0,0 +1,159 @@
+# test_api_client.py
+import sqlite3
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from api_client import APIClient
+from metrics import Metrics
+from stub_backend import StubBackend
+
+
+def make_client(tmp_path, kill_url, death_url="http://127.0.0.1:1/reportDeath"):
+    return APIClient(
+        {"value": "key"},
+        kill_url=kill_url,
+        death_url=death_url,
+        outbox_path=tmp_path / "outbox.db",
+    )
+
+
+def test_posts_return_immediately_on_slow_backend(tmp_path):
+    with StubBackend(latency=0.2) as backend:
+        api = make_client(tmp_path, backend.url("/reportKill"), backend.url("/reportDeath"))
+        start = time.perf_counter()
+        for i in range(5):
+            api.post_kill_event({"victim": f"v{i}"})
+        api.post_death_event({"killer": "k"})
+        assert time.perf_counter() - start < 0.1
+        assert api.flush()
+        api.close()
+
+    paths = [path for _, path, _, _ in backend.requests]
+    assert paths == ["/reportKill"] * 5 + ["/reportDeath"]
+    assert [p["victim"] for _, _, p, _ in backend.requests[:5]] == [f"v{i}" for i in range(5)]
+    # every event went over the same keep-alive connection
+    assert len(backend.connections) == 1
+
+
+def test_unsent_events_survive_a_restart_and_are_sent_once(tmp_path):
+    # backend unreachable: the event stays journaled
+    api = make_client(tmp_path, "http://127.0.0.1:1/reportKill")
+    api.report_error = lambda message: None
+    api.post_kill_event({"victim": "offline"})
+    assert not api.flush(timeout=0.3)
+    api.close()
+
+    with StubBackend() as backend:
+        # next launch replays it on its own
+        api = make_client(tmp_path, backend.url("/reportKill"))
+        assert api.flush()
+        api.close()
+        # and a further launch has nothing left to send
+        api = make_client(tmp_path, backend.url("/reportKill"))
+        assert api.flush()
+        api.close()
+
+    assert len(backend.requests) == 1
+    _, path, payload, headers = backend.requests[0]
+    assert (path, payload) == ("/reportKill", {"victim": "offline"})
+    assert headers["Authorization"] == "Bearer key"
+    assert len(headers["Idempotency-Key"]) == 32
+
+
+def test_upload_metrics(tmp_path):
+    with StubBackend() as backend:
+        api = APIClient(
+            {"value": "key"},
+            kill_url=backend.url("/reportKill"),
+            death_url=backend.url("/reportDeath"),
+            outbox_path=tmp_path / "outbox.db",
+            metrics=Metrics(),
+        )
+        api.post_kill_event({"victim": "v", "time": "2025-05-01T18:00:06.000Z"})
+        api.post_death_event({"killer": "k"})
+        assert api.flush()
+        api.close()
+
+    snapshot = api.metrics.snapshot()
+    assert snapshot["counters"]["uploads_ok"] == 2
+    assert snapshot["histograms"]["upload_rtt_ms"]["count"] == 2
+    # only the event with a log timestamp has an end-to-end latency
+    assert snapshot["histograms"]["upload_latency_ms"]["count"] == 1
+
+
+def test_stub_backend_rate_limit_and_errors():
+    import requests
+
+    with StubBackend(rate_limit=3) as backend:
+        statuses = [requests.post(backend.url("/reportKill"), json={"n": n}).status_code for n in range(5)]
+        assert statuses == [201, 201, 201, 429, 429]
+        assert requests.post(backend.url("/reportKill"), json={}).headers["Retry-After"] == "1"
+        assert [payload["n"] for _, payload in backend.acks] == [0, 1, 2]
+
+    with StubBackend(error_rate=1.0) as backend:
+        assert requests.post(backend.url("/reportKill"), json={}).status_code == 500
+        assert backend.acks == []
+
+
+def test_stub_backend_validates_keys():
+    import requests
+
+    with StubBackend(valid_keys={"good"}) as backend:
+        url = backend.url("/keys/validate")
+        assert requests.get(url, headers={"Authorization": "Bearer good"}).status_code == 200
+        assert requests.get(url, headers={"Authorization": "Bearer bad"}).status_code == 401
+
+
+def test_replay_harness_drains(tmp_path):
+    from bench_replay import arena_wipe, run
+
+    result = run(arena_wipe(4, window=1.0, noise_per_kill=2), speed=20.0, drain_timeout=10)
+    assert result["drained"]
+    assert result["events"] == result["acked"] == 4
+    assert len(result["latency_ms"]) == 4
+
+
+def test_events_refused_for_their_key_wait_for_a_new_one(tmp_path):
+    with StubBackend(valid_keys={"new"}) as backend:
+        # journaled under a key that expired before the replay
+        api = make_client(tmp_path, backend.url("/reportKill"))
+        api.report_error = lambda message: None
+        api.post_kill_event({"victim": "old key"})
+        assert not api.flush(timeout=0.3)
+        assert api.rejected_key == "key"
+        requests_while_rejected = len(backend.requests)
+        time.sleep(0.3)
+        assert len(backend.requests) == requests_while_rejected
+
+        api.api_key["value"] = "new"
+        assert api.flush(timeout=5)
+        api.close()
+
+    assert [payload for _, payload in backend.acks] == [{"victim": "old key"}]
+    assert backend.requests[-1][3]["Authorization"] == "Bearer new"
+
+
+def test_sender_survives_an_outbox_error(tmp_path, monkeypatch):
+    monkeypatch.setattr("api_client.RETRY_MIN", 0.05)
+    with StubBackend() as backend:
+        api = make_client(tmp_path, backend.url("/reportKill"))
+        errors = []
+        api.report_error = errors.append
+        pending = api.outbox.pending
+        failures = iter([True])
+
+        def locked_once(limit=100):
+            if next(failures, False):
+                raise sqlite3.OperationalError("database is locked")
+            return pending(limit)
+
+        api.outbox.pending = locked_once
+        api.post_kill_event({"victim": "after the error"})
+        assert api.flush(timeout=5)
+        api.close()
+
+    assert errors == ["Error sending events: OperationalError database is locked"]
+    assert [payload for _, payload in backend.acks] == [{"victim": "after the error"}]
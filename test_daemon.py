@@ -0,0 +1,106 @@
+# test_daemon.py
+import io
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from daemon import load_key
+from headless import ConsoleLogger
+from log_gen import LogGenerator
+from response_cache import ResponseCache
+from stub_backend import StubBackend
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# runs daemon.main in a child, with config.example standing in for config.py if need be
+RUN_DAEMON = f"""
+import sys
+sys.path.insert(0, {HERE!r})
+import conftest
+import daemon
+daemon.main(sys.argv[1:])
+"""
+
+
+def write_key(path, key="good"):
+    path.write_text(json.dumps({"key": key, "expires_at": "2999-01-01T00:00:00Z"}))
+
+
+def test_console_logger_json_lines():
+    out = io.StringIO()
+    logger = ConsoleLogger(json_lines=True, stream=out)
+    logger.debug("hidden %s", 1)
+    logger.success("Kill: %s", "Pilot_1")
+    (line,) = out.getvalue().splitlines()
+    record = json.loads(line)
+    assert record["level"] == "success"
+    assert record["message"] == "Kill: Pilot_1"
+
+
+def test_load_key(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.json")
+    key_file = tmp_path / "key.cfg"
+    with pytest.raises(SystemExit):
+        load_key(str(key_file), cache, "http://127.0.0.1:1/keys/validate")
+
+    with StubBackend(valid_keys={"good"}) as backend:
+        url = backend.url("/keys/validate")
+        write_key(key_file, "bad")
+        with pytest.raises(SystemExit):
+            load_key(str(key_file), cache, url)
+        write_key(key_file)
+        assert load_key(str(key_file), cache, url) == ("good", False)
+        # accepted once, so the next start does not wait on the backend
+        assert load_key(str(key_file), cache, url) == ("good", True)
+
+
+def test_daemon_exits_cleanly_on_a_missing_log(tmp_path):
+    missing = tmp_path / "nowhere" / "Game.log"
+    proc = subprocess.run(
+        [sys.executable, "-c", RUN_DAEMON, "--log", str(missing)],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert proc.returncode == 1
+    assert proc.stderr.strip() == f"Not found: {missing}"
+
+
+def test_daemon_tails_and_uploads(tmp_path):
+    gen = LogGenerator(23, mix={"noise": 4, "player_kill": 1})
+    game_log = tmp_path / "Game.log"
+    game_log.write_text("".join(gen.header()))
+    write_key(tmp_path / "killtracker_key.cfg")
+
+    with StubBackend(valid_keys={"good"}) as backend:
+        proc = subprocess.Popen(
+            [sys.executable, "-c", RUN_DAEMON, "--json", "--log", str(game_log), "--backend", backend.url("")],
+            cwd=tmp_path,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            for line in proc.stdout:
+                if json.loads(line)["message"].endswith("Kill Tracking initiated."):
+                    break
+            with open(game_log, "a") as f:
+                f.writelines(gen.lines(200))
+            deadline = time.monotonic() + 10
+            while len(backend.acks) < gen.expected["kill"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            proc.send_signal(signal.SIGTERM)
+            rest = proc.communicate(timeout=10)[0]
+        finally:
+            proc.kill()
+
+    assert proc.returncode == 0
+    assert gen.expected["kill"] > 0
+    assert len(backend.acks) == gen.expected["kill"]
+    assert "Shutting down." in [json.loads(line)["message"] for line in rest.splitlines()]
@@ -0,0 +1,78 @@
+# test_entities.py
+from entities import EntityRegistry, ship_code
+from test_log_parser import GEID, HANDLE, RECORDED_LOG, make_parser
+
+SPAWN = "<2025-05-01T18:00:20.000Z> [Notice] <CPlayerShipRespawnManager::OnVehicleSpawned> Vehicle spawned: [{ship}] by player {geid} [Team_ArenaCommander]\n"
+DESTROYED = "<2025-05-01T18:00:20.500Z> [Notice] <Vehicle Destruction> CVehicle::OnAdvanceDamageState: Vehicle '{ship}' [{ship_id}] in zone 'OOC_Stanton' [Team_VehicleFeatures]\n"
+KILL = "<2025-05-01T18:00:21.000Z> [Notice] <Actor Death> CActor::Kill: '{victim}' [{victim_geid}] in zone '{zone}' killed by '{killer}' [{killer_geid}] using 'KLWE_LaserRepeater_S3_3003' [Class unknown] with damage type 'Combat' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]\n"
+
+
+def test_ship_code_needs_a_whole_manufacturer_prefix():
+    assert ship_code("AEGS_Gladius_1001") == ("AEGS_Gladius", "1001")
+    assert ship_code("ANVL_Hornet_F7A_Mk2_2002") == ("ANVL_Hornet_F7A_Mk2", "2002")
+    assert ship_code("RSI_Aurora_MR_9") == ("RSI_Aurora_MR", "9")
+    assert ship_code("RSIX_Station_1") is None
+    assert ship_code("Stanton1_Lorville") is None
+    assert ship_code("AEGS") is None
+
+
+def test_registry_evicts_least_recently_used():
+    registry = EntityRegistry(capacity=3)
+    for geid, ship in (("1", "AEGS_Gladius"), ("2", "ANVL_Arrow"), ("3", "DRAK_Cutlass_Black")):
+        registry.note(geid, ship)
+    assert registry.ship("1") == "AEGS_Gladius"  # now the most recent
+    registry.note_name("MISC_Freelancer_4")
+    assert len(registry) == 3
+    assert registry.ship("2") == "N/A"
+    assert [registry.ship(g) for g in ("1", "3", "4")] == ["AEGS_Gladius", "DRAK_Cutlass_Black", "MISC_Freelancer"]
+
+
+def test_registry_stays_bounded_over_a_long_session():
+    parser = make_parser()
+    parser.entities = EntityRegistry(capacity=500)
+    lines = [
+        f"<2025-05-01T18:00:05.000Z> [Notice] <CEntityComponentInstancedInterior::OnEntityEnterZone> [InstancedInterior] OnEntityEnterZone - InstancedInterior -> Entity [ANVL_Arrow_{n}] [{n}] [Team_CoreGameplayFeatures]\n"
+        for n in range(20_000)
+    ]
+    parser.read_log_block("".join(lines), True)
+    assert len(parser.entities) == 500
+    assert parser.entities.ship("19999") == "ANVL_Arrow"
+    assert parser.entities.ship("0") == "N/A"
+
+
+def test_kills_and_deaths_carry_ships_seen_earlier():
+    parser = make_parser()
+    parser.read_log_block(RECORDED_LOG, True)
+    parser.api.sent.clear()
+    enemy = "200146295188"
+    parser.read_log_block(
+        SPAWN.format(ship="DRAK_Cutlass_Black_8008", geid=enemy)
+        + KILL.format(victim=HANDLE, victim_geid=GEID, zone="Stanton1_Lorville", killer="Enemy_Four", killer_geid=enemy)
+        + SPAWN.format(ship="MISC_Freelancer_9009", geid="200146295199")
+        + KILL.format(victim="Enemy_Five", victim_geid="200146295199", zone="OOC_Stanton", killer=HANDLE, killer_geid=GEID),
+        True,
+    )
+    (death_kind, death), (kill_kind, kill) = parser.api.sent
+    assert (death_kind, death["killers_ship"]) == ("death", "DRAK_Cutlass_Black")
+    assert (kill_kind, kill["victim_ship"], kill["zone"]) == ("kill", "MISC_Freelancer", "OOC_Stanton")
+
+
+def test_ship_is_not_attached_once_it_is_destroyed():
+    parser = make_parser()
+    enemy = "200146295188"
+    parser.read_log_block(
+        SPAWN.format(ship="DRAK_Cutlass_Black_8008", geid=enemy)
+        + DESTROYED.format(ship="DRAK_Cutlass_Black_8008", ship_id="8008")
+        + KILL.format(victim="Enemy_Four", victim_geid=enemy, zone="Stanton1_Lorville", killer=HANDLE, killer_geid=GEID),
+        True,
+    )
+    [(kind, kill)] = parser.api.sent
+    assert (kind, kill["victim_ship"], kill["zone"]) == ("kill", "N/A", "Stanton1_Lorville")
+
+
+def test_ship_is_not_attached_after_its_pilot_dies():
+    parser = make_parser()
+    enemy = "200146295188"
+    kill = KILL.format(victim="Enemy_Four", victim_geid=enemy, zone="Stanton1_Lorville", killer=HANDLE, killer_geid=GEID)
+    parser.read_log_block(SPAWN.format(ship="DRAK_Cutlass_Black_8008", geid=enemy) + kill + kill, True)
+    assert [k["victim_ship"] for _, k in parser.api.sent] == ["DRAK_Cutlass_Black", "N/A"]
@@ -0,0 +1,115 @@
+# test_event_logger.py
+import threading
+
+from event_logger import DEBUG, WARNING, EventLogger
+
+
+class FakeTextbox:
+    """Just enough of CTkTextbox: text kept as a list of lines, calls counted."""
+
+    def __init__(self):
+        self.lines = []
+        self.scheduled = []
+        self.inserts = 0
+
+    def after(self, ms, fn):
+        self.scheduled.append(fn)
+
+    def configure(self, **kwargs):
+        pass
+
+    def see(self, index):
+        pass
+
+    def insert(self, index, text):
+        self.inserts += 1
+        self.lines.extend(text.splitlines())
+
+    def delete(self, start, end):
+        assert start == "1.0"
+        del self.lines[: int(end.split(".")[0]) - 1]
+
+
+def test_messages_from_threads_are_batched_per_frame():
+    box = FakeTextbox()
+    logger = EventLogger(box, max_lines=500)
+    threads = [
+        threading.Thread(target=lambda n=n: [logger.info(f"t{n} m{i}") for i in range(100)])
+        for n in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # nothing touched the widget until the main loop ran a frame
+    assert box.lines == []
+    box.scheduled.pop()()
+    assert box.inserts == 1
+    assert len(box.lines) == 400
+    assert box.scheduled == [logger.pump]
+
+
+def test_textbox_and_queue_stay_bounded():
+    box = FakeTextbox()
+    logger = EventLogger(box, max_lines=200, level=DEBUG)
+    for frame in range(20):
+        for i in range(1000):
+            logger.debug(f"frame {frame} line {i}")
+        assert len(logger.pending) == 200
+        logger.pump()
+        assert len(box.lines) <= 200
+    assert box.lines[-1] == "[DEBUG] frame 19 line 999"
+    assert box.lines[0] == "[DEBUG] frame 19 line 800"
+
+
+def test_multiline_messages_count_towards_the_cap():
+    box = FakeTextbox()
+    logger = EventLogger(box, max_lines=10)
+    for i in range(4):
+        logger.log(f"a{i}\nb{i}\nc{i}")
+        logger.flush()
+    assert len(box.lines) == 10
+    assert box.lines[-1] == "c3"
+
+
+def test_level_threshold_skips_formatting():
+    class Loud:
+        def __str__(self):
+            raise AssertionError("formatted a suppressed message")
+
+    box = FakeTextbox()
+    logger = EventLogger(box, level=WARNING)
+    logger.debug("zone %s", Loud())
+    logger.info("zone %s", Loud())
+    logger.warning("ship %s lost", "AEGS_Gladius")
+    logger.flush()
+    assert box.lines == ["[WARNING] ship AEGS_Gladius lost"]
+
+
+def test_identical_errors_are_collapsed(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("event_logger.monotonic", lambda: now[0])
+    box = FakeTextbox()
+    logger = EventLogger(box, repeat_window=10)
+    for _ in range(50):
+        logger.error("parse_kill_line(): Error: %s", "list index out of range")
+    logger.error("something else")
+    now[0] += 11
+    logger.error("parse_kill_line(): Error: %s", "list index out of range")
+    logger.flush()
+    assert box.lines == [
+        "[ERROR] parse_kill_line(): Error: list index out of range",
+        "[ERROR] something else",
+        "[ERROR] parse_kill_line(): Error: list index out of range (repeated 49 more times)",
+    ]
+
+
+def test_rotating_file_sink(tmp_path):
+    log_file = tmp_path / "tracker.log"
+    logger = EventLogger(FakeTextbox(), log_file=log_file)
+    logger.info("Kill Tracking initiated.")
+    logger.debug("not written below the threshold")
+    logger.close()
+    text = log_file.read_text(encoding="utf-8")
+    assert "[INFO] Kill Tracking initiated." in text
+    assert "threshold" not in text
@@ -0,0 +1,60 @@
+# test_events.py
+import json
+
+import pytest
+
+from events import KillEvent
+from test_log_parser import HANDLE, RECORDED_LOG, make_parser
+
+LINES = RECORDED_LOG.splitlines(keepends=True)
+KILL_LINE, NPC_LINE, DEATH_LINE, _, SUICIDE_LINE = [l for l in LINES if "<Actor Death>" in l]
+
+
+def test_kill_payload_matches_the_old_result_dict():
+    parser = make_parser()
+    parser.game_mode = "SC_Default"
+    kill = parser.parse_kill_line(KILL_LINE, HANDLE)
+    assert kill.result == "killer"
+    assert json.loads(kill.to_json()) == {
+        "player": HANDLE,
+        "victim": "Enemy_One",
+        "time": "2025-05-01T18:00:06.000Z",
+        "zone": "N/A",
+        "weapon": "KLWE_LaserRepeater_S3_3003",
+        "damage_type": "Combat",
+        "rsi_profile": "https://robertsspaceindustries.com/citizens/Enemy_One",
+        "game_mode": "SC_Default",
+        "mode": "pu-kill",
+        "client_ver": "7.0",
+        "killers_ship": "N/A",
+        "victim_ship": "ANVL_Hornet_F7A_Mk2",
+        "anonymize_state": False,
+    }
+
+
+def test_results_and_shapes():
+    parser = make_parser()
+    parser.game_mode = "EA_Elimination"
+    death = parser.parse_kill_line(DEATH_LINE, HANDLE)
+    assert death.result == "killed"
+    assert death.to_dict()["rsi_profile"].endswith("/Enemy_Two")
+    assert death.to_dict()["mode"] == "ac-kill"
+    assert parser.parse_kill_line(SUICIDE_LINE, HANDLE).to_dict() == {
+        "player": HANDLE,
+        "time": "2025-05-01T18:00:15.000Z",
+        "zone": "Stanton1_Lorville",
+    }
+    assert parser.parse_kill_line(NPC_LINE, HANDLE).result == "exclusion"
+    assert parser.parse_kill_line("garbage", HANDLE).result == "error"
+
+
+def test_events_are_slotted_and_share_repeated_strings():
+    parser = make_parser()
+    first = parser.parse_kill_line(KILL_LINE, HANDLE)
+    second = parser.parse_kill_line(KILL_LINE.replace("18:00:06", "18:05:06"), HANDLE)
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.extra = 1
+    assert first.damage_type is second.damage_type
+    assert first.victim_ship is second.victim_ship
+    assert isinstance(first, KillEvent)
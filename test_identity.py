@@ -0,0 +1,41 @@
+# test_identity.py
+import identity
+from identity import find_identity
+from test_log_parser import GEID, HANDLE, RECORDED_LOG, make_parser
+
+LOGIN_LINE, CHARACTER_LINE = RECORDED_LOG.splitlines(keepends=True)[:2]
+NOISE = "<2025-05-01T18:00:00.000Z> [Notice] <CEntity::OnOwnerChanged> noise [Team_CoreTech]\n"
+
+
+def test_one_scan_finds_both_and_is_cached(tmp_path, monkeypatch):
+    log_path = tmp_path / "Game.log"
+    log_path.write_text(NOISE * 10 + LOGIN_LINE + CHARACTER_LINE + NOISE * 10000, encoding="utf-8")
+    scans = []
+    real_scan = identity._scan
+    monkeypatch.setattr(identity, "_scan", lambda *a: scans.append(a) or real_scan(*a))
+
+    assert find_identity(log_path) == (HANDLE, GEID)
+    assert find_identity(log_path) == (HANDLE, GEID)
+    assert len(scans) == 1
+
+
+def test_missing_geid_is_picked_up_later(tmp_path):
+    log_path = tmp_path / "Game.log"
+    log_path.write_text(NOISE + LOGIN_LINE, encoding="utf-8")
+    assert find_identity(log_path) == (HANDLE, None)
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(NOISE * 5 + CHARACTER_LINE)
+    assert find_identity(log_path) == (HANDLE, GEID)
+
+
+def test_live_tail_follows_a_relogin(tmp_path):
+    log_path = tmp_path / "Game.log"
+    log_path.write_text(LOGIN_LINE + CHARACTER_LINE, encoding="utf-8")
+    parser = make_parser()
+    parser.log_file_location = log_path
+    relogin = LOGIN_LINE.replace(HANDLE, "AltAccount") + CHARACTER_LINE.replace(GEID, "200000000001")
+    parser.read_log_block(relogin, True)
+    assert parser.rsi_handle["current"] == "AltAccount"
+    assert parser.player_geid["current"] == "200000000001"
+    # later lookups, e.g. the Activate button, see the new identity without a rescan
+    assert find_identity(log_path) == ("AltAccount", "200000000001")
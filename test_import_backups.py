@@ -0,0 +1,89 @@
+# test_import_backups.py
+import gzip
+
+import pytest
+
+pytest.importorskip("requests")
+
+from import_backups import IMPORT_OUTBOX_PATH, collect, main, upload
+from log_archive import log_paths
+from outbox import OUTBOX_PATH
+from stub_backend import StubBackend
+from test_log_parser import RECORDED_LOG
+
+
+def session(day: str) -> bytes:
+    return RECORDED_LOG.replace("2025-05-01", day).encode("utf-8")
+
+
+@pytest.fixture
+def sc_folder(tmp_path):
+    backups = tmp_path / "logbackups"
+    backups.mkdir()
+    (backups / "Game Build(1) 28 Apr 25.log").write_bytes(session("2025-04-28"))
+    with gzip.open(backups / "Game Build(2) 29 Apr 25.log.gz", "wb") as f:
+        f.write(session("2025-04-29"))
+    # the same session archived twice
+    with gzip.open(backups / "Game Build(2) copy.log.gz", "wb") as f:
+        f.write(session("2025-04-29"))
+    (tmp_path / "Game.log").write_bytes(session("2025-05-01"))
+    return tmp_path
+
+
+def test_merged_in_time_order_without_duplicates(sc_folder):
+    paths = log_paths([sc_folder])
+    assert len(paths) == 4 and paths[-1].endswith("Game.log")
+    events = collect(paths, workers=2)
+    assert [e.result for e in events] == ["killer", "killed", "killer", "suicide"] * 3
+    times = [e.time for e in events]
+    assert times == sorted(times)
+    assert times[0].startswith("2025-04-28") and times[-1].startswith("2025-05-01")
+    serial = collect(paths, workers=1)
+    assert [e.to_json() for e in serial] == [e.to_json() for e in events]
+
+
+def test_zstd_archives(sc_folder):
+    zstandard = pytest.importorskip("zstandard")
+    path = sc_folder / "logbackups" / "Game Build(3) 30 Apr 25.log.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(session("2025-04-30")))
+    events = collect([str(path)], workers=1)
+    assert [e.time[:10] for e in events] == ["2025-04-30"] * 4
+
+
+def test_importer_never_reads_the_live_game_log(sc_folder, capsys):
+    assert log_paths([sc_folder], include_current=False) == log_paths([sc_folder])[:-1]
+    assert log_paths([sc_folder / "Game.log"], include_current=False) == []
+    main([str(sc_folder), "--dry-run"])
+    out = capsys.readouterr().out
+    assert out.startswith("3 logs: 4 kills, 4 deaths")
+    assert "2025-05-01" not in out
+
+
+def test_upload_sends_each_imported_event_once(sc_folder, tmp_path):
+    events = collect(log_paths([sc_folder], include_current=False), workers=1)
+    with StubBackend() as backend:
+        urls = {"kill_url": backend.url("/reportKill"), "death_url": backend.url("/reportDeath")}
+        assert upload(events, "key", outbox_path=tmp_path / "import.db", **urls)
+
+    assert len(backend.acks) == len(events) == 8
+    assert len({headers["Idempotency-Key"] for _, _, _, headers in backend.requests}) == 8
+
+
+def test_rerun_after_an_outage_sends_each_event_once(sc_folder, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    events = collect(log_paths([sc_folder], include_current=False), workers=1)
+    offline = {"kill_url": "http://127.0.0.1:1/reportKill", "death_url": "http://127.0.0.1:1/reportDeath"}
+    monkeypatch.setattr("api_client.APIClient.report_error", lambda self, message: None)
+    monkeypatch.setattr("api_client.APIClient.flush", lambda self, timeout=10.0: False)
+    assert not upload(events, "key", **offline)
+    monkeypatch.undo()
+
+    with StubBackend() as backend:
+        urls = {"kill_url": backend.url("/reportKill"), "death_url": backend.url("/reportDeath")}
+        monkeypatch.chdir(tmp_path)
+        assert upload(events, "key", **urls)
+
+    # journaled apart from the tracker's outbox, and each event posted once
+    assert (tmp_path / IMPORT_OUTBOX_PATH).exists()
+    assert not (tmp_path / OUTBOX_PATH).exists()
+    assert len(backend.acks) == len(events) == 8
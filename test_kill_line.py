@@ -0,0 +1,155 @@
+# test_kill_line.py
+import random
+
+from events import EXCLUSION, PARSE_ERROR, RESET
+from kill_line import IGNORE_KILL_SUBSTRINGS, is_ignored
+from log_gen import LogGenerator
+from test_log_parser import GEID, HANDLE, RECORDED_LOG, make_parser
+
+
+def legacy_parse_kill_line(parser, line, curr_user):
+    """The original split-on-spaces parse_kill_line, nested result dicts and all."""
+    if any(substr.lower() in line.lower() for substr in IGNORE_KILL_SUBSTRINGS):
+        return {"result": "exclusion", "data": None}
+    try:
+        if not parser.check_exclusion_scenarios(line):
+            return {"result": "exclusion", "data": None}
+        parts = line.split(" ")
+        kill_time = parts[0].strip("<>")
+        killed = parts[5].strip("'")
+        killed_zone = parts[9].strip("'")
+        killer = parts[12].strip("'")
+        weapon = parts[15].strip("'")
+        damage = parts[21].strip("'")
+        victim_ship = "N/A"
+        data_zone = killed_zone
+        if any(killed_zone.startswith(s) for s in parser.global_ship_list):
+            victim_ship = killed_zone.rsplit("_", 1)[0]
+            data_zone = "N/A"
+        mode = "ac-kill" if parser.game_mode.startswith("EA_") else "pu-kill"
+        if killed == killer:
+            return {"result": "suicide", "data": {"player": curr_user, "time": kill_time, "zone": killed_zone}}
+        elif killed == curr_user:
+            return {
+                "result": "killed",
+                "data": {
+                    "killer": killer,
+                    "victim": curr_user,
+                    "time": kill_time,
+                    "zone": killed_zone,
+                    "weapon": weapon,
+                    "damage_type": damage,
+                    "rsi_profile": f"https://robertsspaceindustries.com/citizens/{killer}",
+                    "game_mode": parser.game_mode,
+                    "mode": mode,
+                    "killers_ship": "N/A",
+                    "victim_ship": victim_ship,
+                },
+            }
+        elif killer.lower() == "unknown":
+            return {"result": "reset", "data": {}}
+        killers_ship = "N/A" if parser.game_mode.startswith("EA_FPS") else parser.active_ship["current"]
+        return {
+            "result": "killer",
+            "data": {
+                "player": curr_user,
+                "victim": killed,
+                "time": kill_time,
+                "zone": data_zone,
+                "weapon": weapon,
+                "damage_type": damage,
+                "rsi_profile": f"https://robertsspaceindustries.com/citizens/{killed}",
+                "game_mode": parser.game_mode,
+                "mode": mode,
+                "client_ver": parser.local_version,
+                "killers_ship": killers_ship,
+                "victim_ship": victim_ship,
+                "anonymize_state": parser.anonymize_state,
+            },
+        }
+    except Exception:
+        return {"result": "error", "data": None}
+
+
+def outcome(event):
+    """An event in the legacy result-dict shape."""
+    if event is EXCLUSION or event is PARSE_ERROR:
+        return {"result": event.result, "data": None}
+    return {"result": event.result, "data": event.to_dict()}
+
+
+# field positions in a line split on spaces: victim, zone, killer, weapon, class, damage
+FIELDS = (5, 9, 12, 15, 17, 21)
+TOKEN_CHARS = "abcXYZ019_-."
+
+
+def random_token(rng) -> str:
+    roll = rng.random()
+    if roll < 0.2:
+        name = rng.choice(IGNORE_KILL_SUBSTRINGS)
+        name = "".join(c.upper() if rng.random() < 0.5 else c.lower() for c in name)
+        return f"{rng.choice(['', 'x_'])}{name}{rng.choice(['', '_123'])}"
+    if roll < 0.3:
+        return rng.choice([HANDLE, "unknown", "Unknown", "AEGS_Gladius_77", "Crash", "SelfDestruct"])
+    return "".join(rng.choice(TOKEN_CHARS) for _ in range(rng.randint(0, 12)))
+
+
+def mutate(line: str, rng) -> str:
+    parts = line.rstrip("\n").split(" ")
+    for index in rng.sample(FIELDS, rng.randint(1, 3)):
+        token = random_token(rng)
+        if index == 17:
+            parts[index] = f"{token}]"
+        else:
+            parts[index] = f"'{token}'"
+    if rng.random() < 0.1:
+        # cut at a token boundary, like a line torn by a crash; a cut right
+        # after the damage type is the one known difference, tested below
+        parts = parts[: rng.choice([n for n in range(1, len(parts) + 1) if n != 22])]
+    return " ".join(parts) + "\n"
+
+
+def kill_lines():
+    lines = [l for l in RECORDED_LOG.splitlines(keepends=True) if "CActor::Kill" in l]
+    for seed in range(5):
+        gen = LogGenerator(seed, mix={"player_kill": 3, "npc_kill": 3, "death": 2})
+        lines.extend(l for l in gen.lines(300) if "CActor::Kill" in l)
+    return lines
+
+
+def test_matches_legacy_parse_on_recorded_and_fuzzed_lines():
+    rng = random.Random(19)
+    parser = make_parser()
+    parser.active_ship["current"] = "AEGS_Gladius"
+    base = kill_lines()
+    lines = base + [mutate(rng.choice(base), rng) for _ in range(20_000)]
+    for mode in ("SC_Default", "EA_FreeFlight", "EA_FPSGunGame"):
+        parser.game_mode = mode
+        for line in lines:
+            assert outcome(parser.parse_kill_line(line, HANDLE)) == legacy_parse_kill_line(parser, line, HANDLE), line
+
+
+def test_damage_type_at_end_of_line():
+    # the split parse kept "Bullet'\n" here
+    parser = make_parser()
+    line = [l for l in RECORDED_LOG.splitlines() if "Enemy_Three" in l][0]
+    torn = line[: line.index(" from direction")] + "\n"
+    assert parser.parse_kill_line(torn, HANDLE).damage_type == "Bullet"
+
+
+def test_unified_ignore_set_covers_fauna():
+    parser = make_parser()
+    line = [l for l in RECORDED_LOG.splitlines() if "Enemy_One" in l][0]
+    for name in ("vlk_juvenile_sandworm_01", "Quasigrazer_Adult_2", "pu_human_enemy_gruntrifle"):
+        assert parser.parse_kill_line(line.replace("Enemy_One", name), HANDLE) is EXCLUSION
+    assert parser.parse_kill_line(line, HANDLE).result == "killer"
+
+
+def test_verdicts_are_cached_and_bounded():
+    is_ignored.cache_clear()
+    for _ in range(3):
+        assert is_ignored("PU_Human_Enemy_Pilot")
+        assert not is_ignored(GEID)
+    info = is_ignored.cache_info()
+    assert (info.hits, info.misses) == (4, 2)
+    assert info.maxsize is not None
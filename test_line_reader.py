@@ -0,0 +1,56 @@
+# test_line_reader.py
+import io
+import random
+
+from headless import EventSink, make_parser
+from line_reader import LineReader
+from log_gen import LogGenerator
+
+
+def read_all(data: bytes, read_size: int, max_line: int):
+    """Every line LineReader hands out, and the reader at the end."""
+    reader = LineReader(read_size, max_line)
+    raw = io.BytesIO(data)
+    lines = []
+    while True:
+        n, start, end = reader.read(raw)
+        if not n:
+            return lines, reader
+        lines.extend(bytes(reader.buffer[start:end]).splitlines(keepends=True))
+
+
+def test_lines_split_across_reads_come_out_whole():
+    data = "".join(LogGenerator(1).lines(500)).encode("utf-8") + b"partial"
+    lines, reader = read_all(data, read_size=97, max_line=4096)
+    assert b"".join(lines) + b"partial" == data
+    assert reader.pending == len(b"partial")
+    assert reader.lines_skipped == 0
+
+
+def test_long_lines_are_skipped_with_bounded_memory():
+    rng = random.Random(25)
+    read_size, max_line = 64, 256
+    lines = []
+    for _ in range(400):
+        length = rng.choice([rng.randrange(1, max_line), rng.randrange(max_line + read_size, 2000)])
+        lines.append(bytes(rng.choice(b"abcdef") for _ in range(length)) + b"\n")
+    data = b"".join(lines)
+
+    kept, reader = read_all(data, read_size, max_line)
+    assert kept == [line for line in lines if len(line) <= max_line]
+    assert reader.lines_skipped == len(lines) - len(kept)
+    assert len(reader.buffer) == read_size + max_line
+    assert reader.pending == 0
+
+
+def test_skipped_dump_does_not_hide_the_kill_after_it(tmp_path):
+    gen = LogGenerator(2, mix={"player_kill": 1})
+    lines = gen.header() + [LogGenerator(3).dump(gen.stamp())] + [gen.player_kill(gen.stamp())]
+    path = tmp_path / "Game.log"
+    path.write_text("".join(lines) + "incomplete", encoding="utf-8")
+    sink = EventSink()
+    parser = make_parser(sink)
+    parser.log_file_location = path
+    offset = parser.backfill_log(path, upload_kills=True, chunk_size=4096)
+    assert offset == path.stat().st_size - len("incomplete")
+    assert [event.result for event in sink.events] == ["killer"]
@@ -0,0 +1,31 @@
+# test_log_gen.py
+from log_gen import LogGenerator, generate, parse_mix, write_log
+from test_log_parser import make_parser
+
+
+def test_same_seed_same_log():
+    assert generate(2000, seed=5) == generate(2000, seed=5)
+    assert generate(2000, seed=5) != generate(2000, seed=6)
+
+
+def test_mix_limits_line_kinds():
+    text = generate(500, mix={"noise": 1, "zone": 1})
+    assert "OnEntityEnterZone" in text
+    assert "CActor::Kill" not in text and "<Jump Drive State Changed>" not in text
+    assert len(text.splitlines()) == 500
+
+
+def test_parser_uploads_what_the_generator_expects(tmp_path):
+    path = tmp_path / "Game.log"
+    expected = write_log(path, 20_000, seed=1, mix=parse_mix(["player_kill=40", "death=20"]))
+    assert expected["kill"] > 100 and expected["death"] > 50
+    parser = make_parser()
+    parser.backfill_log(path, upload_kills=True)
+    kinds = [kind for kind, _ in parser.api.sent]
+    assert kinds.count("kill") == expected["kill"]
+    assert kinds.count("death") == expected["death"]
+
+
+def test_timestamps_increase():
+    stamps = [line[1:24] for line in LogGenerator(seed=2).lines(1000)]
+    assert stamps == sorted(stamps)
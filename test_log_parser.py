@@ -0,0 +1,272 @@
+# test_log_parser.py
+from log_parser import LiveTail, LogParser
+
+HANDLE = "RRRthur"
+GEID = "200146295176"
+
+# A short recorded session: AC free flight, a respawn, kills both ways and PU noise.
+RECORDED_LOG = f"""<2025-05-01T18:00:00.000Z> [Notice] <Legacy login response> [CIG-net] User Login Success - Handle[{HANDLE}] - Time[1234]
+<2025-05-01T18:00:01.000Z> [Notice] <AccountLoginCharacterStatus_Character> Character: createdAt 1 - updatedAt 2 - geid {GEID} - accountId 1 - name {HANDLE} - state STATE_CURRENT [Team_GameServices]
+<2025-05-01T18:00:02.000Z> [Notice] <CSCLoadingPlatformManager::OnLoadingPlatformStateChanged> [Loading Platform] State Changed [Closed] -> [Opening] [Team_ArenaCommander]
+<2025-05-01T18:00:03.000Z> [Notice] <Context Establisher Done> establisher="CReplicationModel" runningTime=10.5 map="megamap" gamerules="EA_FreeFlight" sessionId="abc" [Team_Network]
+<2025-05-01T18:00:04.000Z> [Notice] <CPlayerShipRespawnManager::OnVehicleSpawned> Vehicle spawned: [AEGS_Gladius_1001] by player {GEID} [Team_ArenaCommander]
+<2025-05-01T18:00:05.000Z> [Notice] <CEntityComponentInstancedInterior::OnEntityEnterZone> [InstancedInterior] OnEntityEnterZone - InstancedInterior -> Entity [AEGS_Gladius_1001] [1001] [Team_CoreGameplayFeatures]
+<2025-05-01T18:00:06.000Z> [Notice] <Actor Death> CActor::Kill: 'Enemy_One' [200146295177] in zone 'ANVL_Hornet_F7A_Mk2_2002' killed by '{HANDLE}' [{GEID}] using 'KLWE_LaserRepeater_S3_3003' [Class unknown] with damage type 'Combat' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]
+<2025-05-01T18:00:07.000Z> [Notice] <Actor Death> CActor::Kill: 'PU_Human_Enemy_Pilot' [300] in zone 'OOC_Stanton' killed by '{HANDLE}' [{GEID}] using 'KLWE_LaserRepeater_S3_3003' [Class unknown] with damage type 'Combat' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]
+<2025-05-01T18:00:08.000Z> [Notice] <Jump Drive State Changed> Now Idle (adam: AEGS_Sabre_4004 in zone OOC_Stanton) [Team_VehicleFeatures]
+<2025-05-01T18:00:09.000Z> [Notice] <Actor Death> CActor::Kill: '{HANDLE}' [{GEID}] in zone 'AEGS_Sabre_4004' killed by 'Enemy_Two' [200146295178] using 'BEHR_BallisticGatling_S4_5005' [Class unknown] with damage type 'Bullet' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]
+<2025-05-01T18:00:10.000Z> [Notice] <Vehicle Destruction> CVehicle::OnAdvanceDamageState: Vehicle 'AEGS_Sabre_4004' [4004] in zone 'OOC_Stanton' [Team_VehicleFeatures]
+<2025-05-01T18:00:11.000Z> [Notice] <Context Establisher Done> establisher="CReplicationModel" runningTime=99.1 map="megamap" gamerules="SC_Default" sessionId="def" [Team_Network]
+<2025-05-01T18:00:12.000Z> [Notice] <CPlayerShipRespawnManager::OnVehicleSpawned> Vehicle spawned: [AEGS_Gladius_6006] by player {GEID} [Team_ArenaCommander]
+<2025-05-01T18:00:13.000Z> [Notice] <Actor Death> CActor::Kill: 'Enemy_Three' [200146295179] in zone 'Stanton1_Lorville' killed by '{HANDLE}' [{GEID}] using 'BEHR_P4AR_7007' [Class unknown] with damage type 'Bullet' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]
+<2025-05-01T18:00:14.000Z> [Notice] <[ActorState] Dead> [ACTOR STATE] Player '{HANDLE}' [{GEID}] <local client>: Entering control state dead [Team_ActorFeatures]
+<2025-05-01T18:00:15.000Z> [Notice] <Actor Death> CActor::Kill: '{HANDLE}' [{GEID}] in zone 'Stanton1_Lorville' killed by '{HANDLE}' [{GEID}] using 'unknown' [Class unknown] with damage type 'Suicide' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]
+"""
+
+
+class FakeLogger:
+    def __init__(self):
+        self.lines = []
+
+    def log(self, m, *args):
+        self.lines.append(m % args if args else m)
+
+    def debug(self, m, *args):
+        self.log(f"[DEBUG] {m}", *args)
+
+    def info(self, m, *args):
+        self.log(f"[INFO] {m}", *args)
+
+    def success(self, m, *args):
+        self.log(f"[SUCCESS] {m}", *args)
+
+    def warning(self, m, *args):
+        self.log(f"[WARNING] {m}", *args)
+
+    def error(self, m, *args):
+        self.log(f"[ERROR] {m}", *args)
+
+
+class FakeAPI:
+    def __init__(self):
+        self.api_key = {"value": "key"}
+        self.sent = []
+
+    def post_kill_event(self, event):
+        self.sent.append(("kill", event.to_dict()))
+
+    def post_death_event(self, event):
+        self.sent.append(("death", event.to_dict()))
+
+
+class FakeSounds:
+    def play_random_sound(self):
+        pass
+
+
+class FakeCM:
+    def __init__(self):
+        self.ships = []
+
+    def post_heartbeat_enter_ship_event(self, ship):
+        self.ships.append(ship)
+
+
+class DrainWatcher:
+    """Stops follow_log the first time it runs out of data."""
+
+    def __init__(self, parser):
+        self.parser = parser
+
+    def activity(self):
+        pass
+
+    def wait(self, timeout=None):
+        self.parser.monitoring["active"] = False
+
+    def close(self):
+        pass
+
+
+def make_parser():
+    parser = LogParser(
+        gui_module=FakeLogger(),
+        api_client_module=FakeAPI(),
+        sound_module=FakeSounds(),
+        cm_module=FakeCM(),
+        local_version="7.0",
+        monitoring={"active": True},
+        rsi_handle={"current": HANDLE},
+        player_geid={"current": GEID},
+        active_ship={"current": "N/A"},
+        anonymize_state=False,
+    )
+    parser.checkpoint_path = None
+    return parser
+
+
+def legacy_read_log_line(parser, line, upload_kills):
+    """The original chain of substring tests, kept as the reference behaviour."""
+    if "<Context Establisher Done>" in line:
+        parser.set_game_mode(line)
+    if "OnEntityEnterZone" in line:
+        parser.set_player_zone(line, use_jd=False)
+    if "<Jump Drive State Changed>" in line:
+        parser.set_player_zone(line, use_jd=True)
+    if (
+        "CPlayerShipRespawnManager::OnVehicleSpawned" in line
+        and parser.game_mode != "SC_Default"
+        and parser.player_geid["current"] in line
+    ):
+        parser.set_ac_ship(line)
+    if (
+        "<Vehicle Destruction>" in line
+        or "<local client>: Entering control state dead" in line
+    ) and parser.active_ship_id in line:
+        parser.destroy_player_zone()
+    if (
+        upload_kills
+        and parser.rsi_handle["current"] in line
+        and "CActor::Kill" in line
+    ):
+        parser.on_kill(line, upload_kills)
+
+
+def snapshot(parser):
+    return (
+        parser.game_mode,
+        parser.active_ship["current"],
+        parser.active_ship_id,
+        parser.api.sent,
+        parser.cm.ships,
+        parser.log.lines,
+    )
+
+
+def run_lines(read, upload_kills):
+    parser = make_parser()
+    for line in RECORDED_LOG.splitlines(keepends=True):
+        read(parser, line, upload_kills)
+    return snapshot(parser)
+
+
+def test_read_log_line_matches_legacy_chain():
+    for upload_kills in (False, True):
+        expected = run_lines(legacy_read_log_line, upload_kills)
+        actual = run_lines(LogParser.read_log_line, upload_kills)
+        assert actual == expected
+
+
+def test_read_log_block_matches_line_by_line():
+    for upload_kills in (False, True):
+        expected = run_lines(legacy_read_log_line, upload_kills)
+        parser = make_parser()
+        parser.read_log_block(RECORDED_LOG, upload_kills)
+        assert snapshot(parser) == expected
+
+
+def test_recorded_log_uploads():
+    parser = make_parser()
+    parser.read_log_block(RECORDED_LOG, True)
+    kinds = [kind for kind, _ in parser.api.sent]
+    assert kinds == ["kill", "death", "kill", "death"]
+    assert parser.api.sent[0][1]["killers_ship"] == "AEGS_Gladius"
+    assert parser.api.sent[0][1]["victim_ship"] == "ANVL_Hornet_F7A_Mk2"
+    assert parser.game_mode == "SC_Default"
+
+
+def test_backfill_log_streams_in_small_chunks(tmp_path):
+    expected = run_lines(legacy_read_log_line, False)
+    for newline in ("\n", "\r\n"):
+        log_path = tmp_path / "Game.log"
+        data = RECORDED_LOG.replace("\n", newline).encode("utf-8")
+        # leave a partial line at EOF; it belongs to the live tail, not the backfill
+        log_path.write_bytes(data + b"<2025-05-01T18:00:16.000Z> [Notice] <Context")
+        parser = make_parser()
+        offset = parser.backfill_log(log_path, chunk_size=97)
+        assert offset == len(data)
+        assert snapshot(parser) == expected
+
+
+def test_checkpoint_resumes_without_rereading(tmp_path):
+    lines = RECORDED_LOG.splitlines(keepends=True)
+    log_path = tmp_path / "Game.log"
+    log_path.write_text("".join(lines[:6]), encoding="utf-8")
+
+    first = make_parser()
+    first.log_file_location = log_path
+    first.checkpoint_path = tmp_path / "checkpoint.json"
+    with open(log_path, "rb") as sc_log:
+        first.load_log(sc_log)
+    assert (first.game_mode, first.active_ship["current"]) == ("EA_FreeFlight", "AEGS_Gladius")
+
+    # the game keeps logging while the tracker is closed
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.writelines(lines[6:9])
+
+    second = make_parser()
+    second.log_file_location = log_path
+    second.checkpoint_path = first.checkpoint_path
+    second.upload_missed_kills = True
+    # blocks are views into a reused buffer, so keep a copy of each
+    second.read_log_block = lambda text, upload_kills, size=None, first=0, read=second.read_log_block: (
+        read_blocks.append(bytes(text[first:size])) or read(text, upload_kills, size, first)
+    )
+    read_blocks = []
+    with open(log_path, "rb") as sc_log:
+        second.load_log(sc_log)
+        assert sc_log.tell() == log_path.stat().st_size
+    # only the three new lines were read, and the missed kill was sent
+    assert b"".join(read_blocks).decode("utf-8") == "".join(lines[6:9])
+    assert [kind for kind, _ in second.api.sent] == ["kill"]
+    # flown in the ship restored from the checkpoint
+    assert second.api.sent[0][1]["killers_ship"] == "AEGS_Gladius"
+
+
+def test_checkpoint_ignored_for_a_new_log(tmp_path):
+    log_path = tmp_path / "Game.log"
+    log_path.write_text(RECORDED_LOG, encoding="utf-8")
+    first = make_parser()
+    first.log_file_location = log_path
+    first.checkpoint_path = tmp_path / "checkpoint.json"
+    with open(log_path, "rb") as sc_log:
+        first.load_log(sc_log)
+
+    # a new session writes a different, equally long log
+    log_path.unlink()
+    log_path.write_text(RECORDED_LOG.replace("18:00", "19:00"), encoding="utf-8")
+    second = make_parser()
+    second.log_file_location = log_path
+    second.checkpoint_path = first.checkpoint_path
+    with open(log_path, "rb") as sc_log:
+        second.load_log(sc_log)
+    assert second.game_mode == "SC_Default"
+    assert second.api.sent == []
+
+
+def test_backfill_stopped_by_a_cleared_key_starts_the_tail_at_eof(tmp_path):
+    log_path = tmp_path / "Game.log"
+    log_path.write_text(RECORDED_LOG, encoding="utf-8")
+    parser = make_parser()
+    parser.log_file_location = log_path
+    parser.checkpoint_path = tmp_path / "checkpoint.json"
+    backfill_log = parser.backfill_log
+    parser.backfill_log = lambda path, start=0, upload_kills=False: backfill_log(
+        path, start, upload_kills, chunk_size=200
+    )
+    read_log_block = parser.read_log_block
+
+    def revoke_after_first_block(text, upload_kills, size=None, first=0):
+        read_log_block(text, upload_kills, size, first)
+        # e.g. the background re-check of a cached key found it revoked
+        parser.api.api_key["value"] = None
+
+    parser.read_log_block = revoke_after_first_block
+    with open(log_path, "rb") as sc_log:
+        parser.catch_up(sc_log)
+        assert sc_log.tell() == log_path.stat().st_size
+        parser.read_log_block = read_log_block
+        parser.api.api_key["value"] = "key"
+        assert not LiveTail(parser, sc_log).read()
+    assert not parser.checkpoint_path.exists()
+    assert parser.api.sent == []
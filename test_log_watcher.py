@@ -0,0 +1,116 @@
+# test_log_watcher.py
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from log_watcher import PollingWatcher, log_replaced, make_watcher
+from test_log_parser import HANDLE, RECORDED_LOG, make_parser
+
+KILL_LINE = RECORDED_LOG.splitlines(keepends=True)[6].encode("utf-8")
+
+
+def test_log_replaced_by_identity_not_size(tmp_path):
+    log_path = tmp_path / "Game.log"
+    log_path.write_bytes(b"old session\n")
+    with open(log_path, "rb") as handle:
+        handle.read()
+        assert not log_replaced(log_path, handle)
+        # the game starts a new log that is already bigger than the old one
+        new_path = tmp_path / "Game.log.new"
+        new_path.write_bytes(b"new session, longer than the old one\n")
+        os.replace(new_path, log_path)
+        assert log_replaced(log_path, handle)
+
+
+def test_log_replaced_on_truncation(tmp_path):
+    log_path = tmp_path / "Game.log"
+    log_path.write_bytes(b"old session\n")
+    with open(log_path, "rb") as handle:
+        handle.read()
+        with open(log_path, "wb"):
+            pass
+        assert log_replaced(log_path, handle)
+
+
+def test_polling_watcher_backs_off_and_resets(tmp_path):
+    watcher = PollingWatcher(tmp_path / "Game.log", min_interval=0.001, max_interval=0.004)
+    for _ in range(5):
+        watcher.wait()
+    assert watcher.interval == 0.004
+    watcher.activity()
+    assert watcher.interval == 0.001
+
+
+def follow_in_thread(parser, log_path, backend):
+    parser.log_file_location = log_path
+    sc_log = open(log_path, "rb")
+    sc_log.seek(0, 2)
+    watcher = make_watcher(log_path, backend)
+    thread = threading.Thread(target=parser.follow_log, args=(sc_log, watcher), daemon=True)
+    thread.start()
+    return thread, watcher
+
+
+def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "poll",
+        pytest.param(
+            "inotify",
+            marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only"),
+        ),
+    ],
+)
+def test_follow_log_handles_writes_and_replacement(tmp_path, backend):
+    log_path = tmp_path / "Game.log"
+    log_path.write_bytes(b"old session noise\n")
+    parser = make_parser()
+    thread, watcher = follow_in_thread(parser, log_path, backend)
+    try:
+        with open(log_path, "ab") as f:
+            # a partial line is held back until its newline arrives
+            f.write(KILL_LINE[:40])
+            f.flush()
+            time.sleep(0.2)
+            assert parser.api.sent == []
+            f.write(KILL_LINE[40:])
+        assert wait_for(lambda: len(parser.api.sent) == 1)
+
+        new_path = tmp_path / "Game.log.new"
+        new_path.write_bytes(b"x" * 4096 + b"\n" + KILL_LINE)
+        os.replace(new_path, log_path)
+        assert wait_for(lambda: len(parser.api.sent) == 2)
+        assert parser.api.sent[1][1]["player"] == HANDLE
+    finally:
+        parser.monitoring["active"] = False
+        thread.join(timeout=5)
+        watcher.close()
+
+
+def test_tail_thread_stops_and_restarts_with_the_game(tmp_path, monkeypatch):
+    monkeypatch.setattr("log_parser.sleep", lambda s: None)
+    log_path = tmp_path / "Game.log"
+    log_path.write_text(RECORDED_LOG, encoding="utf-8")
+    parser = make_parser()
+    parser.log_file_location = log_path
+    parser.watch_backend = "poll"
+
+    for _ in range(2):
+        parser.start_tail_log_thread()
+        assert wait_for(lambda: "[SUCCESS] Go Forth And Slaughter..." in parser.log.lines)
+        parser.stop_tail_log_thread(timeout=5)
+        assert not parser.tail_thread.is_alive()
+        assert parser.log.lines[-1] == "[INFO] Game log monitoring has stopped."
+        parser.log.lines.clear()
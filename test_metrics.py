@@ -0,0 +1,116 @@
+# test_metrics.py
+import json
+from datetime import datetime, timezone
+from urllib.request import urlopen
+
+from line_reader import LineReader
+from log_parser import LiveTail
+from metrics import Histogram, Metrics, age_ms, panel_text, serve
+from test_log_parser import RECORDED_LOG, DrainWatcher, make_parser
+
+
+def test_histogram_percentiles():
+    h = Histogram()
+    for ms in [3] * 90 + [40] * 9 + [7000]:
+        h.observe(ms)
+    assert h.percentile(0.5) == 5
+    assert h.percentile(0.9) == 5
+    assert h.percentile(0.99) == 50
+    assert h.percentile(1.0) == 7000
+    assert h.to_dict()["count"] == 100 and h.to_dict()["max_ms"] == 7000
+
+
+def test_parser_counts_lines_matches_and_errors():
+    parser = make_parser()
+    parser.metrics = Metrics()
+    broken = "<2025-05-01T18:00:16.000Z> [Notice] <Context Establisher Done> gamerules\n"
+    parser.read_log_block(RECORDED_LOG + broken, True)
+    counters = parser.metrics.snapshot()["counters"]
+    assert counters["match.kill"] == 5
+    assert counters["match.context_established"] == 3
+    assert counters["match.vehicle_spawned"] == 2
+    assert counters["parse_errors"] == 1
+
+
+def test_tail_counts_lines_bytes_and_lag(tmp_path):
+    path = tmp_path / "Game.log"
+    path.write_text(RECORDED_LOG, encoding="utf-8")
+    parser = make_parser()
+    parser.metrics = Metrics()
+    parser.log_file_location = path
+    parser.follow_log(open(path, "rb"), DrainWatcher(parser))
+    snapshot = parser.metrics.snapshot()
+    assert snapshot["counters"]["lines_read"] == len(RECORDED_LOG.splitlines())
+    assert snapshot["counters"]["bytes_read"] == path.stat().st_size
+    assert snapshot["gauges"]["tail_lag_bytes"] == 0
+
+
+def test_each_tail_reports_its_own_lag(tmp_path):
+    m = Metrics()
+    tails = {}
+    for channel in ("LIVE", "PTU"):
+        path = tmp_path / channel / "Game.log"
+        path.parent.mkdir()
+        path.write_text(RECORDED_LOG * 3, encoding="utf-8")
+        parser = make_parser()
+        parser.metrics = m
+        parser.checkpoint_path = None
+        parser.lag_gauge = f"tail_lag_bytes.{channel}"
+        tails[channel] = LiveTail(parser, open(path, "rb"))
+    # a small read leaves LIVE behind its log
+    tails["LIVE"].reader = LineReader(read_size=100)
+    assert tails["LIVE"].read()
+    # an idle channel checked in between leaves LIVE's lag alone
+    tails["PTU"].checkpoint()
+    assert m.gauges["tail_lag_bytes.LIVE"] > 0
+    assert m.gauges["tail_lag_bytes.PTU"] == 0
+    assert f"Lag: {m.gauges['tail_lag_bytes.LIVE']:,} B" in panel_text(m.snapshot())
+    for tail in tails.values():
+        tail.close()
+
+
+def test_backfill_counts_bytes(tmp_path):
+    path = tmp_path / "Game.log"
+    path.write_text(RECORDED_LOG, encoding="utf-8")
+    parser = make_parser()
+    parser.metrics = Metrics()
+    parser.backfill_log(path, chunk_size=100)
+    assert parser.metrics.counters["bytes_read"] == path.stat().st_size
+
+
+def test_age_ms():
+    now = datetime(2025, 5, 1, 18, 0, 7, 500000, tzinfo=timezone.utc)
+    assert age_ms("2025-05-01T18:00:06.000Z", now) == 1500
+
+
+def test_dump_and_endpoint(tmp_path):
+    m = Metrics()
+    m.incr("lines_read", 10)
+    m.observe("upload_latency_ms", 120)
+    m.dump(tmp_path / "metrics.json")
+    saved = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert saved["counters"] == {"lines_read": 10}
+    assert saved["histograms"]["upload_latency_ms"]["p50_ms"] == 120
+
+    server = serve(m, 0)
+    try:
+        with urlopen(f"http://127.0.0.1:{server.server_address[1]}/", timeout=5) as r:
+            assert json.load(r)["counters"] == {"lines_read": 10}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_panel_text_rate():
+    before = {"uptime_s": 1.0, "counters": {"lines_read": 100}, "gauges": {}, "histograms": {}}
+    after = {
+        "uptime_s": 3.0,
+        "counters": {"lines_read": 700, "match.kill": 2, "uploads_ok": 2},
+        "gauges": {"tail_lag_bytes": 512},
+        "histograms": {"upload_latency_ms": {"p50_ms": 200, "p99_ms": 500}},
+    }
+    text = panel_text(after, before)
+    assert "(300/s)" in text
+    assert "kill 2" in text
+    assert "Lag: 512 B" in text
+    assert "p50 200 / p99 500 ms" in text
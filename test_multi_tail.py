@@ -0,0 +1,104 @@
+# test_multi_tail.py
+import io
+import logging
+import os
+import sys
+import threading
+
+import pytest
+
+from headless import ConsoleLogger, EventSink, NullLog
+from log_gen import LogGenerator
+from multi_tail import MultiTail, TaggedLog
+from process_locator import find_game_logs
+from test_log_watcher import wait_for
+
+CHANNELS = {"LIVE": ("RRRthur", "200146295176"), "PTU": ("RRRtester", "200146295999")}
+
+
+class ListLog(NullLog):
+    def __init__(self):
+        self.lines = []
+
+    def success(self, m, *args):
+        self.lines.append(m % args if args else m)
+
+
+def install(tmp_path):
+    """StarCitizen/<channel>/Game.log for each channel, with a login header."""
+    gens = {}
+    for n, (channel, (handle, geid)) in enumerate(CHANNELS.items()):
+        folder = tmp_path / "StarCitizen" / channel
+        (folder / "Bin64").mkdir(parents=True)
+        gens[channel] = gen = LogGenerator(n, mix={"noise": 4, "player_kill": 1}, handle=handle, geid=geid)
+        (folder / "Game.log").write_text("".join(gen.header()))
+    return gens
+
+
+def test_find_game_logs_lists_every_installed_channel(tmp_path):
+    install(tmp_path)
+    root = tmp_path / "StarCitizen"
+    logs = find_game_logs(str(root / "PTU" / "Bin64" / "StarCitizen.exe"))
+    assert logs == [str(root / "PTU" / "Game.log"), str(root / "LIVE" / "Game.log")]
+
+
+def test_tagged_log_prefixes_messages():
+    log = ListLog()
+    TaggedLog(log, "PTU").success("Kill: %s", "Pilot_1")
+    assert log.lines == ["[PTU] Kill: Pilot_1"]
+
+
+def test_tagged_log_follows_the_logger_level():
+    out = io.StringIO()
+    tagged = TaggedLog(ConsoleLogger(logging.INFO, stream=out), "PTU")
+    tagged.debug("hidden %s", 1)
+    tagged.info("shown %s", 2)
+    assert out.getvalue().endswith("[INFO] [PTU] shown 2\n")
+    assert "hidden" not in out.getvalue()
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "poll",
+        pytest.param(
+            "inotify",
+            marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only"),
+        ),
+    ],
+)
+def test_one_thread_tails_every_log_with_its_own_identity(tmp_path, backend, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    gens = install(tmp_path)
+    sink = EventSink()
+    log = ListLog()
+    tails = MultiTail(sink, log, watch_backend=backend)
+    threads = threading.active_count()
+    paths = {channel: tmp_path / "StarCitizen" / channel / "Game.log" for channel in CHANNELS}
+    for path in paths.values():
+        tails.add(str(path))
+    assert threading.active_count() == threads + 1
+    assert wait_for(lambda: len(log.lines) == 4)
+    assert "[PTU] Kill Tracking initiated." in log.lines
+
+    for channel, path in paths.items():
+        with open(path, "a") as f:
+            f.writelines(gens[channel].lines(300))
+    expected = sum(gen.expected["kill"] for gen in gens.values())
+    assert expected > 0
+    assert wait_for(lambda: len(sink.events) == expected)
+    tails.stop(timeout=5)
+
+    players = {event.player for event in sink.events}
+    assert players == {handle for handle, _ in CHANNELS.values()}
+    # a checkpoint per log, so neither resumes from the other's offset
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("killtracker_checkpoint-")]) == 2
+
+    # added again once the game restarts, the tail resumes from its checkpoint
+    tails.add(str(paths["PTU"]))
+    assert wait_for(lambda: log.lines.count("[PTU] Kill Tracking initiated.") == 2)
+    with open(paths["PTU"], "a") as f:
+        f.writelines(gens["PTU"].lines(300))
+    expected = sum(gen.expected["kill"] for gen in gens.values())
+    assert wait_for(lambda: len(sink.events) == expected)
+    tails.stop(timeout=5)
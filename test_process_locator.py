@@ -0,0 +1,149 @@
+# test_process_locator.py
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+import psutil
+import pytest
+
+from process_locator import GameWatcher, ProcessLocator
+from test_log_watcher import wait_for
+
+
+class FakeProcess:
+    def __init__(self, name, exe):
+        self.info = {"name": name}
+        self.exe_path = exe
+        self.running = True
+        self.exe_calls = 0
+
+    def exe(self):
+        self.exe_calls += 1
+        return self.exe_path
+
+    def is_running(self):
+        return self.running
+
+    def status(self):
+        return psutil.STATUS_RUNNING
+
+
+class FakePsutil:
+    """Stands in for the psutil module: a process table and a count of walks over it."""
+
+    Error = psutil.Error
+    STATUS_ZOMBIE = psutil.STATUS_ZOMBIE
+
+    def __init__(self, procs):
+        self.procs = procs
+        self.walks = 0
+
+    def process_iter(self, attrs):
+        assert attrs == ["name"]
+        self.walks += 1
+        return iter(list(self.procs))
+
+
+def process_table():
+    noise = [FakeProcess(f"svchost{i}", f"C:/Windows/svchost{i}.exe") for i in range(200)]
+    launcher = FakeProcess("RSI Launcher.exe", "C:/RSI/RSI Launcher.exe")
+    game = FakeProcess("StarCitizen.exe", "C:/RSI/StarCitizen/LIVE/Bin64/StarCitizen.exe")
+    return noise, launcher, game
+
+
+def test_lookups_are_cached_and_exe_is_read_for_matches_only():
+    noise, launcher, game = process_table()
+    ps = FakePsutil(noise + [launcher, game])
+    locator = ProcessLocator(ps)
+
+    assert locator.find("RSI Launcher") == launcher.exe_path
+    assert locator.find("StarCitizen") == game.exe_path
+    for _ in range(10):
+        assert locator.find("RSI Launcher") == launcher.exe_path
+        assert locator.is_running("StarCitizen")
+    assert ps.walks == 2
+    assert launcher.exe_calls == game.exe_calls == 1
+    assert all(p.exe_calls == 0 for p in noise)
+
+
+def test_exit_and_restart_are_noticed():
+    noise, launcher, game = process_table()
+    ps = FakePsutil(noise + [launcher, game])
+    locator = ProcessLocator(ps)
+    locator.find("RSI Launcher")
+    locator.find("StarCitizen")
+
+    game.running = False
+    ps.procs.remove(game)
+    assert locator.find("StarCitizen") is None
+
+    relaunched = FakeProcess("StarCitizen.exe", game.exe_path)
+    ps.procs.append(relaunched)
+    walks = ps.walks
+    assert locator.find("StarCitizen") == game.exe_path
+    # the launcher was still alive, so one walk was enough
+    assert ps.walks == walks + 1
+
+
+def test_watcher_attaches_pauses_and_retries():
+    _, launcher, game = process_table()
+    ps = FakePsutil([launcher])
+    events = []
+    log_ready = [False]
+
+    def on_start(exe):
+        events.append(("start", exe))
+        return log_ready[0]
+
+    watcher = GameWatcher(on_start, lambda: events.append(("exit",)), process_locator=ProcessLocator(ps))
+    watcher.poll()
+    assert events == []
+
+    ps.procs.append(game)
+    watcher.poll()
+    # Game.log not there yet: tried again on the next check
+    log_ready[0] = True
+    watcher.poll()
+    watcher.poll()
+    assert events == [("start", game.exe_path)] * 2
+
+    game.running = False
+    ps.procs.remove(game)
+    watcher.poll()
+    watcher.poll()
+    assert events[-1] == ("exit",)
+    assert len(events) == 3
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="process names from /proc")
+def test_real_game_process_on_linux(tmp_path):
+    bin_dir = tmp_path / "StarCitizen" / "LIVE" / "Bin64"
+    bin_dir.mkdir(parents=True)
+    fake_game = bin_dir / "StarCitizen"
+    shutil.copy(os.path.realpath(sys.executable), fake_game)
+    events = []
+    started = threading.Event()
+    exited = threading.Event()
+
+    def on_start(exe):
+        events.append(exe)
+        started.set()
+
+    watcher = GameWatcher(
+        on_start, exited.set, process_locator=ProcessLocator(), interval=0.05
+    )
+    watcher.start()
+    try:
+        assert not wait_for(started.is_set, timeout=0.3)
+        game = subprocess.Popen([str(fake_game), "-c", "import time; time.sleep(30)"])
+        try:
+            assert started.wait(5)
+            assert events == [str(fake_game)]
+        finally:
+            game.kill()
+            game.wait()
+        assert exited.wait(5)
+    finally:
+        watcher.close()
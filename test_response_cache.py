@@ -0,0 +1,99 @@
+# test_response_cache.py
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("requests")
+
+from response_cache import (
+    KEY_EXPIRY_MARGIN,
+    ResponseCache,
+    cached_key_valid,
+    check_key,
+    conditional_get,
+    record_key_result,
+    revalidate_key,
+)
+from stub_backend import StubBackend
+from test_log_watcher import wait_for
+
+RELEASE = {"tag_name": "v7.1", "html_url": "https://example.invalid/releases/v7.1"}
+
+
+def test_update_check_is_cached_then_revalidated_with_etag(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    with StubBackend() as backend:
+        backend.get_body = RELEASE
+        backend.etag = '"abc123"'
+        url = backend.url("/releases/latest")
+
+        assert conditional_get(ResponseCache(cache_path), url) == (200, RELEASE)
+        # fresh copy, next launch: no request at all
+        assert conditional_get(ResponseCache(cache_path), url) == (200, RELEASE)
+        assert len(backend.requests) == 1
+
+        # stale copy: revalidated, 304 keeps the stored body
+        assert conditional_get(ResponseCache(cache_path), url, ttl=0) == (200, RELEASE)
+        assert len(backend.requests) == 2
+        assert backend.requests[1][3]["If-None-Match"] == '"abc123"'
+
+        backend.get_body = dict(RELEASE, tag_name="v7.2")
+        backend.etag = '"def456"'
+        assert conditional_get(ResponseCache(cache_path), url, ttl=0)[1]["tag_name"] == "v7.2"
+
+
+def test_key_trusted_until_margin_before_expiry(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.json")
+    now = datetime(2025, 5, 1, 18, 0)
+    expires_at = now + timedelta(hours=72)
+    assert not cached_key_valid(cache, "secret-key-123", expires_at, now)
+
+    record_key_result(cache, "secret-key-123", True)
+    assert cached_key_valid(cache, "secret-key-123", expires_at, now)
+    assert not cached_key_valid(cache, "secret-key-123", expires_at, expires_at - KEY_EXPIRY_MARGIN)
+    assert not cached_key_valid(cache, "other", expires_at, now)
+
+    record_key_result(cache, "secret-key-123", False)
+    assert not cached_key_valid(cache, "secret-key-123", expires_at, now)
+    assert "secret-key-123" not in (tmp_path / "cache.json").read_text()
+
+
+def test_revalidate_drops_a_revoked_key_only_while_active(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.json")
+    with StubBackend(valid_keys={"good"}) as backend:
+        url = backend.url("/keys/validate")
+        assert check_key("good", cache, url) is True
+        key_store = {"value": "good"}
+        assert not revalidate_key(key_store, "good", cache, url)
+        # replaced by a new key before the re-check of the old one came back
+        key_store["value"] = "new"
+        assert not revalidate_key(key_store, "revoked", cache, url)
+        assert key_store["value"] == "new"
+        key_store["value"] = "revoked"
+        assert revalidate_key(key_store, "revoked", cache, url)
+        assert key_store["value"] is None
+    # offline is not a verdict
+    assert check_key("good", cache, "http://127.0.0.1:1/keys/validate") is None
+
+
+def test_saved_key_is_rechecked_once_it_is_active(tmp_path, monkeypatch):
+    main = pytest.importorskip("main")
+    monkeypatch.setattr(main, "response_cache", ResponseCache(tmp_path / "cache.json"))
+    monkeypatch.setitem(main.api_key, "value", None)
+    expires_at = datetime.utcnow() + timedelta(hours=72)
+    with StubBackend() as backend:
+        monkeypatch.setattr(main, "VALIDATE_URL", backend.url("/keys/validate"))
+        # first activation has to ask the backend, later ones trust the cache
+        assert not cached_key_valid(main.response_cache, "key", expires_at)
+        assert main.validate_api_key("key")
+        assert cached_key_valid(main.response_cache, "key", expires_at)
+        assert len(backend.requests) == 1
+
+        # revoked since; the re-check starts once the key is applied, so it always lands
+        backend.get_status = 401
+        main.api_key["value"] = "key"
+        main.recheck_api_key("key")
+        assert wait_for(lambda: main.api_key["value"] is None)
+        assert len(backend.requests) == 2
+        assert not cached_key_valid(main.response_cache, "key", expires_at)
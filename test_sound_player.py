@@ -0,0 +1,80 @@
+# test_sound_player.py
+import time
+
+from sound_player import KillSoundPlayer, NullBackend
+from test_log_parser import RECORDED_LOG, FakeLogger, make_parser
+
+
+def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+def make_player(backend, **kwargs):
+    kwargs.setdefault("burst_window", 0.05)
+    kwargs.setdefault("cooldown", 0.05)
+    return KillSoundPlayer(FakeLogger(), backend=backend, **kwargs)
+
+
+def test_kill_does_not_wait_for_the_clip():
+    backend = NullBackend(duration=1.0)
+    player = make_player(backend)
+    start = time.perf_counter()
+    player.play_random_sound()
+    assert time.perf_counter() - start < 0.05
+    wait_for(lambda: backend.played)
+    with open("assets/kill.wav", "rb") as f:
+        assert backend.played[0] == f.read()
+    backend.done.set()
+    player.close()
+
+
+def test_burst_plays_one_cue_and_later_kills_fold_into_the_next():
+    backend = NullBackend(duration=0.3)
+    player = make_player(backend)
+    for _ in range(4):
+        player.play_random_sound()
+    wait_for(lambda: list(player.cues) == [4])
+    # while the first cue plays
+    player.play_random_sound()
+    player.play_random_sound()
+    wait_for(lambda: len(player.cues) == 2, timeout=5)
+    assert list(player.cues) == [4, 2]
+    assert backend.played[0] is backend.played[1]  # read from disk once
+    assert "[SUCCESS] Multi-kill x4!" in player.log.lines
+    player.close()
+
+
+def test_single_kills_apart_play_separately():
+    backend = NullBackend()
+    player = make_player(backend)
+    for n in range(1, 4):
+        player.play_random_sound()
+        wait_for(lambda: len(player.cues) == n)
+    assert list(player.cues) == [1, 1, 1]
+    assert not any("Multi-kill" in line for line in player.log.lines)
+    player.close()
+
+
+def test_missing_clip_is_reported_once(tmp_path):
+    backend = NullBackend()
+    player = make_player(backend, clip_path=tmp_path / "missing.wav")
+    player.play_random_sound()
+    wait_for(lambda: player.cues)
+    assert backend.played == []
+    assert sum("Kill sound unavailable" in line for line in player.log.lines) == 1
+    player.close()
+
+
+def test_parser_is_not_held_up_by_the_sound():
+    backend = NullBackend(duration=2.0)
+    parser = make_parser()
+    parser.sounds = make_player(backend)
+    start = time.perf_counter()
+    parser.read_log_block(RECORDED_LOG * 3, True)
+    assert time.perf_counter() - start < 0.5
+    backend.done.set()
+    parser.sounds.close()
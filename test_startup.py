@@ -0,0 +1,63 @@
+# test_startup.py
+import threading
+import time
+
+from startup import StartupPipeline
+from test_log_parser import FakeLogger
+from test_log_watcher import wait_for
+
+
+class FakeApp:
+    def __init__(self):
+        self.scheduled = []
+        self.idle = []
+
+    def after(self, ms, fn):
+        self.scheduled.append(fn)
+
+    def after_idle(self, fn):
+        self.idle.append(fn)
+
+
+def test_tasks_overlap_and_results_arrive_on_the_main_loop():
+    startup = StartupPipeline()
+    app = FakeApp()
+    logger = FakeLogger()
+    seen = []
+
+    def slow(value):
+        time.sleep(0.2)
+        return value
+
+    started = time.perf_counter()
+    for name in ("update check", "saved key", "game check"):
+        startup.then(startup.submit(name, slow, name), lambda r: seen.append((r, threading.current_thread())))
+    startup.attach(app, logger)
+    # window is drawn while the tasks are still running
+    app.idle.pop()()
+    assert seen == []
+    assert startup.timings["first paint"] < 0.1
+
+    deadline = time.monotonic() + 2
+    while len(seen) < 3 and time.monotonic() < deadline:
+        app.scheduled.pop()()
+        time.sleep(0.01)
+    assert time.perf_counter() - started < 0.5
+    assert sorted(r for r, _ in seen) == ["game check", "saved key", "update check"]
+    assert all(t is threading.main_thread() for _, t in seen)
+    assert all(0.2 <= startup.timings[r] < 0.5 for r, _ in seen)
+    startup.close()
+
+
+def test_failing_task_is_logged_not_raised():
+    startup = StartupPipeline()
+    app = FakeApp()
+    logger = FakeLogger()
+    startup.attach(app, logger)
+    future = startup.submit("update check", lambda: 1 / 0)
+    startup.then(future, lambda r: None)
+    assert wait_for(lambda: not startup.ready.empty())
+    app.scheduled.pop()()
+    assert logger.lines[-1] == "[ERROR] Startup: ZeroDivisionError division by zero"
+    assert app.scheduled == [startup.pump]
+    startup.close()
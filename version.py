@@ -0,0 +1,4 @@
+# Tracker version: compared with the latest release by the update check and
+# sent as client_ver in every kill payload, by the GUI, the daemon and the
+# backup importer alike.
+CLIENT_VERSION = "7.0"